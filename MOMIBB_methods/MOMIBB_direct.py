@@ -22,7 +22,7 @@ from plot_enclosure import *
 from plot_nondom import *
 from update_lubs_nodefs import *
 from update_nondom import *
-from width_computation import *
+from width_tracker import *
 
 def MOMIBB_direct(call_model, parameter, options, zu=[], zl=[]):
     """
@@ -94,11 +94,13 @@ def MOMIBB_direct(call_model, parameter, options, zu=[], zl=[]):
     # initialize set of local upper bounds
     lubs = [zu]
     
-    # compute initial width
-    width, worst_llb, worst_lub = compute_width(
-        A,
-        lubs,
-        dir_vec)
+    # compute initial width, the ideal points are tracked with box keys
+    box_keys = [0]
+    next_box_key = 1
+    width_tracker = WidthTracker(dir_vec)
+    width_tracker.add_llbs(box_keys, A)
+    width_tracker.sync_lubs(lubs)
+    width, worst_llb, worst_lub = width_tracker.width()
     
     # initialize time and iteration count
     it = 0
@@ -125,6 +127,7 @@ def MOMIBB_direct(call_model, parameter, options, zu=[], zl=[]):
         
         # extract and catch box to branch on from active box list
         worst_box = box_list.pop(worst_box_idx)
+        width_tracker.remove_llbs([box_keys.pop(worst_box_idx)])
         
         # branching rule
         new_box1, new_box2 = branch_box(worst_box[0])
@@ -154,6 +157,9 @@ def MOMIBB_direct(call_model, parameter, options, zu=[], zl=[]):
         # process new_box1
         if keep:
             box_list.append([new_box1, ideal_point1])
+            box_keys.append(next_box_key)
+            width_tracker.add_llbs([next_box_key], [ideal_point1])
+            next_box_key += 1
             
             y = compute_feasible_point(call_model,
                                m,
@@ -193,6 +199,9 @@ def MOMIBB_direct(call_model, parameter, options, zu=[], zl=[]):
         # process new_box2        
         if keep:
             box_list.append([new_box2, ideal_point2])
+            box_keys.append(next_box_key)
+            width_tracker.add_llbs([next_box_key], [ideal_point2])
+            next_box_key += 1
             
             y = compute_feasible_point(call_model,
                                m,
@@ -207,14 +216,9 @@ def MOMIBB_direct(call_model, parameter, options, zu=[], zl=[]):
             if check == 1:
                 lubs = update_lubs(lubs, y)
         
-        # catch active ideal points
-        A = [ideal_point for info, ideal_point in box_list]
-        
         # compute width
-        width, worst_llb, worst_lub = compute_width(
-            A,
-            lubs,
-            dir_vec)
+        width_tracker.sync_lubs(lubs)
+        width, worst_llb, worst_lub = width_tracker.width()
         
         # update iteration count and time
         it += 1
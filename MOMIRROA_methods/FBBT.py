@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Nov  3 15:12:08 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.contrib.fbbt.fbbt import fbbt
+from pyomo.common.errors import InfeasibleConstraintException
+
+import numpy as np
+import time
+
+from relaxation_statistics import *
+from rounding_routines import *
+from update_bounds import *
+
+def FBBT(call_model, u, info):
+    """
+    routine for feasibility-based bound tightening w.r.t. the objective
+    constraints given by 'u', i.e., the current variable bounds are
+    propagated through the constraints of the original problem and the
+    objective cut-offs by interval arithmetic
+
+    Parameters
+    ----------
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    u : ndarray
+        representing the image space vector determining the search zone.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation.
+
+    Returns
+    -------
+    info : dict
+        containing all information for setting up the tightened piecewise
+        linear relaxation.
+    tightened : list
+        containing the variable names with suffix '_lower'/'_upper' of all
+        tightened bounds.
+
+    """
+
+    start_time = time.time()
+
+    model = call_model(0)
+
+    # set current variable bounds
+    vars = {}
+    for v in model.component_data_objects(Var):
+        if v.name in info['bounds'].keys():
+            v.setlb(info['bounds'][v.name][0])
+            v.setub(info['bounds'][v.name][1])
+            vars[v.name] = v
+
+    # introduce upper bounds on objectives
+    for i in np.arange(0,len(u)):
+        for o in model.component_objects(Objective):
+            if 'objective'+str(i) in o.name:
+                model.add_component('upper_bound_on_'+str(i)+'-th_objective',
+                                    Constraint(expr = o.expr - u[i] <= 0))
+                o.deactivate()
+
+    try:
+        fbbt(model)
+    except InfeasibleConstraintException:
+        # the search zone is empty, which is detected by the relaxation
+        print('FBBT found empty search zone -- ignore it')
+        count_statistic('time FBBT', time.time() - start_time)
+        return info, []
+
+    # round and update bounds
+    tightened = []
+    for name, v in vars.items():
+        for ind, new_bound in [('lower', v.lb), ('upper', v.ub)]:
+            if new_bound is None:
+                continue
+
+            if ind == 'lower':
+                new_bound = rounding_lower(new_bound, 4)
+            else:
+                new_bound = rounding_upper(new_bound, 4)
+
+            old_bounds = list(info['bounds'][name][:2])
+            info = update_bounds(new_bound, name, ind, info)
+
+            if info['bounds'][name][:2] != old_bounds:
+                tightened.append(name+'_'+ind)
+
+    count_statistic('FBBT tightened bounds', len(tightened))
+    count_statistic('time FBBT', time.time() - start_time)
+
+    return info, tightened
@@ -10,26 +10,41 @@ from pyomo.environ import *
 
 import copy as cp
 import numpy as np
+import os
 import time
 
 
+from bound_store import *
+from box_encoding import *
+from box_info_cache import *
+from box_info_pool import *
+from checkpoint import *
+from compute_least_square_weight import *
 from compute_weight_hyperplane import *
 from direct_image_box import *
 from direct_search_routine import *
+from eligible_search_zones import *
+from error_bound_tiers import *
+from error_subproblems import *
 from initialize_local_bound_sets import *
 from initialize_relaxation_info import *
+from OBBT_pool import *
+from parallel_search_routine import *
+from persistent_relaxation_solver import *
 from plot_enclosure import *
 from plot_nondom import *
 from plot_preimage_information import *
 from plot_problem_counts import *
 from plot_search_zone_counts import *
 from plot_solution_times import *
+from relax_model_linear import *
+from relaxation_statistics import *
 from relaxed_image_box import *
-from shortest_edge import *
+from shared_partitions import *
 from twostage_search_routine import *
-from width_computation import *
+from width_tracker import *
 
-def MOMIRROA(call_model, parameter, options):
+def MOMIRROA(call_model, parameter, options, resume_from=None):
     """
     routine for computing an enclosure of the nondominated set of a MOMINLP
     foundational pseudo code can be found in
@@ -49,6 +64,11 @@ def MOMIRROA(call_model, parameter, options):
         containing all algorithm parameters.
     options : structure
         containing all optional settings for the algortihm.
+    resume_from : str, optional
+        representing a checkpoint written by a former run with the same
+        problem and options, which is continued with its iteration count,
+        enclosure and elapsed time. The default is None, i.e., a new run is
+        started.
 
     Returns
     -------
@@ -115,90 +135,230 @@ def MOMIRROA(call_model, parameter, options):
     except:
         show_plots = False
 
-    #%%%
-    # initialize the information transmission dictionary
+    # check if search zones should be processed in parallel
+    try:
+        parallel_search_zones = options.parallel_search
+    except:
+        parallel_search_zones = False
 
-    # set up enclosure information dict
-    encl_dict = {}
-    encl_dict['factor_delta'] = factor_delta ###NEW!!!
+    try:
+        workers = options.workers
+    except:
+        workers = os.cpu_count()
 
-    if not solve_direct:
-        # initialize initial relaxation information
-        model = call_model(0)
-        if options.McCormick:
-            info = initialize_relaxation_info(model, options.McCormick)
-        else:
-            info = initialize_relaxation_info(model)
+    # catch number of boxes whose information is cached across search zones
+    try:
+        box_info_cache.configure(options.box_info_cache_size)
+    except:
+        box_info_cache.configure(10000)
 
-    # determine if direct or two stage approach is chosen
-    if tight_image_box:
+    # the cached boxes and persistent relaxations belong to the functions of a
+    # former problem
+    box_info_cache.clear()
+    relaxation_cache.clear()
 
-        # check if gap tolerance should be adapted
-        try:
-            gap_tolerance = options.gap_tolerance
-        except:
-            gap_tolerance = False
+    # catch number of worker processes and time budget per error subproblem
+    # for computing the information of new boxes
+    try:
+        box_info_workers = options.box_info_workers
+    except:
+        box_info_workers = 1
 
-        # check the direct solver
-        try:
-            direct_solver = options.direct_solver
-        except:
-            direct_solver = 'scip'
+    try:
+        box_info_timelimit = options.box_info_timelimit
+    except:
+        box_info_timelimit = None
 
-        # compute image box with directly solving the original problem
-        encl_dict['zl'], encl_dict['zu'] = direct_image_box(
-            call_model,
-            m,
-            gap_tolerance,
-            direct_solver,
-            timeout)
+    box_info_pool.configure(box_info_workers, box_info_timelimit)
+
+    # catch number of worker processes tightening the bounds of an OBBT sweep
+    try:
+        OBBT_workers = options.OBBT_workers
+    except:
+        OBBT_workers = 1
+
+    OBBT_pool.configure(OBBT_workers)
+
+    # catch number of search zones whose tightened bounds are passed on to
+    # nested search zones
+    try:
+        bound_store.configure(options.bound_store_size)
+    except AttributeError:
+        bound_store.configure(0)
+
+    # catch how the estimation errors of a box are bounded, 'tiered' tries
+    # closed form and interval bounds before solving the subproblem globally
+    try:
+        error_bounds = options.error_bounds
+    except:
+        error_bounds = 'scip'
+
+    try:
+        error_bound_tolerance = options.error_bound_tolerance
+    except:
+        error_bound_tolerance = 1e-6
+
+    error_bound_tiers.configure(error_bounds == 'tiered', error_bound_tolerance)
+
+    # catch the points the least square weights of the boxes are fitted to
+    try:
+        least_square_strategy = options.least_square_sampling
+    except:
+        least_square_strategy = 'auto'
+
+    try:
+        least_square_samples = options.least_square_samples
+    except:
+        least_square_samples = 64
+
+    least_square_sampling.configure(least_square_strategy, least_square_samples)
+
+    # the small models of the error subproblems are built for this problem
+    error_subproblems.clear()
+
+    # check if checkpoints should be written and how often
+    try:
+        checkpoint_path = options.checkpoint_path
+    except:
+        checkpoint_path = None
+
+    try:
+        checkpoint_interval = options.checkpoint_interval
+    except:
+        checkpoint_interval = 0
+
+    # catch the formulation of the relaxations
+    try:
+        relaxation_formulation.configure(options.relaxation_formulation)
+    except AttributeError:
+        relaxation_formulation.configure('product')
+
+    # catch from which number of boxes the box selection is encoded
+    # logarithmically
+    try:
+        box_encoding.configure(options.log_encoding_threshold)
+    except AttributeError:
+        box_encoding.configure(None)
+
+    # catch if functions over the same variables share their partitions
+    try:
+        partition_sharing.configure(options.shared_partitions)
+    except AttributeError:
+        partition_sharing.configure(False)
+
+    try:
+        if relaxation_formulation.linear() and options.incremental_relaxation:
+            print('incremental relaxations require the product formulation -- ignore them')
+            options.incremental_relaxation = False
+    except AttributeError:
+        None
+
+    if parallel_search_zones and solve_direct:
+        print('parallel search zone processing requires relaxations -- ignore it')
+        parallel_search_zones = False
+
+    if resume_from is not None:
+        # continue a former run from its checkpoint
+        encl_dict, it, elapsed = read_checkpoint(resume_from)
+        encl_dict['factor_delta'] = factor_delta
+        print('resume from checkpoint', resume_from, 'at iteration #', it)
 
     else:
-        # compute image box using the relaxed model
-        encl_dict['zl'], encl_dict['zu'] = relaxed_image_box(
-            call_model,
-            m,
-            info,
-            options,
-            timeout)
-
-    if not solve_direct:
-        # initialize relaxation dict
-        encl_dict['lub_relaxation_information'] = {}
-        encl_dict['lub_relaxation_information'][str(encl_dict['zu'])] = info
-
-    # determine directon for width measure
-    if dir_vec_option == 'relative':
-        encl_dict['dir_vec'] = encl_dict['zu'] - encl_dict['zl']
-    else:
-        encl_dict['dir_vec'] = np.ones(m)
+        #%%%
+        # initialize the information transmission dictionary
+
+        # set up enclosure information dict
+        encl_dict = {}
+        encl_dict['factor_delta'] = factor_delta ###NEW!!!
+
+        if not solve_direct:
+            # initialize initial relaxation information
+            model = call_model(0)
+            if options.McCormick:
+                info = initialize_relaxation_info(model, options.McCormick)
+            else:
+                info = initialize_relaxation_info(model)
+
+        # determine if direct or two stage approach is chosen
+        if tight_image_box:
+
+            # check if gap tolerance should be adapted
+            try:
+                gap_tolerance = options.gap_tolerance
+            except:
+                gap_tolerance = False
+
+            # check the direct solver
+            try:
+                direct_solver = options.direct_solver
+            except:
+                direct_solver = 'scip'
+
+            # compute image box with directly solving the original problem
+            encl_dict['zl'], encl_dict['zu'] = direct_image_box(
+                call_model,
+                m,
+                gap_tolerance,
+                direct_solver,
+                timeout)
+
+        else:
+            # compute image box using the relaxed model
+            encl_dict['zl'], encl_dict['zu'] = relaxed_image_box(
+                call_model,
+                m,
+                info,
+                options,
+                timeout)
+
+        if not solve_direct:
+            # initialize relaxation dict
+            encl_dict['lub_relaxation_information'] = {}
+
+        # determine directon for width measure
+        if dir_vec_option == 'relative':
+            encl_dict['dir_vec'] = encl_dict['zu'] - encl_dict['zl']
+        else:
+            encl_dict['dir_vec'] = np.ones(m)
+
+        # initialize local bound sets
+        encl_dict['llbs'], encl_dict['lubs'] = init_local_bound_sets(encl_dict)
+
+        if not solve_direct:
+            # assign initial relaxation information to the initial lub
+            encl_dict['lub_relaxation_information'][
+                encl_dict['lubs'].id_of(encl_dict['zu'])] = info
 
-    # initialize local bound sets
-    encl_dict['llbs'], encl_dict['Ldefpois'], encl_dict['lubs'], encl_dict['Udefpois']\
-        = init_locbounds_defpois(encl_dict)
+        # initialize set of potentially nondominated points
+        encl_dict['N'] = []
 
-    # initialize set of potentially nondominated points
-    encl_dict['N'] = []
+        # initialize set of utopian points
+        encl_dict['U'] = []
 
-    # initialize set of utopian points
-    encl_dict['U'] = []
+        # set up iteration count
+        it = 0
+        elapsed = 0
 
-    # compute initial width
-    width, worst_llb, worst_lub = compute_width(
-        encl_dict['llbs'],
-        encl_dict['lubs'],
-        encl_dict['dir_vec'])
+        # set up analysis dict
+        encl_dict['analysis'] = {}
 
-    # set up iteration count
-    it = 0
-    total_time = 0
-    start_time = time.time()
+    # compute initial width, afterwards only changed bounds are passed
+    width_tracker = WidthTracker(encl_dict['dir_vec'])
+    width_tracker.sync(encl_dict['llbs'], encl_dict['lubs'])
+    width, worst_llb, worst_lub = width_tracker.width()
+
+    # the time of a resumed run counts from the start of the former run
+    total_time = elapsed
+    start_time = time.time() - elapsed
+    last_checkpoint = time.time()
 
-    # set up analysis dict
-    encl_dict['analysis'] = {}
     encl_dict['start_time'] = start_time
     encl_dict['timeout'] = timeout
 
+    # start worker processes for parallel search zone processing
+    if parallel_search_zones:
+        executor = start_search_zone_pool(workers)
+
     #%%%
     # start the algorithm
 
@@ -208,8 +368,7 @@ def MOMIRROA(call_model, parameter, options):
         print('\niteration # ', it, ' | current width:', round(width,3))
 
         # save current lubs assignment for loop
-        old_lubs = cp.deepcopy(encl_dict['lubs'])
-        old_Udefpois = cp.deepcopy(encl_dict['Udefpois'])
+        old_lubs = encl_dict['lubs'].copy()
 
         # check if relaxation to image space information transmission is needed
         if not solve_direct:
@@ -221,81 +380,132 @@ def MOMIRROA(call_model, parameter, options):
         encl_dict['analysis'][str(it)]['problemcounter'] = 0
         encl_dict['analysis'][str(it)]['# of search zones closed'] = 0
         encl_dict['analysis'][str(it)]['# of search zones'] = 0
+        encl_dict['analysis'][str(it)]['checkpoint_time'] = 0
 
         if not solve_direct:
             encl_dict['analysis'][str(it)]['relaxedproblemcounter'] = 0
             encl_dict['analysis'][str(it)]['relaxed_solution_time'] = 0
+            encl_dict['analysis'][str(it)]['relaxed_build_time'] = 0
             encl_dict['analysis'][str(it)]['preimageboxcounter'] = 0
             encl_dict['analysis'][str(it)]['maxpreimageboxes'] = 0
             encl_dict['analysis'][str(it)]['time bound tightening'] = 0
             encl_dict['analysis'][str(it)]['# of OBBT MILPs'] = 0
             encl_dict['analysis'][str(it)]['# of enforced feasibility check'] = 0
             encl_dict['analysis'][str(it)]['# of considered feasible'] = 0
-
-        # start the loop through search zones
-        for lub in old_lubs:
-
-            # check if lub search zone has to be improved
-            improved = True
-            for llb in encl_dict['llbs']:
-                if (llb < lub).all():
-                    short_edge, index = shortest_edge(
-                        llb,
-                        lub,
-                        encl_dict['dir_vec'])
-                    if tol < short_edge:
-                        improved = False
-                        break
-
-            if not improved:
-
-                # count search zone visit
-                encl_dict['analysis'][str(it)]['# of search zones'] += 1
-
-                # check if solution in search zone exists
-                alpha = compute_weight_hyperplane(lub, old_Udefpois)
-                print('\nsearch zone determined by:', lub)
-
-                if solve_direct:
-                    # direct search routine without relaxations is applied
-                    encl_dict = direct_search(
-                        call_model,
-                        lub - factor_delta * encl_dict['dir_vec'],
-                        encl_dict,
-                        alpha,
-                        options,
-                        it,
-                        timeout)
-
-                else:
-                    # relaxation based search routine is applied
-                    lub_relaxation = old_lub_rel_info[str(lub)]
-
-                    encl_dict = twostage_search(
-                        call_model,
-                        lub,
-                        encl_dict,
-                        alpha,
-                        lub_relaxation,
-                        options,
-                        it)
-
-            # check time limit
-            mid_time = time.time()
-            total_time = mid_time - start_time
+            encl_dict['analysis'][str(it)]['box info cache hits'] = 0
+            encl_dict['analysis'][str(it)]['box info cache misses'] = 0
+            snapshot = statistics_snapshot()
+
+        # process all search zones of the iteration at once
+        if parallel_search_zones:
+            zones, zone_widths = eligible_search_zones(encl_dict['llbs'],
+                                                       old_lubs,
+                                                       encl_dict['dir_vec'],
+                                                       tol)
+
+            encl_dict['analysis'][str(it)]['# of search zones'] += len(zones)
+
+            encl_dict = parallel_search(call_model,
+                                        zones,
+                                        encl_dict,
+                                        old_lubs,
+                                        old_lub_rel_info,
+                                        options,
+                                        it,
+                                        executor)
+
+            total_time = time.time() - start_time
             if total_time > timeout:
                 print('timeout reached')
-                break
+
+        else:
+            # determine the search zones to be improved at once
+            zones, zone_widths = eligible_search_zones(encl_dict['llbs'],
+                                                       old_lubs,
+                                                       encl_dict['dir_vec'],
+                                                       tol)
+            zones = set(zones)
+            zones_llbs = encl_dict['llbs'].bounds
+
+            # start the loop through search zones
+            for lub_id, lub in old_lubs.items():
+
+                # check if lub search zone has to be improved, once the llbs
+                # changed the search zone is checked again
+                if np.array_equal(encl_dict['llbs'].bounds, zones_llbs):
+                    improved = lub_id not in zones
+                else:
+                    improved = len(eligible_search_zones(encl_dict['llbs'],
+                                                         old_lubs,
+                                                         encl_dict['dir_vec'],
+                                                         tol,
+                                                         [lub_id])[0]) == 0
+
+                if not improved:
+
+                    # count search zone visit
+                    encl_dict['analysis'][str(it)]['# of search zones'] += 1
+
+                    # check if solution in search zone exists
+                    alpha = compute_weight_hyperplane(lub_id, old_lubs)
+                    print('\nsearch zone determined by:', lub)
+
+                    if solve_direct:
+                        # direct search routine without relaxations is applied
+                        encl_dict = direct_search(
+                            call_model,
+                            lub - factor_delta * encl_dict['dir_vec'],
+                            encl_dict,
+                            alpha,
+                            options,
+                            it,
+                            timeout)
+
+                    else:
+                        # relaxation based search routine is applied
+                        lub_relaxation = old_lub_rel_info[lub_id]
+
+                        encl_dict = twostage_search(
+                            call_model,
+                            lub,
+                            encl_dict,
+                            alpha,
+                            lub_relaxation,
+                            options,
+                            it)
+
+                # check time limit
+                mid_time = time.time()
+                total_time = mid_time - start_time
+                if total_time > timeout:
+                    print('timeout reached')
+                    break
+
+        # collect counters of the relaxation set up
+        if not solve_direct:
+            add_statistics_difference(encl_dict['analysis'][str(it)], snapshot)
 
         # compute new width
-        width, worst_llb, worst_lub = compute_width(
-            encl_dict['llbs'],
-            encl_dict['lubs'],
-            encl_dict['dir_vec'])
+        width_tracker.sync(encl_dict['llbs'], encl_dict['lubs'])
+        width, worst_llb, worst_lub = width_tracker.width()
 
         # increase iteration count
         it += 1
 
+        # write checkpoint, its own writing time is only part of the analysis
+        # of the running process
+        if checkpoint_path is not None\
+            and time.time() - last_checkpoint >= checkpoint_interval:
+            checkpoint_time = time.time()
+            write_checkpoint(checkpoint_path, encl_dict, it, time.time() - start_time)
+            last_checkpoint = time.time()
+            encl_dict['analysis'][str(it-1)]['checkpoint_time'] = last_checkpoint - checkpoint_time
+
+    if parallel_search_zones:
+        executor.shutdown()
+    box_info_pool.shutdown()
+    OBBT_pool.shutdown()
+
     end_time = time.time()
     total_time = end_time - start_time
     encl_dict['total_time'] = total_time
@@ -312,6 +522,7 @@ def MOMIRROA(call_model, parameter, options):
             print('AVG # of preimage set boxes:', sum(encl_dict['analysis'][str(i)]['preimageboxcounter'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it)))
             print('# of MILPs:', sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it)))
             print('AVG time for MILPs:', sum(encl_dict['analysis'][str(i)]['relaxed_solution_time'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it)))
+            print('AVG build time for MILPs:', sum(encl_dict['analysis'][str(i)]['relaxed_build_time'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it)))
             try:
                 print('# of NLPs:', sum(encl_dict['analysis'][str(i)]['problemcounter'] for i in np.arange(0,it)))
                 print('AVG time for NLPs:', sum(encl_dict['analysis'][str(i)]['solution_time'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['problemcounter'] for i in np.arange(0,it)))
@@ -320,6 +531,33 @@ def MOMIRROA(call_model, parameter, options):
             print('time spent for bound tightening:',
                   sum(encl_dict['analysis'][str(i)]['time bound tightening'] for i in np.arange(0,it)))
             print('# of OBBT MILPs:', sum(encl_dict['analysis'][str(i)]['# of OBBT MILPs'] for i in np.arange(0,it)))
+            print('# of OBBT model builds:',
+                  sum(encl_dict['analysis'][str(i)].get('OBBT model builds', 0) for i in np.arange(0,it)))
+            print('# of OBBT LPs/bounds skipped as attained by a known point:',
+                  sum(encl_dict['analysis'][str(i)].get('OBBT LP solves', 0) for i in np.arange(0,it)), '/',
+                  sum(encl_dict['analysis'][str(i)].get('OBBT filtered bounds', 0) for i in np.arange(0,it)))
+            print('# of bounds tightened by FBBT/OBBT:',
+                  sum(encl_dict['analysis'][str(i)].get('FBBT tightened bounds', 0) for i in np.arange(0,it)), '/',
+                  sum(encl_dict['analysis'][str(i)].get('OBBT tightened bounds', 0) for i in np.arange(0,it)))
+            print('time spent for FBBT:',
+                  sum(encl_dict['analysis'][str(i)].get('time FBBT', 0) for i in np.arange(0,it)))
+            print('# of bounds inherited from dominating search zones:',
+                  sum(encl_dict['analysis'][str(i)].get('inherited bounds', 0) for i in np.arange(0,it)))
+            print('box info cache hits/misses:',
+                  sum(encl_dict['analysis'][str(i)]['box info cache hits'] for i in np.arange(0,it)), '/',
+                  sum(encl_dict['analysis'][str(i)]['box info cache misses'] for i in np.arange(0,it)))
+            print('error bounds by closed form/interval/scip:',
+                  *[sum(encl_dict['analysis'][str(i)].get('error bounds ' + tier, 0) for i in np.arange(0,it))
+                    for tier in ['closed form', 'interval', 'scip']])
+            print('inherited box estimators/tightened loose boxes:',
+                  sum(encl_dict['analysis'][str(i)].get('inherited box estimators', 0) for i in np.arange(0,it)), '/',
+                  sum(encl_dict['analysis'][str(i)].get('tightened loose boxes', 0) for i in np.arange(0,it)))
+            print('# of log encoded partitions:',
+                  sum(encl_dict['analysis'][str(i)].get('log encoded partitions', 0) for i in np.arange(0,it)))
+            print('# of boxes passed on to shared partitions:',
+                  sum(encl_dict['analysis'][str(i)].get('shared box refinements', 0) for i in np.arange(0,it)))
+            print('share of checkpoint time in total time:',
+                  sum(encl_dict['analysis'][str(i)].get('checkpoint_time', 0) for i in np.arange(0,it))/total_time)
             print('share of search zone improvement by feas-dec (total):',
                   sum(encl_dict['analysis'][str(i)]['# of considered feasible'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['# of search zones'] for i in np.arange(0,it)))
 
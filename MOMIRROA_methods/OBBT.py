@@ -9,10 +9,15 @@ Created on Tue Jul  2 10:32:30 2024
 import copy as cp
 import numpy as np
 
-from tighten_bound import *
+from OBBT_pool import *
+from relaxation_statistics import *
 from update_bounds import *
 
-def OBBT(call_model, rel_errors, solution, u, info, options, timelimit):
+# relaxations the bounds are tightened on, 'mixed' tightens the bounds on the
+# LP relaxation first and afterwards the remaining ones on the MILP
+OBBT_MODES = ['MILP', 'LP', 'mixed']
+
+def OBBT(call_model, rel_errors, solution, u, info, options, timelimit, skip=()):
     """
     routine for optimization-based bound tightening w.r.t. the objective
     constraints given by 'u'
@@ -34,6 +39,10 @@ def OBBT(call_model, rel_errors, solution, u, info, options, timelimit):
         relaxation.
     options : structure
         containing all optional settings for the algorithm.
+    skip : list, optional
+        containing the variable names with suffix '_lower'/'_upper' of bounds
+        which are not tightened, e.g., since FBBT already tightened them. The
+        default is ().
 
     Returns
     -------
@@ -43,7 +52,12 @@ def OBBT(call_model, rel_errors, solution, u, info, options, timelimit):
     tighten_time : float
         representing the time needed for solving the OBBT problems.
     counter : int
-        representing the number of solved OBBT problems.
+        representing the number of solved OBBT MILPs.
+
+    Raises
+    ------
+    ValueError
+        if the OBBT mode is unknown.
 
     """
     
@@ -54,6 +68,15 @@ def OBBT(call_model, rel_errors, solution, u, info, options, timelimit):
     except:
         var_count_OBBT = 2
     
+    # decide relaxation the bounds are tightened on
+    try:
+        OBBT_mode = options.OBBT_mode
+    except:
+        OBBT_mode = 'MILP'
+    
+    if not OBBT_mode in OBBT_MODES:
+        raise ValueError('Unknown OBBT mode ' + str(OBBT_mode))
+    
     # determine order of variables+lower/upper to be tightened
     var_list = list(info['bounds'].keys())
     pos_vars = {}
@@ -68,39 +91,47 @@ def OBBT(call_model, rel_errors, solution, u, info, options, timelimit):
                               key=lambda x:x[1],
                               reverse=True)).keys()
     
-    # tighten vars
-    counter = 0
+    # bounds to be tightened w.r.t. the share of variables
+    bounds = [(v_ind[:-6], v_ind[-5:]) for v_ind in sorted_vars
+              if pos_vars[v_ind] > 0 and v_ind not in skip]
+    bounds = bounds[:max(1, int(np.floor(var_count_OBBT * len(var_list))))]
     
     # tightening time
     tighten_time = 0
+    MILP_solves = statistics.get('OBBT MILP solves', 0)
     
-    # save old relaxation information
-    old_info = cp.deepcopy(info)
+    # the MILP sweep of the mixed mode only tightens the bounds which are
+    # skipped or not tightened by the LP sweep
+    sweeps = ['LP', 'MILP'] if OBBT_mode == 'mixed' else [OBBT_mode]
     
-    for v_ind in sorted_vars:
-        if pos_vars[v_ind] > 0:
-            v = v_ind[:-6]
-            ind = v_ind[-5:]
-            
-            new_bound, sol_time = tighten_bound(call_model,
-                                      v,
-                                      ind,
-                                      u,
-                                      old_info,
-                                      solution,
-                                      options,
-                                      timelimit)
+    for relaxation in sweeps:
+        # tighten vars on the old relaxation information, the results are
+        # applied in the order of priority
+        results = tighten_bounds(call_model,
+                                 u,
+                                 cp.deepcopy(info),
+                                 solution,
+                                 options,
+                                 timelimit,
+                                 bounds,
+                                 relaxation)
+        
+        remaining = []
+        for (v, ind), result in zip(bounds, results):
+            if result is None:
+                remaining.append((v, ind))
+                continue
             
+            new_bound, sol_time = result
+            old_bounds = list(info['bounds'][v][:2])
             info = update_bounds(new_bound, v, ind, info)
             tighten_time += sol_time
             
-            counter += 1
-            if counter >= np.floor(var_count_OBBT * len(var_list)):
-                break
-
-    return info, tighten_time, counter  
-            
-            
-            
-            
-            
+            if info['bounds'][v][:2] != old_bounds:
+                count_statistic('OBBT tightened bounds')
+            else:
+                remaining.append((v, ind))
+        
+        bounds = remaining
+    
+    return info, tighten_time, int(statistics.get('OBBT MILP solves', 0) - MILP_solves)
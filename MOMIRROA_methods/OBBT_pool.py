@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Nov  3 09:24:52 2026
+
+@author: moritz
+"""
+
+import multiprocessing as mp
+import os
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+
+from relaxation_statistics import *
+from tighten_bound import *
+
+
+class OBBTPool():
+    """
+    pool of worker processes tightening the bounds of an OBBT sweep side by
+    side. All bounds of a sweep are tightened on the same relaxation, hence
+    they are independent of each other: every worker sets up the relaxation
+    once and tightens its share of the bounds
+
+    the bounds are tightened in the process which configured the pool, in any
+    other process, e.g., a worker of the parallel search zone processing,
+    they are tightened one after another
+
+    """
+
+    def __init__(self, workers=1):
+        self.workers = workers
+        self.executor = None
+        self.pid = os.getpid()
+
+    def configure(self, workers):
+        """
+        routine for setting the number of worker processes, 1 tightens the
+        bounds in the calling process
+
+        """
+
+        self.shutdown()
+        self.workers = workers
+        self.pid = os.getpid()
+
+    def parallel(self, call_model, number_of_bounds):
+        """
+        routine for deciding if 'number_of_bounds' bounds are tightened by the
+        worker processes, which requires 'call_model' to be picklable, i.e.,
+        not a local function
+
+        """
+
+        if self.workers <= 1 or number_of_bounds <= 1 or os.getpid() != self.pid:
+            return False
+
+        try:
+            pickle.dumps(call_model)
+        except Exception:
+            return False
+
+        return True
+
+    def submit(self, *args):
+        """
+        routine for submitting a share of the bounds of a sweep to the worker
+        processes, which are started on first use
+
+        """
+
+        if self.executor is None:
+            # fork the workers such that the problem module is available
+            try:
+                context = mp.get_context('fork')
+            except ValueError:
+                context = None
+
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=context)
+
+        return self.executor.submit(OBBT_worker, *args)
+
+    def shutdown(self):
+        """
+        routine for stopping the worker processes
+
+        """
+
+        if self.executor is not None and os.getpid() == self.pid:
+            self.executor.shutdown()
+        self.executor = None
+
+
+# pool shared by all OBBT sweeps
+OBBT_pool = OBBTPool()
+
+
+def OBBT_worker(call_model, u, info, solution, options, timelimit, bounds, relaxation):
+    """
+    routine for tightening a share of the bounds of an OBBT sweep inside a
+    worker process
+
+    Returns
+    -------
+    results : list
+        containing the possibly tightened bound and the solution time, or None
+        if the bound is skipped, for every bound of 'bounds'.
+    counts : dict
+        having the counter names as keys and their increase in the worker
+        process as values.
+
+    """
+
+    snapshot = statistics_snapshot()
+
+    model = OBBTModel(call_model, u, info, solution, options, timelimit, relaxation)
+    results = [model.tighten_bound(var, ind) for var, ind in bounds]
+
+    # the counters of the worker process are handed to the calling process
+    counts = {key: amount - snapshot.get(key, 0) for key, amount in statistics.items()
+              if amount != snapshot.get(key, 0)}
+
+    return results, counts
+
+
+def tighten_bounds(call_model, u, info, solution, options, timelimit, bounds, relaxation='MILP'):
+    """
+    routine for tightening all bounds of an OBBT sweep, either one after
+    another on a single relaxed model or in the worker processes of
+    'OBBT_pool'
+
+    Parameters
+    ----------
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    u : ndarray
+        representing the current objective cut-offs.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the model of interest.
+    solution : dict
+        with variable names as keys and corresponding optimal values as values.
+    options : structure
+        containing all optional settings for the algorithm.
+    timelimit : float
+        representing the time limit for computing missing box information.
+    bounds : list
+        containing tuples of the variable name and 'lower'/'upper' of all
+        bounds to be tightened.
+    relaxation : str, optional
+        representing the relaxation the bounds are tightened on, 'MILP' or
+        'LP'. The default is 'MILP'.
+
+    Returns
+    -------
+    results : list
+        containing the possibly tightened bound and the solution time, or None
+        if the bound is attained by a known point of the relaxation, for every
+        bound of 'bounds', in the order of 'bounds'.
+
+    """
+
+    if len(bounds) == 0:
+        return []
+
+    if not OBBT_pool.parallel(call_model, len(bounds)):
+        model = OBBTModel(call_model, u, info, solution, options, timelimit, relaxation)
+        return [model.tighten_bound(var, ind) for var, ind in bounds]
+
+    # distribute the bounds in turns such that every worker gets bounds of
+    # high priority
+    shares = min(OBBT_pool.workers, len(bounds))
+    futures = [OBBT_pool.submit(call_model,
+                                u,
+                                info,
+                                solution,
+                                options,
+                                timelimit,
+                                bounds[k::shares],
+                                relaxation) for k in range(shares)]
+
+    results = [None] * len(bounds)
+    for k, future in enumerate(futures):
+        share, counts = future.result()
+        results[k::shares] = share
+        for key, amount in counts.items():
+            count_statistic(key, amount)
+
+    return results
@@ -6,10 +6,12 @@ Created on Mon Jul  1 13:57:54 2024
 @author: moritz
 """
 
-import copy as cp
 import numpy as np
 import sys
 
+from lazy_box_info import *
+from shared_partitions import *
+
 def adaptive_refinement_procedure(info, solution, rel_errors, options):
     """
     routine for adaptive refinement of current relaxation, that is
@@ -51,6 +53,12 @@ def adaptive_refinement_procedure(info, solution, rel_errors, options):
     except:
         cons_vio_tol = 1e-3
     
+    # catch if bisected boxes inherit the estimators of their parent
+    try:
+        lazy_box_info = options.lazy_box_info
+    except:
+        lazy_box_info = False
+    
     # determine constraints and objectives which are violated too heavily
     bad_cons = [c for c in list(rel_errors.keys()) if rel_errors[c] > cons_vio_tol]
     try:
@@ -58,6 +66,9 @@ def adaptive_refinement_procedure(info, solution, rel_errors, options):
     except:
         None
     
+    # functions sharing their partitions are selected by the same binaries
+    leaders = {c: partition_leader(info, c) for c in bad_cons}
+
     for c in bad_cons:
         # catch boxes belonging to partition for that constraint
         boxes = [b for b in list(info[c].keys()) if 'box' in b]
@@ -65,41 +76,15 @@ def adaptive_refinement_procedure(info, solution, rel_errors, options):
         dummy_b = boxes[0]
 
         # catch variable names relevant for that constraint
-        vars = list(info[c][dummy_b].keys())
-        try:
-            vars.remove('weight')
-        except:
-            None
-        try:
-            vars.remove('underest_error')
-        except:
-            None
-        try:
-            vars.remove('overest_error')
-        except:
-            None
-            
+        vars = box_variables(info[c][dummy_b])
         
-        # find active box
-        active_box = None
-        act_bin = [i for i in list(solution.keys()) if (c in i and solution[i]>= 0.9)][0]
-        act_ind = act_bin[act_bin.index('[')+1:act_bin.index(']')]
+        # functions sharing their partitions bisect a box along the same
+        # variable
+        if partition_sharing.shared:
+            vars = sorted(vars)
         
-        active = True
-            
-        try:
-            b = boxes[int(act_ind)]
-        except:
-            active = False
-        
-        # check if chosen box is truely active
-        if active:
-            for v in vars:
-                if not(info[c][b][v][0] - 1e-5 <= solution[v] and solution[v] <= info[c][b][v][1] + 1e-5):
-                    active = False
-                    break
-            if active:
-                active_box = b
+        # find active box
+        active_box = find_active_box(info, c, solution, vars, leaders[c])
 
         if type(active_box) == str:
             
@@ -109,18 +94,13 @@ def adaptive_refinement_procedure(info, solution, rel_errors, options):
                     if np.ceil(info[c][active_box][v][0]) == np.floor(info[c][active_box][v][1]):
                         vars.remove(v)
             
-            try:
-                del info[c][active_box]['weight']
-            except:
-                None
-            try:
-                del info[c][active_box]['underest_error']
-            except:
-                None
-            try:
-                del info[c][active_box]['overest_error']
-            except:
-                None
+            # a loose box gets its own estimators instead of being bisected
+            if 'loose' in info[c][active_box].keys():
+                info[c][active_box] = tighten_record(info[c][active_box])
+                continue
+            
+            # drop former box information or pass it on to the children
+            info[c][active_box] = child_record(info[c][active_box], lazy_box_info)
             
             # find max var
             max_var = None
@@ -132,25 +112,23 @@ def adaptive_refinement_procedure(info, solution, rel_errors, options):
             
             if type(max_var) == str:
                 
+                lower, upper = info[c][active_box][max_var]
+                
                 if 'discrete' in info['bounds'][max_var]:
                     # bisection for discrete vars
-                    info[c][active_box+'0'] = cp.deepcopy(info[c][active_box])
-                    info[c][active_box+'0'][max_var][1] = np.floor(
-                        info[c][active_box][max_var][0] + max_len/2)
+                    info[c][active_box+'0'] = info[c][active_box].updated(
+                        {max_var: (lower, np.floor(lower + max_len/2))})
                     
-                    info[c][active_box+'1'] = cp.deepcopy(info[c][active_box])
-                    info[c][active_box+'1'][max_var][0] = np.ceil(
-                        info[c][active_box][max_var][0] + max_len/2)
+                    info[c][active_box+'1'] = info[c][active_box].updated(
+                        {max_var: (np.ceil(lower + max_len/2), upper)})
                 
                 else:
                     # bisection for continuous vars
-                    info[c][active_box+'0'] = cp.deepcopy(info[c][active_box])
-                    info[c][active_box+'0'][max_var][1] = max_len/2 + \
-                        info[c][active_box][max_var][0]
+                    info[c][active_box+'0'] = info[c][active_box].updated(
+                        {max_var: (lower, max_len/2 + lower)})
                         
-                    info[c][active_box+'1'] = cp.deepcopy(info[c][active_box])
-                    info[c][active_box+'1'][max_var][0] = max_len/2 + \
-                        info[c][active_box][max_var][0]
+                    info[c][active_box+'1'] = info[c][active_box].updated(
+                        {max_var: (max_len/2 + lower, upper)})
                         
                 del info[c][active_box]
             
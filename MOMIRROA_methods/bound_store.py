@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Nov  4 10:37:19 2026
+
+@author: moritz
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from record_zone_event import *
+from relaxation_statistics import *
+from update_bounds import *
+
+
+class BoundStore():
+    """
+    least recently used store of the variable bounds of the search zones
+    whose relaxations were tightened, keyed by their local upper bounds
+
+    the bounds of a search zone are valid for all feasible points whose image
+    lies below its local upper bound, i.e., the objective cut-offs of OBBT
+    and FBBT. Hence they are also valid for every search zone whose local
+    upper bound is componentwise smaller, and a new local upper bound
+    inherits the tightest bounds of all stored local upper bounds dominating
+    it
+
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def configure(self, maxsize):
+        """
+        routine for setting the maximal number of stored local upper bounds,
+        0 disables the store, and dropping all stored bounds
+
+        """
+
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def enabled(self):
+        return self.maxsize > 0
+
+    def put(self, u, bounds):
+        """
+        routine for storing the variable bounds 'bounds' of the search zone
+        determined by 'u', only bounds which are tighter than the ones stored
+        for a dominating local upper bound are kept
+
+        Parameters
+        ----------
+        u : ndarray
+            representing the local upper bound determining the search zone.
+        bounds : dict
+            having the variable names as keys and their lower and upper bounds
+            as first two entries of the values.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        if not self.enabled():
+            return
+
+        known = self.tightest(u)
+        new = {v: list(b[:2]) for v, b in bounds.items()
+               if v not in known or b[0] > known[v][0] or b[1] < known[v][1]}
+
+        if len(new) == 0:
+            return
+
+        key = tuple(np.asarray(u, dtype=float))
+        self.entries.setdefault(key, {}).update(new)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def tightest(self, u):
+        """
+        routine for combining the bounds of all stored local upper bounds
+        dominating 'u'
+
+        Returns
+        -------
+        bounds : dict
+            having the variable names as keys and the tightest lower and upper
+            bounds as values.
+
+        """
+
+        u = np.asarray(u, dtype=float)
+
+        bounds = {}
+        for key, stored in self.entries.items():
+            if not (u <= np.asarray(key)).all():
+                continue
+
+            for v, (lower, upper) in stored.items():
+                if v not in bounds:
+                    bounds[v] = [lower, upper]
+                else:
+                    bounds[v] = [max(bounds[v][0], lower), min(bounds[v][1], upper)]
+
+        return bounds
+
+
+# store shared by all search zones
+bound_store = BoundStore()
+
+
+def store_bounds(encl_dict, u, info):
+    """
+    routine for storing the variable bounds of the relaxation information
+    'info' of the search zone determined by 'u' after a refinement step, the
+    workers of the parallel search zone processing record them for the
+    coordinating process
+
+    """
+
+    if not bound_store.enabled():
+        return
+
+    bound_store.put(u, info['bounds'])
+    record_zone_event(encl_dict, 'bounds', u, {v: list(b[:2]) for v, b in info['bounds'].items()})
+
+
+def inherit_bounds(info, u):
+    """
+    routine for tightening the relaxation information 'info' of the new
+    local upper bound 'u' by the bounds of all stored local upper bounds
+    dominating it
+
+    Parameters
+    ----------
+    info : dict
+        containing all information for setting up the piecewise linear
+        relaxation of the search zone.
+    u : ndarray
+        representing the local upper bound determining the search zone.
+
+    Returns
+    -------
+    info : dict
+        containing all information for setting up the tightened piecewise
+        linear relaxation of the search zone.
+
+    """
+
+    if not bound_store.enabled() or len(bound_store.entries) == 0:
+        return info
+
+    for v, (lower, upper) in bound_store.tightest(u).items():
+        if v not in info['bounds'].keys():
+            continue
+
+        for ind, new_bound in [('lower', lower), ('upper', upper)]:
+            old_bounds = list(info['bounds'][v][:2])
+            info = update_bounds(new_bound, v, ind, info)
+
+            if info['bounds'][v][:2] != old_bounds:
+                count_statistic('inherited bounds')
+
+    return info
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 31 10:12:37 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+
+import numpy as np
+
+from relaxation_statistics import *
+
+
+"""
+logarithmic encoding of the selection of the active box
+
+by default every box of a partition has a binary and exactly one of them is
+active. For a partition of B boxes the logarithmic encoding uses
+ceil(log2 B) binaries instead: box number j gets the Gray code of j, the
+box binaries are relaxed to the unit interval and every code binary forces
+the box binaries of all boxes disagreeing with it in its bit to vanish.
+Since the box binaries still sum up to one, exactly one of them equals one,
+i.e., the relaxations do not change, and boxes created by consecutive
+bisections differ in few bits of their codes
+
+"""
+
+def gray_code(j):
+    """
+    routine for returning the reflected binary Gray code of 'j'
+
+    """
+
+    return j ^ (j >> 1)
+
+
+class BoxEncoding():
+    """
+    encoding of the selection of the active box, the logarithmic encoding is
+    used for all partitions with more boxes than 'threshold' (never if the
+    threshold is None)
+
+    """
+
+    def __init__(self, threshold=None):
+        self.configure(threshold)
+
+    def configure(self, threshold=None):
+        self.threshold = threshold
+
+    def logarithmic(self, number_of_boxes):
+        """
+        routine for checking if a partition of 'number_of_boxes' boxes is
+        encoded logarithmically
+
+        """
+
+        return self.threshold is not None and number_of_boxes > self.threshold
+
+
+# encoding shared by all relaxations
+box_encoding = BoxEncoding()
+
+
+def encode_box_selection(model, name, bina):
+    """
+    routine for encoding the selection of one box of the partition of the
+    function 'name' w.r.t. 'box_encoding', the constraint that the box
+    binaries sum up to one has to be part of the model
+
+    Parameters
+    ----------
+    model : pyomo model
+        representing the relaxation under construction.
+    name : str
+        representing the name of the nonlinear constraint/objective.
+    bina : pyomo variable
+        representing the box binaries of the partition.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    # drop a former encoding of the partition
+    if model.component(name+'_box_code') is not None:
+        for k in model.component(name+'_box_code').index_set():
+            model.del_component(name+'_box_code_'+str(k)+'_ones')
+            model.del_component(name+'_box_code_'+str(k)+'_zeros')
+        model.del_component(name+'_box_code')
+
+    indices = list(bina.index_set())
+
+    if not box_encoding.logarithmic(len(indices)):
+        for i in indices:
+            bina[i].domain = Binary
+        return
+
+    number_of_bits = int(np.ceil(np.log2(len(indices))))
+    codes = [gray_code(j) for j in range(len(indices))]
+
+    code = Var(range(number_of_bits), within=Binary)
+    model.add_component(name+'_box_code', code)
+
+    # the relaxations expect scalar constraints only
+    for k in range(number_of_bits):
+        model.add_component(
+            name+'_box_code_'+str(k)+'_ones',
+            Constraint(expr = quicksum(bina[i] for i, c in zip(indices, codes) if (c >> k) & 1) <= code[k]))
+        model.add_component(
+            name+'_box_code_'+str(k)+'_zeros',
+            Constraint(expr = quicksum(bina[i] for i, c in zip(indices, codes) if not (c >> k) & 1) <= 1 - code[k]))
+
+    for i in indices:
+        bina[i].domain = UnitInterval
+
+    count_statistic('log encoded partitions')
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:31:09 2026
+
+@author: moritz
+"""
+
+from collections import OrderedDict
+
+import copy as cp
+
+from relaxation_statistics import *
+
+
+class BoxInfoCache():
+    """
+    least recently used cache of the box information, i.e., least square
+    weight and over-/underestimation errors, keyed by the function name, the
+    sense of the estimation and the exact box bounds. Since the estimators
+    only depend on these, the cache is shared by all search zones
+
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def key(self, name, sense, vars, info):
+        """
+        routine for building the cache key of a box
+
+        Parameters
+        ----------
+        name : str
+            representing the name of the nonlinear constraint/objective.
+        sense : str
+            representing the kind of estimation, i.e., 'constraint',
+            'objective_min' or 'objective_max'.
+        vars : list
+            containing pyomo variable objects appearing in the function.
+        info : dict
+            containing all information of the current box of interest.
+
+        Returns
+        -------
+        key : tuple
+            representing the box.
+
+        """
+
+        bounds = tuple(sorted((v.name, float(min(info[v.name])), float(max(info[v.name])))
+                              for v in vars))
+
+        return (name, sense, bounds)
+
+    def get(self, key):
+        """
+        routine for looking up the box information stored under 'key'
+
+        Parameters
+        ----------
+        key : tuple
+            representing the box.
+
+        Returns
+        -------
+        data : dict
+            containing the weight and the estimation errors or None if the box
+            is not cached.
+
+        """
+
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            count_statistic('box info cache hits')
+            return cp.deepcopy(self.entries[key])
+
+        count_statistic('box info cache misses')
+        return None
+
+    def put(self, key, data):
+        """
+        routine for storing the box information 'data' under 'key'
+
+        Parameters
+        ----------
+        key : tuple
+            representing the box.
+        data : dict
+            containing the weight and the estimation errors.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        if self.maxsize <= 0:
+            return
+
+        self.entries[key] = cp.deepcopy(data)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def configure(self, maxsize):
+        """
+        routine for setting the maximal number of cached boxes
+
+        Parameters
+        ----------
+        maxsize : int
+            representing the maximal number of cached boxes.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.maxsize = maxsize
+        while len(self.entries) > max(self.maxsize, 0):
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        routine for dropping all cached boxes, e.g., when a new problem is
+        solved, since the keys do not identify the functions across problems
+
+        """
+
+        self.entries = OrderedDict()
+
+
+# cache shared by all search zones
+box_info_cache = BoxInfoCache()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 09:48:15 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr import identify_variables
+
+import multiprocessing as mp
+import numpy as np
+import os
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+
+from box_info_cache import *
+from calculate_box_info import *
+from calculate_box_info_objective import *
+from calculate_box_info_objective_max import *
+from relaxation_statistics import *
+
+
+# per kind of estimation the routine computing a box, the entry marking a
+# box as processed and the entries stored in 'box_info_cache'
+BOX_INFO_ROUTINES = {'constraint': (calculate_box_info,
+                                    'weight',
+                                    ['weight', 'overest_error', 'underest_error']),
+                     'objective_min': (calculate_box_info_objective,
+                                       'overest_error',
+                                       ['weight', 'overest_error']),
+                     'objective_max': (calculate_box_info_objective_max,
+                                       'underest_error',
+                                       ['weight', 'underest_error'])}
+
+
+class BoxInfoPool():
+    """
+    pool of worker processes computing the least square weights and the
+    estimation errors of all boxes of a relaxation which are still missing
+    them, such that the global solves of the error subproblems of newly
+    created boxes run side by side instead of one after another
+
+    the boxes are computed in the process which configured the pool, in any
+    other process, e.g., a worker of the parallel search zone processing,
+    they are computed one after another
+
+    """
+
+    def __init__(self, workers=1, timelimit=None):
+        self.workers = workers
+        self.timelimit = timelimit
+        self.executor = None
+        self.pid = os.getpid()
+
+    def configure(self, workers, timelimit=None):
+        """
+        routine for setting the number of worker processes and the time
+        budget per error subproblem
+
+        Parameters
+        ----------
+        workers : int
+            representing the number of worker processes, 1 computes the boxes
+            in the calling process.
+        timelimit : float, optional
+            representing the time limit of every error subproblem of a box.
+            The default is None, i.e., the time limit of the relaxation is
+            used.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.shutdown()
+        self.workers = workers
+        self.timelimit = timelimit
+        self.pid = os.getpid()
+
+    def box_timelimit(self, timelimit):
+        """
+        routine for returning the time limit of an error subproblem w.r.t. the
+        time limit 'timelimit' of the relaxation
+
+        """
+
+        if self.timelimit is None:
+            return timelimit
+
+        return min(timelimit, self.timelimit)
+
+    def parallel(self, call_model, number_of_boxes):
+        """
+        routine for deciding if 'number_of_boxes' boxes are computed by the
+        worker processes, which requires 'call_model' to be picklable, i.e.,
+        not a local function
+
+        """
+
+        if self.workers <= 1 or number_of_boxes <= 1 or os.getpid() != self.pid:
+            return False
+
+        try:
+            pickle.dumps(call_model)
+        except Exception:
+            return False
+
+        return True
+
+    def submit(self, *args):
+        """
+        routine for submitting the computation of a single box to the worker
+        processes, which are started on first use
+
+        """
+
+        if self.executor is None:
+            # fork the workers such that the problem module is available
+            try:
+                context = mp.get_context('fork')
+            except ValueError:
+                context = None
+
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=context)
+
+        return self.executor.submit(box_info_worker, *args)
+
+    def shutdown(self):
+        """
+        routine for stopping the worker processes
+
+        """
+
+        if self.executor is not None and os.getpid() == self.pid:
+            self.executor.shutdown()
+        self.executor = None
+
+
+# pool shared by all relaxations
+box_info_pool = BoxInfoPool()
+
+
+def box_info_worker(call_model, name, sense, box, timelimit):
+    """
+    routine for computing the information of a single box inside a worker
+    process on a fresh model of the problem
+
+    Parameters
+    ----------
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    name : str
+        representing the name of the nonlinear constraint/objective.
+    sense : str
+        representing the kind of estimation, i.e., 'constraint',
+        'objective_min' or 'objective_max'.
+    box : BoxRecord
+        containing all information of the current box of interest.
+    timelimit : float
+        representing the time limit of every error subproblem.
+
+    Returns
+    -------
+    box : BoxRecord
+        containing all information to set up a piecewise linear relaxation on
+        the current box of interest.
+    counts : dict
+        having the names of the error bound counters as keys and their
+        increase in the worker process as values.
+
+    """
+
+    snapshot = statistics_snapshot()
+
+    model = call_model(0)
+    component = model.find_component(name)
+
+    if sense == 'constraint':
+        vars = list(identify_variables(component.body))
+    else:
+        vars = list(identify_variables(component.expr))
+
+    box = BOX_INFO_ROUTINES[sense][0](component, vars, box, call_model, timelimit)
+
+    # the counters of the worker process are handed to the calling process
+    counts = {key: amount - snapshot.get(key, 0) for key, amount in statistics.items()
+              if key.startswith('error bounds') and amount != snapshot.get(key, 0)}
+
+    return box, counts
+
+
+def precompute_box_info(functions, call_model, info, timelimit):
+    """
+    routine for computing the missing information of all boxes of a relaxation
+    before the relaxed model is built, either one after another or in the
+    worker processes of 'box_info_pool'. Boxes which are not reasonable for
+    discrete variables are skipped
+
+    Parameters
+    ----------
+    functions : list
+        containing for every nonlinear constraint/objective a tuple of its
+        pyomo component, the list of its pyomo variables and the kind of
+        estimation, i.e., 'constraint', 'objective_min' or 'objective_max'.
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    timelimit : float
+        representing the time limit of the relaxation.
+
+    Returns
+    -------
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest, where all reasonable boxes carry
+        their information.
+
+    """
+
+    timelimit = box_info_pool.box_timelimit(timelimit)
+
+    # collect the boxes which are missing information
+    tasks = []
+    for component, vars, sense in functions:
+        name = component.name
+        for b in [b for b in info[name].keys() if 'box' in b]:
+            box = info[name][b]
+            if BOX_INFO_ROUTINES[sense][1] in box.keys():
+                continue
+
+            reasonable = True
+            for v in vars:
+                if 'discrete' in info['bounds'][v.name]:
+                    if np.ceil(box[v.name][0]) > np.floor(box[v.name][1]):
+                        reasonable = False
+                        break
+
+            if reasonable:
+                tasks.append((component, vars, sense, b))
+
+    if not box_info_pool.parallel(call_model, len(tasks)):
+        for component, vars, sense, b in tasks:
+            info[component.name][b] = BOX_INFO_ROUTINES[sense][0](component,
+                                                                  vars,
+                                                                  info[component.name][b],
+                                                                  call_model,
+                                                                  timelimit)
+        return info
+
+    # cached boxes are filled in directly, the others are computed by the
+    # worker processes
+    futures = []
+    for component, vars, sense, b in tasks:
+        box = info[component.name][b]
+        key = box_info_cache.key(component.name, sense, vars, box)
+        data = box_info_cache.get(key)
+
+        if data is not None and (sense != 'objective_max'
+                                 or not 'weight' in box.keys()
+                                 or box['weight'] == data['weight']):
+            info[component.name][b] = make_box_record({**dict(box), **data})
+        else:
+            futures.append((component.name, b, sense, key,
+                            box_info_pool.submit(call_model,
+                                                 component.name,
+                                                 sense,
+                                                 box,
+                                                 timelimit)))
+
+    for name, b, sense, key, future in futures:
+        info[name][b], counts = future.result()
+        for counter, amount in counts.items():
+            count_statistic(counter, amount)
+        box_info_cache.put(key, {k: info[name][b][k] for k in BOX_INFO_ROUTINES[sense][2]
+                                 if k in info[name][b].keys()})
+
+    return info
@@ -8,9 +8,11 @@ Created on Fri Jun 28 11:06:50 2024
 
 from pyomo.environ import *
 
+from box_info_cache import *
 from compute_least_square_weight import *
 from compute_overest_error import *
 from compute_underest_error import *
+from relaxation_store import *
 
 def calculate_box_info(c, vars, info, call_model, timelimit):
     """
@@ -33,12 +35,22 @@ def calculate_box_info(c, vars, info, call_model, timelimit):
 
     Returns
     -------
-    info : dict
+    info : BoxRecord
         containing all information to set up a piecewise linear 
         relaxation on the current box of interest.
 
     """
     
+    # work on a private copy of the immutable box record
+    info = dict(info)
+    
+    # check if the box has already been processed for another search zone
+    key = box_info_cache.key(c.name, 'constraint', vars, info)
+    data = box_info_cache.get(key)
+    if data is not None:
+        info.update(data)
+        return make_box_record(info)
+    
     # compute least square weight determining the piecewise linear funtion
     info['weight'] = compute_least_square_weight(c, vars, info)
     
@@ -59,4 +71,9 @@ def calculate_box_info(c, vars, info, call_model, timelimit):
                                                         vars,
                                                         info,
                                                         timelimit)
-    return info
+    
+    box_info_cache.put(key, {k: info[k] for k in ['weight',
+                                                  'overest_error',
+                                                  'underest_error'] if k in info.keys()})
+    
+    return make_box_record(info)
\ No newline at end of file
@@ -8,8 +8,10 @@ Created on Fri Jun 28 13:59:51 2024
 
 from pyomo.environ import *
 
+from box_info_cache import *
 from compute_least_square_weight import *
 from compute_overest_error_objective import *
+from relaxation_store import *
 
 def calculate_box_info_objective(o, vars, info, call_model, timelimit):
     """
@@ -33,12 +35,22 @@ def calculate_box_info_objective(o, vars, info, call_model, timelimit):
 
     Returns
     -------
-    info : dict
+    info : BoxRecord
         containing all information to set up a piecewise linear relaxation
         on the current box of interest.
 
     """
     
+    # work on a private copy of the immutable box record
+    info = dict(info)
+    
+    # check if the box has already been processed for another search zone
+    key = box_info_cache.key(o.name, 'objective_min', vars, info)
+    data = box_info_cache.get(key)
+    if data is not None:
+        info.update(data)
+        return make_box_record(info)
+    
     # compute least square weight determiming the piecewise linear function
     info['weight'] = compute_least_square_weight(o, vars, info)
     
@@ -49,4 +61,7 @@ def calculate_box_info_objective(o, vars, info, call_model, timelimit):
                                                             info,
                                                             timelimit)
     
-    return info
+    box_info_cache.put(key, {'weight': info['weight'],
+                             'overest_error': info['overest_error']})
+    
+    return make_box_record(info)
\ No newline at end of file
@@ -9,8 +9,10 @@ Created on Thu Jul  4 12:26:05 2024
 
 from pyomo.environ import *
 
+from box_info_cache import *
 from compute_least_square_weight import *
 from compute_underest_error_objective import *
+from relaxation_store import *
 
 def calculate_box_info_objective_max(o, vars, info, call_model, timelimit):
     """
@@ -35,12 +37,24 @@ def calculate_box_info_objective_max(o, vars, info, call_model, timelimit):
 
     Returns
     -------
-    info : dict
+    info : BoxRecord
         containing all information to set up a piecewise linear relaxation
         on the current box of interest.
 
     """
     
+    # work on a private copy of the immutable box record
+    info = dict(info)
+    
+    # check if the box has already been processed for another search zone,
+    # the cached error is only valid for the same least square weight
+    key = box_info_cache.key(o.name, 'objective_max', vars, info)
+    data = box_info_cache.get(key)
+    if data is not None:
+        if not 'weight' in info.keys() or info['weight'] == data['weight']:
+            info.update(data)
+            return make_box_record(info)
+    
     # check if least square weight determining the piecewise linear funtion
     # has to be computed
     if not 'weight' in info.keys():
@@ -53,4 +67,7 @@ def calculate_box_info_objective_max(o, vars, info, call_model, timelimit):
                                                             info,
                                                             timelimit)
     
-    return info
\ No newline at end of file
+    box_info_cache.put(key, {'weight': info['weight'],
+                             'underest_error': info['underest_error']})
+    
+    return make_box_record(info)
\ No newline at end of file
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 10:26:41 2026
+
+@author: moritz
+"""
+
+import json
+import numpy as np
+import os
+
+from local_bound_set import *
+from relaxation_store import *
+
+
+"""
+checkpoints of a MOMIRROA run are single npz files. All numbers and bounds
+are stored in arrays, the nesting of 'encl_dict' is stored in the json index
+'index' whose leaves refer to these arrays. Box records and box partitions
+shared by several local upper bounds are stored once
+
+"""
+
+# version of the checkpoint layout
+CHECKPOINT_VERSION = 1
+
+# kinds of scalars in the 'values' array
+SCALAR_KINDS = [float, int, np.float64, np.int64]
+
+
+class _CheckpointWriter():
+    # conversion of 'encl_dict' into a json index and a dict of arrays
+
+    def __init__(self):
+        self.values = []
+        self.kinds = []
+        self.arrays = {}
+        self.records = []
+        self.record_index = {}
+        self.partitions = []
+        self.partition_index = {}
+
+    def array(self, prefix, array):
+        name = prefix + str(len(self.arrays))
+        self.arrays[name] = array
+        return name
+
+    def record(self, record):
+        # records are interned, hence equal records are mostly identical
+        if id(record) not in self.record_index:
+            encoded = [[self.encode(k), self.encode(v)] for k, v in record.items()]
+            self.record_index[id(record)] = (len(self.records), record)
+            self.records.append(encoded)
+
+        return self.record_index[id(record)][0]
+
+    def partition(self, partition):
+        boxes = tuple((b, self.record(box)) for b, box in partition.items())
+        if boxes not in self.partition_index:
+            self.partition_index[boxes] = len(self.partitions)
+            self.partitions.append([list(b) for b in boxes])
+
+        return self.partition_index[boxes]
+
+    def encode(self, value):
+        if value is None or isinstance(value, (bool, str)):
+            return value
+
+        if type(value) in SCALAR_KINDS:
+            self.values.append(value)
+            self.kinds.append(SCALAR_KINDS.index(type(value)))
+            return ['n', len(self.values) - 1]
+
+        if isinstance(value, (np.integer, np.floating)):
+            return self.encode(value.item())
+
+        if isinstance(value, LocalBoundSet):
+            prefix = 'bound_set' + str(len(self.arrays)) + '_'
+            for name, array in value.to_arrays().items():
+                self.arrays[prefix + name] = array
+            return ['s', prefix]
+
+        if isinstance(value, np.ndarray):
+            return ['a', self.array('array', value)]
+
+        if isinstance(value, BoxRecord):
+            return ['r', self.record(value)]
+
+        if isinstance(value, BoxPartition):
+            return ['p', self.partition(value)]
+
+        if isinstance(value, dict):
+            return ['d', [[self.encode(k), self.encode(v)] for k, v in value.items()]]
+
+        if isinstance(value, tuple):
+            return ['t', [self.encode(v) for v in value]]
+
+        if isinstance(value, list):
+            # lists of points, e.g., N and U, are stacked
+            if len(value) > 0 and all(isinstance(v, np.ndarray) and v.ndim == 1
+                                      and v.shape == value[0].shape
+                                      and v.dtype == value[0].dtype for v in value):
+                return ['A', self.array('points', np.stack(value, axis=0))]
+            return ['l', [self.encode(v) for v in value]]
+
+        raise TypeError('Object of type ' + type(value).__name__ + ' cannot be checkpointed')
+
+
+class _CheckpointReader():
+    # conversion of the json index and the arrays into 'encl_dict'
+
+    def __init__(self, index, arrays):
+        self.index = index
+        self.arrays = arrays
+        self.values = arrays['values'].tolist()
+        self.kinds = arrays['kinds'].tolist()
+        self.records = [None] * len(index['records'])
+        self.partitions = [None] * len(index['partitions'])
+
+    def record(self, r):
+        if self.records[r] is None:
+            self.records[r] = make_box_record({self.decode(k): self.decode(v)
+                                               for k, v in self.index['records'][r]})
+        return self.records[r]
+
+    def partition(self, p):
+        # partitions shared before are shared copy-on-write again
+        if self.partitions[p] is None:
+            self.partitions[p] = BoxPartition({b: self.record(r)
+                                               for b, r in self.index['partitions'][p]})
+        return self.partitions[p].copy()
+
+    def decode(self, node):
+        if not isinstance(node, list):
+            return node
+
+        tag, content = node
+        if tag == 'n':
+            return SCALAR_KINDS[self.kinds[content]](self.values[content])
+        if tag == 's':
+            n = len(content)
+            return LocalBoundSet.from_arrays({k[n:]: v for k, v in self.arrays.items()
+                                              if k.startswith(content)})
+        if tag == 'a':
+            return self.arrays[content].copy()
+        if tag == 'A':
+            return [p.copy() for p in self.arrays[content]]
+        if tag == 'r':
+            return self.record(content)
+        if tag == 'p':
+            return self.partition(content)
+        if tag == 'd':
+            return {self.decode(k): self.decode(v) for k, v in content}
+        if tag == 't':
+            return tuple(self.decode(v) for v in content)
+        if tag == 'l':
+            return [self.decode(v) for v in content]
+
+        raise ValueError('Unknown entry ' + str(tag) + ' in checkpoint')
+
+
+def write_checkpoint(path, encl_dict, it, elapsed):
+    """
+    routine for writing the state of a MOMIRROA run at the end of an
+    iteration to the npz file 'path'. The file is replaced atomically, such
+    that an interrupted write keeps the former checkpoint
+
+    Parameters
+    ----------
+    path : str
+        representing the checkpoint file.
+    encl_dict : dict
+        containing all information collected by the algorithm.
+    it : int
+        representing the next iteration to be carried out.
+    elapsed : float
+        representing the time spent so far.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    writer = _CheckpointWriter()
+
+    # the start time is replaced by the elapsed time, transient entries of
+    # the search routines are not stored
+    state = {k: v for k, v in encl_dict.items()
+             if k not in ['start_time', 'zone_events']}
+
+    index = {'version': CHECKPOINT_VERSION,
+             'state': writer.encode(state),
+             'it': writer.encode(int(it)),
+             'elapsed': writer.encode(float(elapsed))}
+    index['records'] = writer.records
+    index['partitions'] = writer.partitions
+
+    arrays = writer.arrays
+    arrays['values'] = np.array(writer.values, dtype=float)
+    arrays['kinds'] = np.array(writer.kinds, dtype=np.int8)
+    arrays['index'] = np.array(json.dumps(index))
+
+    with open(path + '.tmp', 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(path + '.tmp', path)
+
+
+def read_checkpoint(path):
+    """
+    routine for reading a checkpoint written by 'write_checkpoint'
+
+    Parameters
+    ----------
+    path : str
+        representing the checkpoint file.
+
+    Raises
+    ------
+    ValueError
+        if the checkpoint was written with another layout.
+
+    Returns
+    -------
+    encl_dict : dict
+        containing all information collected by the algorithm so far.
+    it : int
+        representing the next iteration to be carried out.
+    elapsed : float
+        representing the time spent so far.
+
+    """
+
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {k: data[k] for k in data.files}
+
+    index = json.loads(str(arrays['index']))
+    if index['version'] != CHECKPOINT_VERSION:
+        raise ValueError('Checkpoint version ' + str(index['version']) + ' is not supported')
+
+    reader = _CheckpointReader(index, arrays)
+
+    return reader.decode(index['state']),\
+        reader.decode(index['it']),\
+        reader.decode(index['elapsed'])
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 26 09:12:23 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr import identify_variables
+from pyomo.core.expr.numeric_expr import AbsExpression, DivisionExpression,\
+    MaxExpression, MinExpression, NegationExpression, PowExpression,\
+    ProductExpression, SumExpression, UnaryFunctionExpression
+
+import numpy as np
+import weakref
+
+
+"""
+compilation of the nonlinear constraint and objective functions into
+vectorized numpy functions
+
+the expression tree of a function is translated once into the source of a
+python function mapping an (N, n) array of points to the N function values.
+Functions are shared by all expressions with the same source, i.e., by the
+copies of a constraint in the models returned by 'call_model', and are
+remembered per component as long as the component and its expression live.
+Expressions with nodes that cannot be translated raise a NotImplementedError,
+in which case the callers evaluate them with pyomo
+
+"""
+
+# univariate functions of pyomo and their numpy counterparts
+NUMPY_FUNCTIONS = {'exp': 'np.exp', 'log': 'np.log', 'log10': 'np.log10',
+                   'sqrt': 'np.sqrt', 'sin': 'np.sin', 'cos': 'np.cos',
+                   'tan': 'np.tan', 'asin': 'np.arcsin', 'acos': 'np.arccos',
+                   'atan': 'np.arctan', 'sinh': 'np.sinh', 'cosh': 'np.cosh',
+                   'tanh': 'np.tanh', 'asinh': 'np.arcsinh',
+                   'acosh': 'np.arccosh', 'atanh': 'np.arctanh',
+                   'ceil': 'np.ceil', 'floor': 'np.floor'}
+
+
+def component_expression(component):
+    """
+    routine for returning the function of a constraint or objective
+
+    """
+
+    if component.ctype is Constraint:
+        return component.body
+
+    return component.expr
+
+
+def expression_source(expr, position):
+    """
+    routine for translating a pyomo expression into a numpy expression in the
+    point array 'X'
+
+    Parameters
+    ----------
+    expr : pyomo expression
+        representing the function of interest.
+    position : dict
+        having the ids of the pyomo variables as keys and their columns in 'X'
+        as values.
+
+    Raises
+    ------
+    NotImplementedError
+        if the expression contains nodes which cannot be translated.
+
+    Returns
+    -------
+    source : str
+        representing the numpy expression.
+    volatile : bool
+        indicating if values of fixed variables or mutable parameters are
+        part of the source, such that it must not be reused.
+
+    """
+
+    if type(expr) in native_numeric_types:
+        return repr(float(expr)), False
+
+    if not expr.is_potentially_variable():
+        return repr(float(value(expr))), not expr.is_constant()
+
+    if expr.is_variable_type():
+        if id(expr) in position:
+            return 'X[:, ' + str(position[id(expr)]) + ']', False
+        if expr.fixed:
+            return repr(float(value(expr))), True
+        raise NotImplementedError('variable ' + expr.name + ' is not part of the points')
+
+    if expr.is_named_expression_type():
+        return expression_source(expr.expr, position)
+
+    args = [expression_source(arg, position) for arg in expr.args]
+    sources = [a[0] for a in args]
+    volatile = any(a[1] for a in args)
+
+    # the operations are applied in the same order as by pyomo
+    if isinstance(expr, SumExpression):
+        return '(' + ' + '.join(sources) + ')', volatile
+    if isinstance(expr, NegationExpression):
+        return '(-' + sources[0] + ')', volatile
+    if isinstance(expr, ProductExpression):
+        return '(' + sources[0] + ' * ' + sources[1] + ')', volatile
+    if isinstance(expr, DivisionExpression):
+        return '(' + sources[0] + ' / ' + sources[1] + ')', volatile
+    if isinstance(expr, PowExpression):
+        # integral exponents are kept integral as in pyomo
+        exponent = expr.args[1]
+        if type(exponent) in native_numeric_types and float(exponent).is_integer():
+            sources[1] = str(int(exponent))
+        return '(' + sources[0] + ' ** ' + sources[1] + ')', volatile
+    if isinstance(expr, AbsExpression):
+        return 'np.abs(' + sources[0] + ')', volatile
+    if isinstance(expr, (MaxExpression, MinExpression)):
+        # nested binary calls broadcast constant arguments against the points
+        function = 'np.maximum(' if isinstance(expr, MaxExpression) else 'np.minimum('
+        source = sources[-1]
+        for argument in reversed(sources[:-1]):
+            source = function + argument + ', ' + source + ')'
+        return source, volatile
+    if isinstance(expr, UnaryFunctionExpression) and expr.getname() in NUMPY_FUNCTIONS:
+        return NUMPY_FUNCTIONS[expr.getname()] + '(' + sources[0] + ')', volatile
+
+    raise NotImplementedError('expression node ' + type(expr).__name__)
+
+
+def pyomo_values(component, vars, points):
+    """
+    routine for evaluating the function of a constraint or objective at all
+    rows of 'points' with pyomo, one point after another
+
+    """
+
+    values = np.empty(len(points))
+    try:
+        for i in range(len(points)):
+            for j, v in enumerate(vars):
+                v.fix(float(points[i, j]), skip_validation=True)
+            values[i] = value(component)
+    finally:
+        for v in vars:
+            v.unfix()
+
+    return values
+
+
+class ExpressionCompiler():
+    """
+    compiler of pyomo expressions into vectorized numpy functions, the
+    compiled functions are cached by their source and by their component
+
+    """
+
+    def __init__(self):
+        self.functions = {}
+        self.components = {}
+
+    def cached(self, component):
+        # compiled function and variables of a component whose expression is
+        # unchanged, the entries do not keep the models alive
+        entry = self.components.get(id(component))
+        if entry is None or entry[0]() is not component:
+            return None
+        entry = entry[1:]
+
+        expr = component_expression(component)
+        vars = [v() for v in entry[1]]
+        if entry[0] != (id(expr), type(expr), expr.nargs()) or None in vars:
+            return None
+
+        return entry[2], vars
+
+    def compile(self, component, vars):
+        """
+        routine for compiling the function of a constraint or objective
+
+        Parameters
+        ----------
+        component : pyomo constraint/objective object
+            representing the function of interest.
+        vars : list
+            containing the pyomo variables in the order of the columns of the
+            points.
+
+        Raises
+        ------
+        NotImplementedError
+            if the expression contains nodes which cannot be translated.
+
+        Returns
+        -------
+        function : function
+            mapping an (N, n) array of points to the N function values.
+
+        """
+
+        entry = self.cached(component)
+        if entry is not None and len(entry[1]) == len(vars)\
+                and all(v is w for v, w in zip(entry[1], vars)):
+            return entry[0]
+
+        expr = component_expression(component)
+        source, volatile = expression_source(expr, {id(v): j for j, v in enumerate(vars)})
+
+        if not source in self.functions:
+            namespace = {'np': np}
+            exec('def function(X):\n    return ' + source + '\n', namespace)
+            self.functions[source] = namespace['function']
+        function = self.functions[source]
+
+        if not volatile:
+            # objectives are not hashable, hence the components are keyed by
+            # their id and dropped together with their models
+            key = id(component)
+            self.components[key] = (weakref.ref(component, lambda r: self.components.pop(key, None)),
+                                    (id(expr), type(expr), expr.nargs()),
+                                    [weakref.ref(v) for v in vars],
+                                    function)
+
+        return function
+
+    def evaluate(self, component, vars, points):
+        """
+        routine for evaluating the function of a constraint or objective at
+        all rows of 'points'
+
+        Parameters
+        ----------
+        component : pyomo constraint/objective object
+            representing the function of interest.
+        vars : list
+            containing the pyomo variables in the order of the columns of
+            'points'.
+        points : ndarray
+            representing the points as rows of an (N, n) array.
+
+        Returns
+        -------
+        values : ndarray
+            representing the N function values.
+
+        """
+
+        points = np.asarray(points, dtype=float).reshape(-1, len(vars))
+
+        try:
+            function = self.compile(component, vars)
+        except NotImplementedError:
+            # evaluate untranslatable functions with pyomo
+            return pyomo_values(component, vars, points)
+
+        # points outside the domain of a function, e.g., of a logarithm, are
+        # evaluated by pyomo, which raises the corresponding error
+        try:
+            with np.errstate(divide='raise', over='raise', invalid='raise', under='ignore'):
+                values = function(points)
+        except FloatingPointError:
+            return pyomo_values(component, vars, points)
+
+        return np.broadcast_to(np.asarray(values, dtype=float), (len(points),)).copy()
+
+    def current_value(self, component):
+        """
+        routine for evaluating the function of a constraint or objective at
+        the current values of its variables
+
+        """
+
+        entry = self.cached(component)
+        if entry is not None:
+            vars = entry[1]
+        else:
+            vars = list(identify_variables(component_expression(component)))
+
+        point = [v.value for v in vars]
+        if None in point:
+            return value(component)
+
+        return float(self.evaluate(component, vars, np.array([point]))[0])
+
+
+# compiler shared by all routines evaluating the nonlinear functions
+expression_compiler = ExpressionCompiler()
@@ -11,11 +11,160 @@ from pyomo.environ import *
 import copy as cp
 import numpy as np
 
+from compiled_expressions import *
+
+
+# strategies for choosing the points of the least square fit
+SAMPLING_STRATEGIES = ['auto', 'corners', 'random', 'orthogonal', 'halton']
+
+
+class LeastSquareSampling():
+    """
+    choice of the points of a box the least square weight is fitted to
+
+    'corners' uses all 2^n corners, 'random' a fixed number of randomly
+    chosen corners, 'orthogonal' the corners given by the rows of a two-level
+    orthogonal array of strength 3 (columns of a Sylvester-Hadamard matrix)
+    and 'halton' a low-discrepancy design in the interior of the box. 'auto'
+    uses all corners up to 'corner_limit' variables and the orthogonal array
+    beyond. Every choice yields a valid relaxation since the estimation errors
+    are computed for the fitted weight. Random points are seeded by the box,
+    such that the weight of a box does not depend on the order of computation
+
+    """
+
+    def __init__(self, strategy='auto', samples=64, corner_limit=8):
+        self.configure(strategy, samples, corner_limit)
+
+    def configure(self, strategy='auto', samples=64, corner_limit=8):
+        """
+        routine for setting the sampling strategy
+
+        Parameters
+        ----------
+        strategy : str, optional
+            representing the strategy, one of 'SAMPLING_STRATEGIES'. The
+            default is 'auto'.
+        samples : int, optional
+            representing the number of points of the 'random' and 'halton'
+            strategies and the minimal number of rows of the orthogonal
+            array. The default is 64.
+        corner_limit : int, optional
+            representing the maximal number of variables for which 'auto'
+            uses all corners. The default is 8.
+
+        Raises
+        ------
+        ValueError
+            if the strategy is unknown.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        if not strategy in SAMPLING_STRATEGIES:
+            raise ValueError('Unknown least square sampling strategy ' + str(strategy))
+
+        self.strategy = strategy
+        self.samples = samples
+        self.corner_limit = corner_limit
+
+    def points(self, lbs, ubs):
+        """
+        routine for returning the points of the box [lbs, ubs] the least
+        square weight is fitted to
+
+        Parameters
+        ----------
+        lbs : ndarray
+            representing the lower bounds of the box.
+        ubs : ndarray
+            representing the upper bounds of the box.
+
+        Returns
+        -------
+        points : ndarray
+            representing the points as rows.
+
+        """
+
+        n = len(lbs)
+        strategy = self.strategy
+        if strategy == 'auto':
+            strategy = 'corners' if n <= self.corner_limit else 'orthogonal'
+
+        if strategy == 'corners':
+            idx = np.arange(1 << n)[:, None]
+            bits = (idx >> np.arange(n)) & 1
+
+        elif strategy == 'random':
+            seed = np.frombuffer(np.concatenate((lbs, ubs)).tobytes(), dtype=np.uint32)
+            rng = np.random.default_rng(seed)
+            bits = rng.integers(0, 2, (self.samples, n))
+
+        elif strategy == 'orthogonal':
+            # entry (i, j) of a Sylvester-Hadamard matrix is the parity of the
+            # common bits of i and j. Columns j with an odd number of bits
+            # form an array of strength 3, i.e., products of two variables
+            # are orthogonal to all variables and do not bias the weight
+            rows = 1 << int(np.ceil(np.log2(max(2 * n, self.samples))))
+            columns = [j for j in range(1, rows) if bin(j).count('1') % 2 == 1][:n]
+            bits = parity(np.arange(rows)[:, None] & np.array(columns, dtype=int))
+
+        else:
+            return lbs + (ubs - lbs) * halton_sequence(self.samples, n)
+
+        return np.where(bits, ubs, lbs)
+
+
+def parity(array):
+    # parity of the number of bits of every entry of an integer array
+    bits = np.zeros(array.shape, dtype=int)
+    while array.any():
+        bits ^= array & 1
+        array = array >> 1
+
+    return bits
+
+
+def halton_sequence(number_of_points, n):
+    """
+    routine for the first 'number_of_points' points of the n-dimensional
+    Halton sequence in the unit cube, skipping the origin
+
+    """
+
+    # first n primes as bases
+    primes = []
+    candidate = 2
+    while len(primes) < n:
+        if all(candidate % p != 0 for p in primes):
+            primes.append(candidate)
+        candidate += 1
+
+    points = np.zeros((number_of_points, n))
+    for j, base in enumerate(primes):
+        index = np.arange(1, number_of_points + 1)
+        factor = 1.0
+        while index.any():
+            factor /= base
+            points[:, j] += factor * (index % base)
+            index = index // base
+
+    return points
+
+
+# sampling shared by all least square fits
+least_square_sampling = LeastSquareSampling()
+
 
 def compute_least_square_weight(cons, vars, info):
     """
     routine for computing the least square weight of a linear function with
-    respect to the corner points of a variable domain box and a constraint
+    respect to the points of a variable domain box chosen by
+    'least_square_sampling', e.g., its corner points, and a constraint
     function
 
     Parameters
@@ -43,26 +192,15 @@ def compute_least_square_weight(cons, vars, info):
     lbs = np.array([min(info[v.name]) for v in vars], dtype=float)
     ubs = np.array([max(info[v.name]) for v in vars], dtype=float)
     
-    # generate all 2^n corner points
-    P = 1 << n
-    idx = np.arange(P)[:, None]
-    bits = (idx >> np.arange(n)) & 1
-    corners = np.where(bits, ubs, lbs)
+    # generate the points of the fit, e.g., all 2^n corner points
+    points = least_square_sampling.points(lbs, ubs)
+    P = len(points)
     
     # build matrix
-    A = np.hstack((corners, np.ones((P, 1))))
-    
-    # evaluate b by fixing each corner
-    b = np.empty(P, dtype=float)
-    for i in range(P):
-        # assign corner i
-        for j, v in enumerate(vars):
-            v.fix(corners[i, j], skip_validation=True)
-        b[i] = value(cons)
+    A = np.hstack((points, np.ones((P, 1))))
     
-    # unfix all variables
-    for v in vars:
-        v.unfix()
+    # evaluate b at all points at once by the compiled function
+    b = expression_compiler.evaluate(cons, vars, points)
         
     # solve least squares, fallback to all-ones on failure
     try:
@@ -9,6 +9,8 @@ Created on Thu Jun 27 16:31:32 2024
 import sys
 
 from pyomo.environ import *
+from error_bound_tiers import *
+from error_subproblems import *
 from rounding_routines import *
 
 def compute_overest_error(call_model, cons, var_list, info, time_limit):
@@ -38,37 +40,13 @@ def compute_overest_error(call_model, cons, var_list, info, time_limit):
 
     """
     
-    # catch weight
-    weight = info['weight']
-    
-    # set up small model
-    small_model = ConcreteModel()
-    
-    # set up dummy model
-    dummy = call_model(0)
-    
-    # introduce relevant variables
-    for v in var_list:
-        for v_dummy in dummy.component_objects(Var):
-            if v.name == v_dummy.name:
-                dummy.del_component(v_dummy)
-                small_model.add_component(v_dummy.name, v_dummy)
-                break
-            
-    # initialize objective
-    for c_dummy in dummy.component_objects(Constraint):
-        if cons.name == c_dummy.name:
-            dummy.del_component(c_dummy)
-            small_model.objective = Objective(expr = c_dummy.body)
-            break
-    
-    # substract linear function from objective
-    for v in small_model.component_objects(Var):
-        v.lb = min(info[v.name])
-        v.ub = max(info[v.name])
-        small_model.objective.expr += -weight[v.name] * v
+    # try the cheap error bounds before solving the subproblem globally
+    overest_error = error_bound_tiers.bound(cons, var_list, info, -1)
+    if overest_error is not None:
+        return rounding_upper(overest_error, 5)
 
-    small_model.objective.expr += - weight['constant']
+    # catch the small model of the subproblem on the current box
+    small_model = error_subproblems.model(call_model, cons, var_list, 1, minimize, info)
 
     # solve the model and catch optimal value
     opt = SolverFactory('scip')
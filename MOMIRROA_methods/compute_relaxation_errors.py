@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:02:51 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+import numpy as np
+
+from compiled_expressions import *
+
+
+def compute_relaxation_errors(model, relative_constraint_errors=False):
+    """
+    routine for determining the violation of the nonlinear constraints and
+    the approximation error of the nonlinear objectives at the current
+    variable values of a piecewise linear relaxation
+
+    Parameters
+    ----------
+    model : pyomo model
+        representing a piecewise linear relaxation of the problem to be
+        solved with the variable values of its optimal solution.
+    relative_constraint_errors : boolean, optional
+        indicating if the errors should be measured relative to the
+        constraint bounds. The default is False.
+
+    Returns
+    -------
+    relaxation_errors : dict
+        having the constraint/objective names as keys and the corresponding
+        constraint/objective satisfaction errors as values.
+
+    """
+
+    relaxation_errors = {}
+    max_error = 0
+    if relative_constraint_errors:
+        for c in model.component_objects(Constraint):
+            if 'estimation' in c.name or 'active' in c.name:
+                continue
+            if c.body.polynomial_degree() != 1:
+                c_value = expression_compiler.current_value(c)
+                if not 'objective' in c.name:
+                    if c.lb == c.ub:
+                        cons_rel_error = np.abs(c.ub - c_value)/max(np.abs(c.ub),1)
+                        relaxation_errors[c.name] = cons_rel_error
+                        max_error = max(max_error, cons_rel_error)
+                    elif c.lb != None:
+                        cons_rel_error = max(c.lb - c_value,0)/max(np.abs(c.lb),1)
+                        relaxation_errors[c.name] = cons_rel_error
+                        max_error = max(max_error, cons_rel_error)
+                    elif c.ub != None:
+                        cons_rel_error = max(c_value - c.ub,0)/max(np.abs(c.ub),1)
+                        relaxation_errors[c.name] = cons_rel_error
+                        max_error = max(max_error, cons_rel_error)
+                else:
+                    for obj in model.component_objects(Objective):
+                        if c.name in obj.name and 'estimation' in obj.name:
+                            obj_rel_error = np.abs(c_value - value(obj))/max(np.abs(c_value),1)
+                            relaxation_errors[c.name] = obj_rel_error
+                            max_error = max(max_error, obj_rel_error)
+
+    else:
+        for c in model.component_objects(Constraint):
+            if 'estimation' in c.name or 'active' in c.name:
+                continue
+            if c.body.polynomial_degree() != 1:
+                c_value = expression_compiler.current_value(c)
+                if not 'objective' in c.name:
+                    if c.lb == c.ub:
+                        cons_error = np.abs(c.ub - c_value)
+                        relaxation_errors[c.name] = cons_error
+                        max_error = max(max_error, cons_error)
+                    elif c.lb != None:
+                        cons_error = max(c.lb - c_value,0)
+                        relaxation_errors[c.name] = cons_error
+                        max_error = max(max_error, cons_error)
+                    elif c.ub != None:
+                        cons_error = max(c_value - c.ub,0)
+                        relaxation_errors[c.name] = cons_error
+                        max_error = max(max_error, cons_error)
+                else:
+                    for obj in model.component_objects(Objective):
+                        if c.name in obj.name and 'estimation' in obj.name:
+                            obj_error = np.abs(c_value - value(obj))
+                            relaxation_errors[c.name] = obj_error
+                            max_error = max(max_error, obj_error)
+
+    relaxation_errors['max_error'] = max_error
+    return relaxation_errors
\ No newline at end of file
@@ -8,6 +8,8 @@ Created on Thu Jul  4 12:26:56 2024
 
 from pyomo.environ import * 
 
+from error_bound_tiers import *
+from error_subproblems import *
 from rounding_routines import *
 
 def compute_underest_error_objective(call_model, obj, var_list, info, time_limit):
@@ -37,40 +39,14 @@ def compute_underest_error_objective(call_model, obj, var_list, info, time_limit
 
     """
     
-    # catch weight
-    weight = info['weight']
-    
-    # set up small model
-    small_model = ConcreteModel()
-    
-    # set up dummy model
-    dummy = call_model(0)
-    
-    # introduce relevant variables
-    for v in var_list:
-        for v_dummy in dummy.component_objects(Var):
-            if v.name == v_dummy.name:
-                dummy.del_component(v_dummy)
-                small_model.add_component(v_dummy.name, v_dummy)
-                break
-    
-    # initialize objective
-    for o_dummy in dummy.component_objects(Objective):
-        if obj.name == o_dummy.name:
-            dummy.del_component(o_dummy)
-            small_model.objective = Objective(expr = o_dummy.expr)
-            break
-    
-    # substract linear function from objective
-    for v in small_model.component_objects(Var):
-        v.lb = min(info[v.name])
-        v.ub = max(info[v.name])
-        small_model.objective.expr += - weight[v.name] * v
-    
-    small_model.objective.expr += - weight['constant']
-    
-    small_model.objective.sense = maximize
-    
+    # try the cheap error bounds before solving the subproblem globally
+    underest_error = error_bound_tiers.bound(obj, var_list, info, 1)
+    if underest_error is not None:
+        return rounding_upper(underest_error, 5)
+
+    # catch the small model of the subproblem on the current box
+    small_model = error_subproblems.model(call_model, obj, var_list, 1, maximize, info)
+
     # solve the model and catch optimal value
     opt = SolverFactory('scip')
     opt.options['limits/time'] = time_limit
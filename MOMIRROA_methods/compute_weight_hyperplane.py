@@ -8,17 +8,17 @@ Created on Fri Jun 21 15:20:20 2024
 
 import numpy as np
 
-def compute_weight_hyperplane(u, defpois):
+def compute_weight_hyperplane(lub_id, lubs):
     """
     routine for computing weight vector corresponding to connecting hyperplane
     determined by defining points of current search zone local upper bound u
 
     Parameters
     ----------
-    u : array
-        representing current search zone local upper bound.
-    defpois : dict
-        consisting of defining points for any local upper bound.
+    lub_id : int
+        representing the ID of the current search zone local upper bound.
+    lubs : LocalBoundSet
+        consisting of the local upper bounds and their defining points.
 
     Returns
     -------
@@ -28,13 +28,14 @@ def compute_weight_hyperplane(u, defpois):
     """
     
     # catch dimension
-    m = len(u)
+    m = lubs.m
     
     # set up linear system
+    defpois = lubs.defining_points(lub_id)
     A = np.eye(m)
     b = np.ones(m)
     for i in np.arange(0,m):
-        A[i,:] = defpois[str(u)][i][-1]
+        A[i,:] = defpois[i][-1]
         
     # try to solve the system
     try:
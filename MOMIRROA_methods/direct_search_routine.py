@@ -12,8 +12,6 @@ import numpy as np
 import time
 
 from restricted_weighted_sum import *
-from update_llbs import *
-from update_lubs import *
 from update_nondom import *
 
 def direct_search(call_model, u, encl_dict, alpha, options, it, timelimit):
@@ -85,20 +83,11 @@ def direct_search(call_model, u, encl_dict, alpha, options, it, timelimit):
         encl_dict['N'], check = update_nondom(encl_dict['N'], solvec)
         
         if tol:
-            encl_dict['llbs'], encl_dict['Ldefpois'] = update_llbs(
-                encl_dict['llbs'],
-                encl_dict['Ldefpois'],
-                solvec - tol*dir_vec)
+            encl_dict['llbs'].update(solvec - tol*dir_vec)
         else:
-            encl_dict['llbs'], encl_dict['Ldefpois'] = update_llbs(
-                encl_dict['llbs'],
-                encl_dict['Ldefpois'],
-                solvec)
+            encl_dict['llbs'].update(solvec)
             
-        encl_dict['lubs'], encl_dict['Udefpois'] = update_lubs(
-            encl_dict['lubs'],
-            encl_dict['Udefpois'],
-            solvec)
+        encl_dict['lubs'].update(solvec)
         
     # if search zone is empty
     else:
@@ -107,9 +96,6 @@ def direct_search(call_model, u, encl_dict, alpha, options, it, timelimit):
             return encl_dict
         
         print('search zone is empty')
-        encl_dict['llbs'], encl_dict['Ldefpois'] = update_llbs(
-            encl_dict['llbs'],
-            encl_dict['Ldefpois'],
-            u)
+        encl_dict['llbs'].update(u)
         
     return encl_dict
\ No newline at end of file
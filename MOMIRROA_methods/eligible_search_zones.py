@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 09:12:40 2026
+
+@author: moritz
+"""
+
+import numpy as np
+
+def eligible_search_zones(llbs, lubs, dir_vec, tol, lub_ids=None):
+    """
+    vectorized determination of the search zones which still have to be
+    improved, i.e., the lubs for which some llb < lub spans a box whose
+    shortest edge relative to dir_vec exceeds tol
+
+    Parameters
+    ----------
+    llbs : LocalBoundSet
+        representing the current local lower bounds.
+    lubs : LocalBoundSet
+        representing the local upper bounds determining the search zones.
+    dir_vec : array
+        representing the direction of the width measure.
+    tol : float
+        representing the width tolerance.
+    lub_ids : list, optional
+        containing the IDs of the lubs to be checked. The default is None,
+        i.e., all lubs are checked.
+
+    Returns
+    -------
+    zone_ids : list
+        containing the IDs of the eligible lubs in the order of 'lubs'.
+    zone_widths : array
+        representing for every eligible lub the maximal shortest edge of its
+        boxes, e.g., for ordering the search zones.
+
+    """
+
+    dir_vec = np.asarray(dir_vec, dtype=float)
+    if not np.all(dir_vec > 0):
+        raise ValueError('All entries of dir_vec must be > 0')
+
+    if lub_ids is None:
+        ids = lubs.ids
+        U = lubs.bounds
+    else:
+        ids = np.asarray(lub_ids, dtype=np.int64)
+        U = lubs.bounds[[lubs.row(i) for i in ids.tolist()]]
+
+    L = llbs.bounds
+    widths = np.full(len(ids), -np.inf)
+
+    # llbs and lubs sorted by their first component, such that only a prefix
+    # of the llbs can lie below the lubs of a chunk
+    L = L[np.argsort(L[:, 0], kind='stable')]
+    order = np.argsort(U[:, 0], kind='stable')
+
+    # chunks of lubs such that the comparison tensor stays small
+    chunk_size = max(1, 2**20 // max(L.size, 1))
+    for c in range(0, len(ids), chunk_size):
+        Uc = U[order[c:c+chunk_size]]
+        Lc = L[:np.searchsorted(L[:, 0], Uc[:, 0].max(initial=-np.inf), side='left')]
+
+        # boxes llb < lub
+        rows, cols = np.nonzero((Lc[None, :, :] < Uc[:, None, :]).all(axis=2))
+
+        # same shortest edge as in 'shortest_edge' for these boxes
+        s_vals = (np.abs(Uc[rows] - Lc[cols]) / dir_vec[None, :]).min(axis=1)
+
+        chunk_widths = np.full(len(Uc), -np.inf)
+        np.maximum.at(chunk_widths, rows, s_vals)
+        widths[order[c:c+chunk_size]] = chunk_widths
+
+    eligible = tol < widths
+
+    return ids[eligible].tolist(), widths[eligible]
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 14:21:08 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr import identify_variables
+from pyomo.core.expr.numeric_expr import DivisionExpression,\
+    NegationExpression, PowExpression, ProductExpression, SumExpression,\
+    UnaryFunctionExpression
+
+import heapq
+import itertools
+import math
+
+from interval_arithmetic import *
+from relaxation_statistics import *
+
+
+class ErrorBoundTiers():
+    """
+    cheap bounds on the estimation error max s * (f - affine) over a box,
+    which are tried before the error subproblem is solved globally by SCIP
+
+    f is split into additive terms. Variables which only appear in univariate
+    terms of known curvature form separable parts, whose maximum is computed
+    in closed form. The remaining, coupled part is maximized over the vertices
+    of the box if it is multilinear (closed form) and otherwise by an interval
+    branch and bound using the natural interval extension and the mean value
+    form (interval). If the gap of the latter exceeds the tolerance, the
+    subproblem is left to SCIP. The tier of every error is counted in the
+    relaxation statistics
+
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.tolerance = 1e-6
+        self.max_boxes = 500
+
+    def configure(self, enabled, tolerance=1e-6, max_boxes=500):
+        """
+        routine for switching the cheap bounds on or off
+
+        Parameters
+        ----------
+        enabled : bool
+            deciding if the cheap bounds are tried before SCIP.
+        tolerance : float, optional
+            representing the maximal gap of an interval bound to a value
+            attained in the box. The default is 1e-6.
+        max_boxes : int, optional
+            representing the maximal number of boxes of the interval branch
+            and bound. The default is 500.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.enabled = enabled
+        self.tolerance = tolerance
+        self.max_boxes = max_boxes
+
+    def bound(self, component, var_list, info, sign):
+        """
+        routine for bounding the estimation error of the affine function
+        given by info['weight'] w.r.t. the function of 'component' on the box
+        'info'
+
+        Parameters
+        ----------
+        component : pyomo constraint or objective object
+            representing the nonlinear function f.
+        var_list : list
+            containing the pyomo variables appearing in f.
+        info : dict
+            containing all information of the current box of interest.
+        sign : int
+            1 for the underestimation error max f - affine, -1 for the
+            overestimation error max affine - f.
+
+        Returns
+        -------
+        error : float
+            representing an upper bound on the estimation error or None if
+            the error has to be computed by SCIP.
+
+        """
+
+        if not self.enabled:
+            return None
+
+        try:
+            tier, error = self._bound(component, var_list, info, sign)
+        except (NotImplementedError, ArithmeticError, ValueError, KeyError, TypeError):
+            tier, error = 'scip', None
+
+        count_statistic('error bounds ' + tier)
+
+        return error
+
+    def _bound(self, component, var_list, info, sign):
+        if component.ctype is Constraint:
+            expr = component.body
+        else:
+            expr = component.expr
+
+        weight = info['weight']
+        index = {id(v): i for i, v in enumerate(var_list)}
+        integer = [v.is_integer() for v in var_list]
+        box = []
+        for v, discrete in zip(var_list, integer):
+            lo, hi = float(min(info[v.name])), float(max(info[v.name]))
+            if discrete:
+                lo, hi = float(math.ceil(lo)), float(math.floor(hi))
+            if lo > hi:
+                raise ValueError('empty box')
+            box.append((lo, hi))
+
+        # g = sign * (f - affine) = constant + linear + terms
+        terms = []
+        constant = split_terms(expr, sign, terms)
+        constant -= sign * float(weight['constant'])
+        linear = [-sign * float(weight[v.name]) for v in var_list]
+
+        univariate = {i: [] for i in range(len(var_list))}
+        coupled = set()
+        nonlinear = []
+        for coef, node in terms:
+            positions = [index[id(v)] for v in identify_variables(node, include_fixed=False)]
+            if node.is_variable_type():
+                linear[positions[0]] += coef
+            elif len(positions) == 1:
+                univariate[positions[0]].append((coef, node))
+            else:
+                coupled |= set(positions)
+                nonlinear.append((coef, node))
+
+        # separable parts in closed form
+        separable = 0.0
+        for i in range(len(var_list)):
+            if i in coupled:
+                continue
+            upper = univariate_maximum(univariate[i], linear[i], box[i], integer[i])
+            if upper is None:
+                coupled.add(i)
+            else:
+                separable += upper
+
+        coupled = sorted(coupled)
+        for i in coupled:
+            nonlinear += univariate[i]
+
+        if len(coupled) == 0:
+            return 'closed form', constant + separable
+
+        def point(x):
+            return sum(coef * point_value(node, index, x) for coef, node in nonlinear)\
+                + sum(linear[i] * x[i] for i in coupled)
+
+        # multilinear coupled part attains its maximum at a vertex
+        if len(coupled) <= 12 and all(is_multilinear(node) for coef, node in nonlinear):
+            x = [lo for lo, hi in box]
+            upper = -math.inf
+            for vertex in itertools.product(*[box[i] for i in coupled]):
+                for i, xi in zip(coupled, vertex):
+                    x[i] = xi
+                upper = max(upper, point(x))
+            return 'closed form', constant + separable + upper
+
+        upper = self.branch_and_bound(point, nonlinear, linear, index, box, integer, coupled)
+        if upper is None:
+            return 'scip', None
+
+        # margin for the rounding errors of the interval operations
+        upper += 1e-10 * (1 + abs(upper))
+
+        return 'interval', constant + separable + upper
+
+    def branch_and_bound(self, point, nonlinear, linear, index, box, integer, coupled):
+        """
+        routine for maximizing the coupled part over the box by interval
+        branch and bound, returns None if the gap exceeds the tolerance within
+        the maximal number of boxes
+
+        """
+
+        def upper_bound(X):
+            lo, hi, gradient = 0.0, 0.0, {i: [linear[i], linear[i]] for i in coupled}
+            for coef, node in nonlinear:
+                a, ga = interval_gradient(node, index, X)
+                a = interval_mul((coef, coef), a)
+                lo, hi = lo + a[0], hi + a[1]
+                for i, g in ga.items():
+                    g = interval_mul((coef, coef), g)
+                    gradient[i][0] += g[0]
+                    gradient[i][1] += g[1]
+            hi += sum(max(linear[i] * X[i][0], linear[i] * X[i][1]) for i in coupled)
+
+            # mean value form around the midpoint
+            c = [(l + u) / 2 for l, u in X]
+            try:
+                mean_value = point(c) + sum(max(interval_mul(gradient[i], (X[i][0] - c[i], X[i][1] - c[i])))
+                                            for i in coupled)
+            except (ArithmeticError, ValueError, NotImplementedError):
+                mean_value = math.inf
+            upper = min(hi, mean_value)
+            if math.isnan(upper):
+                upper = math.inf
+
+            # attained value at the (rounded) midpoint
+            x = [round(ci) if d else ci for ci, d in zip(c, integer)]
+            try:
+                lower = point(x)
+            except (ArithmeticError, ValueError, NotImplementedError):
+                lower = -math.inf
+
+            return upper, lower
+
+        counter = itertools.count()
+        upper, best = upper_bound(box)
+        heap = [(-upper, next(counter), box)]
+        boxes = 1
+        while len(heap) > 0:
+            upper = -heap[0][0]
+            if upper - best <= self.tolerance:
+                return max(upper, best)
+            if boxes >= self.max_boxes:
+                return None
+
+            X = heapq.heappop(heap)[2]
+
+            # bisect the widest coupled dimension
+            widths = [(X[i][1] - X[i][0], i) for i in coupled
+                      if X[i][1] - X[i][0] >= (1 if integer[i] else 1e-12)]
+            if len(widths) == 0:
+                continue
+            d = max(widths)[1]
+            lo, hi = X[d]
+            if integer[d]:
+                middle = math.floor((lo + hi) / 2)
+                parts = [(lo, float(middle)), (float(middle) + 1, hi)]
+            else:
+                middle = (lo + hi) / 2
+                parts = [(lo, middle), (middle, hi)]
+
+            for part in parts:
+                Y = list(X)
+                Y[d] = part
+                child_upper, child_lower = upper_bound(Y)
+                best = max(best, child_lower)
+                child_upper = min(child_upper, upper)
+                if child_upper > best:
+                    heapq.heappush(heap, (-child_upper, next(counter), Y))
+                boxes += 1
+
+        return best
+
+
+# tiers shared by all error computations
+error_bound_tiers = ErrorBoundTiers()
+
+
+def split_terms(expr, coef, terms):
+    """
+    routine for splitting coef * expr into additive terms, i.e., appending
+    the nonconstant terms as (coefficient, node) to 'terms' and returning the
+    constant part
+
+    """
+
+    if type(expr) in native_numeric_types or not expr.is_potentially_variable():
+        return coef * float(value(expr))
+
+    if expr.is_named_expression_type():
+        return split_terms(expr.expr, coef, terms)
+
+    if isinstance(expr, SumExpression):
+        return sum(split_terms(arg, coef, terms) for arg in expr.args)
+
+    if isinstance(expr, NegationExpression):
+        return split_terms(expr.args[0], -coef, terms)
+
+    if isinstance(expr, ProductExpression):
+        for a, b in [expr.args, reversed(expr.args)]:
+            if type(a) in native_numeric_types or not a.is_potentially_variable():
+                return split_terms(b, coef * float(value(a)), terms)
+
+    if isinstance(expr, DivisionExpression):
+        b = expr.args[1]
+        if type(b) in native_numeric_types or not b.is_potentially_variable():
+            return split_terms(expr.args[0], coef / float(value(b)), terms)
+
+    terms.append((coef, expr))
+
+    return 0.0
+
+
+def is_multilinear(expr):
+    """
+    routine for checking if 'expr' is a product of factors which are affine in
+    pairwise distinct variables, i.e., affine in every single variable
+
+    """
+
+    factors = [expr]
+    variables = set()
+    while len(factors) > 0:
+        factor = factors.pop()
+        if isinstance(factor, ProductExpression):
+            factors += list(factor.args)
+        elif isinstance(factor, NegationExpression):
+            factors.append(factor.args[0])
+        elif type(factor) in native_numeric_types or not factor.is_potentially_variable():
+            continue
+        elif factor.polynomial_degree() == 1:
+            ids = [id(v) for v in identify_variables(factor, include_fixed=False)]
+            if len(ids) != 1 or ids[0] in variables:
+                return False
+            variables.add(ids[0])
+        else:
+            return False
+
+    return True
+
+
+def univariate_atom(node):
+    """
+    routine for writing the univariate node as h(alpha * x + beta) for a
+    function h of known curvature, returns (h, p, alpha, beta) or None
+
+    """
+
+    if isinstance(node, PowExpression):
+        inner, p = node.args
+        if not (type(p) in native_numeric_types or not p.is_potentially_variable()):
+            return None
+        h, p = 'pow', float(value(p))
+    elif isinstance(node, DivisionExpression):
+        a, inner = node.args
+        if not (type(a) in native_numeric_types or not a.is_potentially_variable()):
+            return None
+        h, p = 'reciprocal', float(value(a))
+    elif isinstance(node, UnaryFunctionExpression)\
+            and node.getname() in ['exp', 'log', 'sqrt', 'sin', 'cos']:
+        inner, h, p = node.args[0], node.getname(), None
+    else:
+        return None
+
+    if type(inner) in native_numeric_types or inner.polynomial_degree() != 1:
+        return None
+
+    # affine inner function from two evaluations
+    v = next(iter(identify_variables(inner, include_fixed=False)))
+    index = {id(v): 0}
+    beta = point_value(inner, index, [0.0])
+    alpha = point_value(inner, index, [1.0]) - beta
+
+    return h, p, alpha, beta
+
+
+def atom_value(atom, x, derivative=False):
+    """
+    routine for evaluating h(alpha * x + beta) or its derivative w.r.t. x
+
+    """
+
+    h, p, alpha, beta = atom
+    u = alpha * x + beta
+
+    if h == 'pow':
+        if derivative:
+            try:
+                return alpha * p * u**(p - 1)
+            except ZeroDivisionError:
+                return math.copysign(math.inf, alpha * p)
+        return u**p
+    if h == 'reciprocal':
+        return -alpha * p / u**2 if derivative else p / u
+    if h == 'exp':
+        return alpha * math.exp(u) if derivative else math.exp(u)
+    if h == 'log':
+        return alpha / u if derivative else math.log(u)
+    if h == 'sqrt':
+        if derivative:
+            return alpha * 0.5 / math.sqrt(u) if u > 0 else math.copysign(math.inf, alpha)
+        return math.sqrt(u)
+    if h == 'sin':
+        return alpha * math.cos(u) if derivative else math.sin(u)
+    if h == 'cos':
+        return -alpha * math.sin(u) if derivative else math.cos(u)
+
+
+def atom_curvature(atom, interval):
+    """
+    routine for determining the curvature of h on 'interval', i.e., 1 for
+    convex, -1 for concave, 0 for affine and None if it is unknown or h is not
+    defined on the whole interval
+
+    """
+
+    h, p, alpha, beta = atom
+    lo, hi = sorted([alpha * interval[0] + beta, alpha * interval[1] + beta])
+
+    if h == 'pow':
+        if p == 0 or p == 1:
+            return 0
+        if float(p).is_integer():
+            if p > 0:
+                if p % 2 == 0 or lo >= 0:
+                    return 1
+                return -1 if hi <= 0 else None
+            if lo > 0:
+                return 1
+            if hi < 0:
+                return 1 if p % 2 == 0 else -1
+            return None
+        if lo < 0 or (p < 0 and lo == 0):
+            return None
+        return 1 if p > 1 or p < 0 else -1
+    if h == 'reciprocal':
+        if lo > 0:
+            return 1 if p > 0 else -1
+        if hi < 0:
+            return -1 if p > 0 else 1
+        return None
+    if h == 'exp':
+        return 1
+    if h == 'log':
+        return -1 if lo > 0 else None
+    if h == 'sqrt':
+        return -1 if lo >= 0 else None
+    if h in ['sin', 'cos']:
+        values = interval_sin((lo, hi)) if h == 'sin'\
+            else interval_sin((lo + math.pi/2, hi + math.pi/2))
+        if values[0] >= 0:
+            return -1
+        if values[1] <= 0:
+            return 1
+        return None
+
+
+def univariate_maximum(parts, slope, interval, integer):
+    """
+    routine for maximizing sum(coef * node) + slope * x over 'interval' in
+    closed form, i.e., at the endpoints for convex functions and at the root
+    of the derivative for concave functions. For continuous x the value at the
+    root is lifted by the tangent, such that the result is an upper bound even
+    if the root is only approximated
+
+    Returns
+    -------
+    upper : float
+        representing an upper bound on the maximum or None if the curvature of
+        the function is unknown.
+
+    """
+
+    atoms = []
+    curvatures = set()
+    for coef, node in parts:
+        atom = univariate_atom(node)
+        if atom is None:
+            return None
+        curvature = atom_curvature(atom, interval)
+        if curvature is None:
+            return None
+        atoms.append((coef, atom))
+        curvatures.add(curvature * (1 if coef > 0 else -1))
+
+    def G(x, derivative=False):
+        return sum(coef * atom_value(atom, x, derivative) for coef, atom in atoms)\
+            + (slope if derivative else slope * x)
+
+    lo, hi = interval
+    if -1 not in curvatures:
+        return max(G(lo), G(hi))
+    if 1 in curvatures:
+        return None
+
+    # concave: the derivative is decreasing
+    if G(lo, True) <= 0:
+        root = lo
+    elif G(hi, True) >= 0:
+        root = hi
+    else:
+        a, b = lo, hi
+        for k in range(100):
+            root = (a + b) / 2
+            if G(root, True) > 0:
+                a = root
+            else:
+                b = root
+
+    if integer:
+        candidates = {min(max(c, lo), hi) for c in [math.floor(root), math.ceil(root)]}
+        return max(G(c) for c in candidates)
+
+    if root in [lo, hi]:
+        return G(root)
+
+    derivative = G(root, True)
+    return G(root) + max(derivative * (lo - root), derivative * (hi - root))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 27 08:41:19 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+
+
+class ErrorSubproblems():
+    """
+    cache of the small models of the estimation error subproblems, one per
+    nonlinear constraint/objective and kind of estimation
+
+    a small model is built once from 'call_model' and holds the affine
+    function of a box as mutable parameters, hence a new box only changes
+    the parameter values and the variable bounds
+
+    """
+
+    def __init__(self):
+        self.models = {}
+
+    def clear(self):
+        """
+        routine for dropping all small models, e.g., when a new problem is
+        solved
+
+        """
+
+        self.models = {}
+
+    def build(self, call_model, component, var_list, factor, sense):
+        # small model minimizing/maximizing factor * (f - w^T x - w_0)
+        small_model = ConcreteModel()
+
+        # set up dummy model
+        dummy = call_model(0)
+
+        # introduce relevant variables
+        names = []
+        for v in var_list:
+            for v_dummy in dummy.component_objects(Var):
+                if v.name == v_dummy.name:
+                    dummy.del_component(v_dummy)
+                    small_model.add_component(v_dummy.name, v_dummy)
+                    names.append(v_dummy.name)
+                    break
+
+        small_model.estimation_weight = Param(names, mutable=True, initialize=0)
+        small_model.estimation_constant = Param(mutable=True, initialize=0)
+
+        # initialize objective
+        for c_dummy in dummy.component_objects(component.ctype):
+            if component.name == c_dummy.name:
+                dummy.del_component(c_dummy)
+                if component.ctype is Constraint:
+                    expr = c_dummy.body
+                else:
+                    expr = c_dummy.expr
+                break
+
+        if factor != 1:
+            expr = factor * expr
+        small_model.objective = Objective(expr = expr, sense = sense)
+
+        # add the affine function
+        for name in names:
+            small_model.objective.expr += small_model.estimation_weight[name] * small_model.component(name)
+
+        small_model.objective.expr += small_model.estimation_constant
+
+        return small_model, names
+
+    def model(self, call_model, component, var_list, factor, sense, info):
+        """
+        routine for returning the small model of the error subproblem of
+        'component' on the box 'info'
+
+        Parameters
+        ----------
+        call_model : function
+            returning a pyomo model of the problem to be solved.
+        component : pyomo constraint/objective object
+            representing the nonlinear function of interest.
+        var_list : list
+            containing pyomo variable objects appearing in the function of
+            interest.
+        factor : int
+            representing the factor, 1 or -1, of the difference of the
+            function and the affine function in the objective.
+        sense : int
+            representing the sense of the objective, i.e., minimize or
+            maximize.
+        info : dict
+            containing all information of the current box of interest.
+
+        Returns
+        -------
+        small_model : pyomo model
+            representing the error subproblem on the box.
+
+        """
+
+        key = (call_model, component.name, component.ctype.__name__, factor, sense)
+        if not key in self.models:
+            self.models[key] = self.build(call_model, component, var_list, factor, sense)
+        small_model, names = self.models[key]
+
+        # set the affine function and the bounds of the box
+        weight = info['weight']
+        for name in names:
+            v = small_model.component(name)
+            v.setlb(min(info[name]))
+            v.setub(max(info[name]))
+            small_model.estimation_weight[name] = -factor * weight[name]
+
+        small_model.estimation_constant = -factor * weight['constant']
+
+        return small_model
+
+
+# small models shared by all estimation error computations
+error_subproblems = ErrorSubproblems()
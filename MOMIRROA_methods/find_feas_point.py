@@ -10,9 +10,8 @@ from pyomo.environ import *
 
 import numpy as np
 
+from record_zone_event import *
 from restricted_weighted_sum_feas import *
-from update_llbs import *
-from update_lubs import *
 from update_lub_rel_info import *
 from update_nondom import *
 
@@ -77,13 +76,8 @@ def find_feas_point(call_model, encl_dict, u, alpha, options, info, it):
         # update set of potentially nondominated points
         encl_dict['N'], check = update_nondom(encl_dict['N'], solvec)
         
-        old_lubs = cp.deepcopy(encl_dict['lubs'])
-        
         # update set of lubs
-        encl_dict['lubs'], encl_dict['Udefpois'] = update_lubs(
-            encl_dict['lubs'],
-            encl_dict['Udefpois'],
-            solvec)
+        encl_dict['lubs'].update(solvec)
         
         # eventually enforce bound tightening in next refinement step
         if enforced_BT:
@@ -93,19 +87,22 @@ def find_feas_point(call_model, encl_dict, u, alpha, options, info, it):
         encl_dict['lub_relaxation_information'] = update_lub_rel_info(
             encl_dict,
             info,
-            u,
-            old_lubs)
+            u)
+        
+        record_zone_event(encl_dict, 'nondom', solvec, info, u)
         
         improved = True
     
     # if search zone is empty
     else:
         print('search zone is empty')
-        encl_dict['llbs'], encl_dict['Ldefpois'] = update_llbs(
-            encl_dict['llbs'],
-            encl_dict['Ldefpois'],
+        encl_dict['llbs'].update(
             u - encl_dict['factor_delta'] * encl_dict['dir_vec'])
 
+        record_zone_event(encl_dict,
+                          'llb',
+                          u - encl_dict['factor_delta'] * encl_dict['dir_vec'])
+
         improved = True
         
     return encl_dict, info, improved
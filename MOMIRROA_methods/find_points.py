@@ -8,11 +8,11 @@ Created on Fri Jun 28 15:18:46 2024
 
 from pyomo.environ import *
 
+from bound_store import *
 from rebuild_utopian_llbs import *
+from record_zone_event import *
 from refinement_routine import *
 from restricted_reduced_weighted_sum import *
-from update_llbs import *
-from update_lubs import *
 from update_lub_rel_info import *
 from update_nondom import *
 from update_utopian import *
@@ -88,29 +88,21 @@ def find_points(call_model, y, solution, relaxation_errors, encl_dict, u, alpha,
             encl_dict = rebuild_utopian_llbs(encl_dict, y)
             
         else:
-            encl_dict['llbs'], encl_dict['Ldefpois'] = update_llbs(
-                encl_dict['llbs'],
-                encl_dict['Ldefpois'],
-                y)
+            encl_dict['llbs'].update(y)
         
         # update set of potentially nondominated points
         encl_dict['N'], check = update_nondom(encl_dict['N'], y)
         
-        # secure old lub dict
-        old_lubs = cp.deepcopy(encl_dict['lubs'])
-        
         # update set of lubs
-        encl_dict['lubs'], encl_dict['Udefpois'] = update_lubs(
-            encl_dict['lubs'],
-            encl_dict['Udefpois'],
-            y)
+        encl_dict['lubs'].update(y)
         
         # update lub relaxation information
         encl_dict['lub_relaxation_information'] = update_lub_rel_info(
             encl_dict,
             info,
-            u,
-            old_lubs)
+            u)
+        
+        record_zone_event(encl_dict, 'feasible', y, info, u)
         
         encl_dict['analysis'][str(it)]['# of considered feasible'] += 1
         
@@ -123,6 +115,7 @@ def find_points(call_model, y, solution, relaxation_errors, encl_dict, u, alpha,
         # check if relaxed solution improves utopians
         if check == 0:
             print('relaxed image point does not improve utopians --> refine')
+            record_zone_event(encl_dict, 'utopian', y)
             
             info, tighten_time, tighten_counter = refinement_routine(
                 call_model,
@@ -135,13 +128,15 @@ def find_points(call_model, y, solution, relaxation_errors, encl_dict, u, alpha,
         
             encl_dict['analysis'][str(it)]['time bound tightening'] += tighten_time
             encl_dict['analysis'][str(it)]['# of OBBT MILPs'] += tighten_counter
+            
+            # keep the tightened bounds for nested search zones
+            store_bounds(encl_dict, u, info)
             improved = False
         
         else:
-            encl_dict['llbs'], encl_dict['Ldefpois'] = update_llbs(
-                encl_dict['llbs'],
-                encl_dict['Ldefpois'],
-                y)
+            encl_dict['llbs'].update(y)
+            
+            record_zone_event(encl_dict, 'utopian_llb', y)
             
             solvec, feasible_solution, sol_time = restricted_reduced_weighted_sum(
                 call_model,
@@ -161,21 +156,16 @@ def find_points(call_model, y, solution, relaxation_errors, encl_dict, u, alpha,
                 # update set of potentially nondominated points
                 encl_dict['N'], check = update_nondom(encl_dict['N'], solvec)
                 
-                # secure old lub dict
-                old_lubs = cp.deepcopy(encl_dict['lubs'])
-                
                 # update set of lubs
-                encl_dict['lubs'], encl_dict['Udefpois'] = update_lubs(
-                    encl_dict['lubs'],
-                    encl_dict['Udefpois'],
-                    solvec)
+                encl_dict['lubs'].update(solvec)
                 
                 # update lub relaxation information
                 encl_dict['lub_relaxation_information'] = update_lub_rel_info(
                     encl_dict,
                     info,
-                    u,
-                    old_lubs)
+                    u)
+                
+                record_zone_event(encl_dict, 'nondom', solvec, info, u)
                 
                 improved = True
 
@@ -193,6 +183,9 @@ def find_points(call_model, y, solution, relaxation_errors, encl_dict, u, alpha,
                 
                 encl_dict['analysis'][str(it)]['time bound tightening'] += tighten_time
                 encl_dict['analysis'][str(it)]['# of OBBT MILPs'] += tighten_counter
+                
+                # keep the tightened bounds for nested search zones
+                store_bounds(encl_dict, u, info)
                 improved = False                
             
         
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 08:52:37 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr import identify_variables
+
+import numpy as np
+import sys
+
+from box_encoding import *
+from box_info_pool import *
+from calculate_box_info import *
+from calculate_box_info_objective import *
+
+
+class IncrementalRelaxation():
+    """
+    piecewise linear relaxation suitable for minimization which stays alive
+    across refinement steps
+
+    every box of a partition is represented by its own block holding the
+    activation and estimation constraints together with one entry of the
+    indexed binary variable of the partition. Synchronizing the relaxation
+    with a new assignment of the relaxation information only touches the
+    boxes which were added, removed or changed
+
+    """
+
+    def __init__(self, call_model, timelimit):
+        """
+        routine for setting up the original model whose nonlinear constraints
+        and objectives are replaced by box partitions
+
+        Parameters
+        ----------
+        call_model : function
+            returning a pyomo model of the problem to be solved.
+        timelimit : float
+            representing the time limit for computing missing box information.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.call_model = call_model
+        self.timelimit = timelimit
+
+        self.model = call_model(0)
+
+        # catch nonlinear constraints and objectives
+        self.functions = {}
+        for c in [c for c in self.model.component_objects(Constraint) if c.body.polynomial_degree() != 1]:
+            self.functions[c.name] = {'component': c,
+                                      'vars': list(identify_variables(c.body)),
+                                      'objective': False}
+            c.deactivate()
+
+        for o in [o for o in self.model.component_objects(Objective) if o.expr.polynomial_degree() != 1]:
+            self.functions[o.name] = {'component': o,
+                                      'vars': list(identify_variables(o.expr)),
+                                      'objective': True}
+
+        # introduce box sets and binaries for each function
+        for name, function in self.functions.items():
+            box_set = Set(initialize=[], ordered=True)
+            self.model.add_component(name+'_box_set', box_set)
+            binaries = Var(box_set, within=Binary)
+            self.model.add_component(name+'_box_binaries', binaries)
+
+            function['box_set'] = box_set
+            function['binaries'] = binaries
+            function['built'] = {}
+
+        # replace nonlinear objectives by deactivated constraints
+        for name, function in self.functions.items():
+            if function['objective']:
+                o = function['component']
+                estimator = Objective(expr=0)
+                self.model.add_component('underestimation_of_'+name, estimator)
+                if not o.active:
+                    estimator.deactivate()
+
+                self.model.del_component(o)
+                constraint = Constraint(expr=o.expr <= 0)
+                self.model.add_component(name, constraint)
+                constraint.deactivate()
+
+                function['component'] = constraint
+                function['estimator'] = estimator
+
+    def update(self, info):
+        """
+        routine for synchronizing the relaxation with the relaxation
+        information 'info' such that only changed boxes are rebuilt
+
+        Parameters
+        ----------
+        info : dict
+            containing all information for setting up the current piecewise
+            linear relaxation of the problem of interest.
+
+        Returns
+        -------
+        model : pyomo model
+            representing the piecewise linear relaxation of the original
+            problem of interest.
+        info : dict
+            containing all information for setting up the current piecewise
+            linear relaxation of the problem of interest.
+        box_counter : int
+            representing the number of preimage set boxes appearing in the
+            current piecewise linear relaxation.
+
+        """
+
+        box_counter = 0
+
+        # compute missing information of all boxes at once
+        info = precompute_box_info([(function['component'],
+                                     function['vars'],
+                                     'objective_min' if function['objective'] else 'constraint')
+                                    for function in self.functions.values()],
+                                   self.call_model,
+                                   info,
+                                   self.timelimit)
+
+        for name, function in self.functions.items():
+            vars = function['vars']
+            built = function['built']
+            changed = False
+
+            # drop boxes which are not reasonable for discrete variables
+            boxes = [b for b in info[name].keys() if 'box' in b]
+            for b in boxes:
+                for v in vars:
+                    if 'discrete' in info['bounds'][v.name]:
+                        if np.ceil(info[name][b][v.name][0]) > np.floor(info[name][b][v.name][1]):
+                            del info[name][b]
+                            break
+
+            boxes = [b for b in info[name].keys() if 'box' in b]
+            if len(boxes) == 0:
+                print('no boxes for constraint', name)
+                print('info:', info[name])
+                sys.exit(1)
+
+            # remove boxes which vanished or changed
+            for b in list(built.keys()):
+                if b not in info[name] or built[b] != repr(info[name][b]):
+                    self.remove_box(name, b)
+                    changed = True
+
+            # add new and changed boxes
+            for b in boxes:
+                if b not in built:
+                    self.add_box(name, b, info)
+                    changed = True
+
+            if changed:
+                self.rebuild_selection(name)
+
+            box_counter += len(boxes)
+
+        # set variable bounds
+        for name, function in self.functions.items():
+            for v in function['vars']:
+                v.lb = min([l for l in info['bounds'][v.name] if type(l)!=str])
+                v.ub = max([u for u in info['bounds'][v.name] if type(u)!=str])
+
+        return self.model, info, box_counter
+
+    def add_box(self, name, b, info):
+        """
+        routine for introducing the binary, the activation constraints and the
+        estimation constraints of box 'b' of the partition of function 'name'
+
+        Parameters
+        ----------
+        name : str
+            representing the name of the nonlinear constraint/objective.
+        b : str
+            representing the key of the box.
+        info : dict
+            containing all information for setting up the current piecewise
+            linear relaxation of the problem of interest.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        function = self.functions[name]
+        vars = function['vars']
+        c = function['component']
+
+        # check if calculations for box need to be done
+        if function['objective']:
+            if 'overest_error' not in info[name][b].keys():
+                info[name][b] = calculate_box_info_objective(c,
+                                                             vars,
+                                                             info[name][b],
+                                                             self.call_model,
+                                                             self.timelimit)
+        else:
+            if 'weight' not in info[name][b].keys():
+                info[name][b] = calculate_box_info(c,
+                                                   vars,
+                                                   info[name][b],
+                                                   self.call_model,
+                                                   self.timelimit)
+
+        box_info = info[name][b]
+
+        function['box_set'].add(b)
+        bina = function['binaries'][b]
+
+        block = Block()
+        self.model.add_component(name+'_on_'+b, block)
+
+        # determine active partition
+        for v in vars:
+            block.add_component(
+                'active_upper_of_'+v.name,
+                Constraint(expr = bina * (v - box_info[v.name][1]) <= 0))
+            block.add_component(
+                'active_lower_of_'+v.name,
+                Constraint(expr = bina * (box_info[v.name][0] - v) <= 0))
+
+        if function['objective']:
+            # add affine underestimator entering the objective
+            block.estimator = Expression(
+                expr = quicksum(box_info['weight'][v.name] * v for v in vars)\
+                    + box_info['weight']['constant']\
+                        - box_info['overest_error'])
+
+        else:
+            if c.ub != None:
+                # add underestimation constraint
+                block.underestimation = Constraint(
+                    expr = bina * (quicksum(box_info['weight'][v.name] * v for v in vars)\
+                                   + box_info['weight']['constant']\
+                                       - box_info['overest_error']) <= c.ub)
+
+            # check if c is equality constraint
+            if c.lb != None:
+                # add overestimation constraint
+                block.overestimation = Constraint(
+                    expr = -bina * (quicksum(box_info['weight'][v.name] * v for v in vars)\
+                                    + box_info['weight']['constant']\
+                                        + box_info['underest_error']) <= -c.lb)
+
+        function['built'][b] = repr(box_info)
+
+    def remove_box(self, name, b):
+        """
+        routine for removing the binary and all constraints of box 'b' of the
+        partition of function 'name'
+
+        Parameters
+        ----------
+        name : str
+            representing the name of the nonlinear constraint/objective.
+        b : str
+            representing the key of the box.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        function = self.functions[name]
+
+        self.model.del_component(name+'_on_'+b)
+        del function['binaries'][b]
+        function['box_set'].remove(b)
+        del function['built'][b]
+
+    def rebuild_selection(self, name):
+        """
+        routine for rebuilding the constraints selecting exactly one box of
+        the partition of function 'name' and, for objectives, the piecewise
+        linear underestimation function
+
+        Parameters
+        ----------
+        name : str
+            representing the name of the nonlinear constraint/objective.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        function = self.functions[name]
+        bina = function['binaries']
+
+        self.model.del_component(name+'_sos_cons')
+        self.model.del_component(name+'_only_one_active')
+
+        # define SOS1 constraint
+        self.model.add_component(name+'_sos_cons',
+                                 SOSConstraint(var=bina, sos=1))
+        self.model.add_component(name+'_only_one_active',
+                                 Constraint(expr=quicksum(bina[i] for i in
+                                                  bina.index_set()) == 1))
+        encode_box_selection(self.model, name, bina)
+
+        # add underestimation objective function
+        if function['objective']:
+            function['estimator'].expr = quicksum(
+                bina[b] * self.box_estimator(name, b)
+                for b in function['box_set'])
+
+    def box_estimator(self, name, b):
+        """
+        routine for returning the affine underestimator of function 'name' on
+        box 'b' as stored in the block of the box
+
+        Parameters
+        ----------
+        name : str
+            representing the name of the nonlinear objective.
+        b : str
+            representing the key of the box.
+
+        Returns
+        -------
+        estimator : pyomo expression component
+            representing the affine underestimator.
+
+        """
+
+        return self.model.component(name+'_on_'+b).estimator
@@ -9,10 +9,12 @@ Created on Sun Jun 23 09:29:04 2024
 import copy as cp
 import numpy as np
 
-def init_locbounds_defpois(encl_dict):
+from local_bound_set import *
+
+def init_local_bound_sets(encl_dict):
     """
-    routine for initializing lists of local lower and upper bound lists
-    together with respective dicts of defining points
+    routine for initializing the sets of local lower and upper bounds
+    together with their defining points
 
     Parameters
     ----------
@@ -21,41 +23,33 @@ def init_locbounds_defpois(encl_dict):
 
     Returns
     -------
-    llbs : list
-        consisting of initial assignment of local lower bounds.
-    Ldefpois : dict
-        consisting of defining points for any component of any currently
-        valid local lower bound.
-    lubs : list
-        consisting of initial assignment of local upper bounds.
-    Udefpois : dict
-        consisting of defining points for any component of any currently
-        valid local upper bound.
+    llbs : LocalBoundSet
+        consisting of initial assignment of local lower bounds and their
+        defining points.
+    lubs : LocalBoundSet
+        consisting of initial assignment of local upper bounds and their
+        defining points.
 
     """
     
     zl, zu = encl_dict['zl'], encl_dict['zu']
     
-    # initialize list of local upper bounds
-    lubs = [zu]
-    
-    # initialize dict of defining points for local upper bounds
-    Udefpois = {}
-    Udefpois[str(zu)] = {}
+    # initialize set of local upper bounds
+    Udefpois = []
     for i in np.arange(0,len(zu)):
         d = cp.deepcopy(zl)
         d[i] = cp.deepcopy(zu[i])
-        Udefpois[str(zu)][i] = [d]
-        
-    # initialize list of local lower bounds
-    llbs = [zl]
+        Udefpois.append([d])
     
-    # initialize list of defining points for local lower bound
-    Ldefpois = {}
-    Ldefpois[str(zl)] = {}
+    lubs = LocalBoundSet(zu, Udefpois, 'upper')
+        
+    # initialize set of local lower bounds
+    Ldefpois = []
     for i in np.arange(0,len(zl)):
         d = cp.deepcopy(zu)
         d[i] = cp.deepcopy(zl[i])
-        Ldefpois[str(zl)][i] = [d]
+        Ldefpois.append([d])
+    
+    llbs = LocalBoundSet(zl, Ldefpois, 'lower')
     
-    return llbs, Ldefpois, lubs, Udefpois
\ No newline at end of file
+    return llbs, lubs
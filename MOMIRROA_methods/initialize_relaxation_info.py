@@ -11,6 +11,8 @@ import copy as cp
 from pyomo.environ import *
 from pyomo.core.expr import identify_variables
 
+from relaxation_store import *
+
 def initialize_relaxation_info(model, McCormick=False):
     """
     routine for initializing the relaxation information of the problem instance
@@ -52,12 +54,11 @@ def initialize_relaxation_info(model, McCormick=False):
             
             vars = cp.deepcopy(McCor_vars)
         
-        info[c.name] = {}
-        info[c.name]['box0'] = {}
+        box0 = {}
         for v in vars:
             if v.is_indexed():
                 for i in v.index_set():
-                    info[c.name]['box0'][v[i].name] = [v[i].lb, v[i].ub]
+                    box0[v[i].name] = [v[i].lb, v[i].ub]
                     
                     if v[i].name not in info['bounds'].keys():
                         info['bounds'][v[i].name] = [v[i].lb, v[i].ub]
@@ -65,12 +66,15 @@ def initialize_relaxation_info(model, McCormick=False):
                             info['bounds'][v[i].name].append('discrete')
             
             else:
-                info[c.name]['box0'][v.name] = [v.lb, v.ub]
+                box0[v.name] = [v.lb, v.ub]
                 
                 if v.name not in info['bounds'].keys():
                     info['bounds'][v.name] = [v.lb, v.ub]
                     if v.domain == Integers or v.domain == Binary:
                         info['bounds'][v.name].append('discrete')
+        
+        # store partition consisting of the whole domain
+        info[c.name] = BoxPartition({'box0': box0})
     
     # for nonlinear objectives
     for o in nonlin_objectives:
@@ -85,12 +89,11 @@ def initialize_relaxation_info(model, McCormick=False):
             
             vars = cp.deepcopy(McCor_vars)
         
-        info[o.name] = {}
-        info[o.name]['box0'] = {}
+        box0 = {}
         for v in vars:
             if v.is_indexed():
                 for i in v.index_set():
-                    info[o.name]['box0'][v[i].name] = [v[i].lb, v[i].ub]
+                    box0[v[i].name] = [v[i].lb, v[i].ub]
                     
                     if v[i].name not in info['bounds'].keys():
                         info['bounds'][v[i].name] = [v[i].lb, v[i].ub]
@@ -98,12 +101,15 @@ def initialize_relaxation_info(model, McCormick=False):
                             info['bounds'][v[i].name].append('discrete')
             
             else:
-                info[o.name]['box0'][v.name] = [v.lb, v.ub]
+                box0[v.name] = [v.lb, v.ub]
                 
                 if v.name not in info['bounds'].keys():
                     info['bounds'][v.name] = [v.lb, v.ub]
                     if v.domain == Integers or v.domain == Binary:
                         info['bounds'][v.name].append('discrete')
+        
+        # store partition consisting of the whole domain
+        info[o.name] = BoxPartition({'box0': box0})
     
     # initialize BT counter
     info['BT counter'] = 0
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 10:04:37 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr.numeric_expr import AbsExpression, DivisionExpression,\
+    NegationExpression, PowExpression, ProductExpression, SumExpression,\
+    UnaryFunctionExpression
+
+import math
+
+
+"""
+interval arithmetic and point evaluation of pyomo expressions
+
+intervals are tuples (lower, upper). Besides the natural interval extension
+the interval gradient w.r.t. the variables of a box is propagated in forward
+mode, which yields the mean value form used in 'error_bound_tiers'. Nodes
+which are not supported raise a NotImplementedError
+
+"""
+
+ENTIRE = (-math.inf, math.inf)
+
+
+def interval_mul(a, b):
+    """
+    routine for multiplying the intervals a and b
+
+    """
+
+    products = [x * y for x in a for y in b]
+    if any(math.isnan(p) for p in products):
+        return ENTIRE
+
+    return (min(products), max(products))
+
+
+def interval_pow(a, p):
+    """
+    routine for raising the interval a to the constant power p
+
+    """
+
+    lo, hi = a
+    if p == 0:
+        return (1.0, 1.0)
+
+    if float(p).is_integer():
+        p = int(p)
+        if p < 0:
+            if lo <= 0 <= hi:
+                return ENTIRE
+            return interval_pow((1 / hi, 1 / lo), -p)
+        if p % 2 == 1 or lo >= 0:
+            return (lo**p, hi**p)
+        if hi <= 0:
+            return (hi**p, lo**p)
+        return (0.0, max(lo**p, hi**p))
+
+    # real powers are only defined for nonnegative bases
+    if lo < 0:
+        raise NotImplementedError('real power of a possibly negative base')
+    if p > 0:
+        return (lo**p, hi**p)
+    if lo == 0:
+        return (hi**p, math.inf)
+    return (hi**p, lo**p)
+
+
+def interval_sin(a):
+    """
+    routine for the range of sin over the interval a
+
+    """
+
+    lo, hi = a
+    if not (math.isfinite(lo) and math.isfinite(hi)) or hi - lo >= 2 * math.pi:
+        return (-1.0, 1.0)
+
+    values = [math.sin(lo), math.sin(hi)]
+    upper = max(values)
+    lower = min(values)
+
+    # maxima at pi/2 + 2k pi and minima at -pi/2 + 2k pi
+    if math.ceil((lo - math.pi/2) / (2*math.pi)) <= math.floor((hi - math.pi/2) / (2*math.pi)):
+        upper = 1.0
+    if math.ceil((lo + math.pi/2) / (2*math.pi)) <= math.floor((hi + math.pi/2) / (2*math.pi)):
+        lower = -1.0
+
+    return (lower, upper)
+
+
+def interval_function(name, a):
+    """
+    routine for the range of the univariate function 'name' over the interval
+    a together with the range of its derivative
+
+    """
+
+    lo, hi = a
+    if name == 'exp':
+        value = (math.exp(min(lo, 700)), math.exp(hi) if hi < 700 else math.inf)
+        return value, value
+    if name == 'log':
+        if lo < 0:
+            raise NotImplementedError('log of a possibly negative argument')
+        value = (math.log(lo) if lo > 0 else -math.inf, math.log(hi))
+        return value, interval_pow(a, -1)
+    if name == 'sqrt':
+        if lo < 0:
+            raise NotImplementedError('sqrt of a possibly negative argument')
+        value = (math.sqrt(lo), math.sqrt(hi))
+        return value, (0.5 / value[1] if value[1] > 0 else math.inf,
+                       0.5 / value[0] if value[0] > 0 else math.inf)
+    if name == 'sin':
+        return interval_sin(a), interval_sin((lo + math.pi/2, hi + math.pi/2))
+    if name == 'cos':
+        derivative = interval_sin(a)
+        return interval_sin((lo + math.pi/2, hi + math.pi/2)), (-derivative[1], -derivative[0])
+
+    raise NotImplementedError('function ' + name)
+
+
+def _constant(expr):
+    # value of a node which does not depend on variables or None
+    if type(expr) in native_numeric_types:
+        return float(expr)
+    if not expr.is_potentially_variable():
+        return float(value(expr))
+    return None
+
+
+def interval_gradient(expr, index, box):
+    """
+    routine for computing the range of 'expr' over 'box' together with the
+    ranges of its partial derivatives
+
+    Parameters
+    ----------
+    expr : pyomo expression
+        representing the function of interest.
+    index : dict
+        having the ids of the pyomo variables as keys and their positions in
+        'box' as values.
+    box : list
+        containing the intervals of the variables.
+
+    Raises
+    ------
+    NotImplementedError
+        if the expression contains unsupported nodes.
+
+    Returns
+    -------
+    interval : tuple
+        representing the range of the function.
+    gradient : dict
+        having the positions of the variables as keys and the ranges of the
+        partial derivatives as values, missing positions have derivative 0.
+
+    """
+
+    c = _constant(expr)
+    if c is not None:
+        return (c, c), {}
+
+    if expr.is_variable_type():
+        if expr.fixed:
+            return (float(value(expr)),) * 2, {}
+        i = index[id(expr)]
+        return box[i], {i: (1.0, 1.0)}
+
+    if expr.is_named_expression_type():
+        return interval_gradient(expr.expr, index, box)
+
+    if isinstance(expr, SumExpression):
+        lo, hi, gradient = 0.0, 0.0, {}
+        for arg in expr.args:
+            a, ga = interval_gradient(arg, index, box)
+            lo, hi = lo + a[0], hi + a[1]
+            for i, g in ga.items():
+                old = gradient.get(i, (0.0, 0.0))
+                gradient[i] = (old[0] + g[0], old[1] + g[1])
+        return (lo, hi), gradient
+
+    if isinstance(expr, NegationExpression):
+        a, ga = interval_gradient(expr.args[0], index, box)
+        return (-a[1], -a[0]), {i: (-g[1], -g[0]) for i, g in ga.items()}
+
+    if isinstance(expr, ProductExpression):
+        a, ga = interval_gradient(expr.args[0], index, box)
+        b, gb = interval_gradient(expr.args[1], index, box)
+        gradient = {i: interval_mul(b, g) for i, g in ga.items()}
+        for i, g in gb.items():
+            product = interval_mul(a, g)
+            old = gradient.get(i, (0.0, 0.0))
+            gradient[i] = (old[0] + product[0], old[1] + product[1])
+        return interval_mul(a, b), gradient
+
+    if isinstance(expr, DivisionExpression):
+        a, ga = interval_gradient(expr.args[0], index, box)
+        b, gb = interval_gradient(expr.args[1], index, box)
+        inverse = interval_pow(b, -1)
+        result = interval_mul(a, inverse)
+        # (ga - result * gb) / b
+        gradient = {}
+        for i in set(ga) | set(gb):
+            g = ga.get(i, (0.0, 0.0))
+            h = interval_mul(result, gb.get(i, (0.0, 0.0)))
+            gradient[i] = interval_mul((g[0] - h[1], g[1] - h[0]), inverse)
+        return result, gradient
+
+    if isinstance(expr, PowExpression):
+        p = _constant(expr.args[1])
+        if p is None:
+            raise NotImplementedError('variable exponent')
+        a, ga = interval_gradient(expr.args[0], index, box)
+        derivative = interval_mul((p, p), interval_pow(a, p - 1))\
+            if p != 0 else (0.0, 0.0)
+        return interval_pow(a, p), {i: interval_mul(derivative, g) for i, g in ga.items()}
+
+    if isinstance(expr, AbsExpression):
+        a, ga = interval_gradient(expr.args[0], index, box)
+        if a[0] >= 0:
+            return a, ga
+        if a[1] <= 0:
+            return (-a[1], -a[0]), {i: (-g[1], -g[0]) for i, g in ga.items()}
+        return (0.0, max(-a[0], a[1])),\
+            {i: (-max(abs(g[0]), abs(g[1])), max(abs(g[0]), abs(g[1]))) for i, g in ga.items()}
+
+    if isinstance(expr, UnaryFunctionExpression):
+        a, ga = interval_gradient(expr.args[0], index, box)
+        result, derivative = interval_function(expr.getname(), a)
+        return result, {i: interval_mul(derivative, g) for i, g in ga.items()}
+
+    raise NotImplementedError('expression node ' + type(expr).__name__)
+
+
+def point_value(expr, index, point):
+    """
+    routine for evaluating 'expr' at 'point' without touching the values of
+    the pyomo variables
+
+    Parameters
+    ----------
+    expr : pyomo expression
+        representing the function of interest.
+    index : dict
+        having the ids of the pyomo variables as keys and their positions in
+        'point' as values.
+    point : list
+        containing the values of the variables.
+
+    Raises
+    ------
+    NotImplementedError
+        if the expression contains unsupported nodes.
+
+    Returns
+    -------
+    value : float
+        representing the function value.
+
+    """
+
+    c = _constant(expr)
+    if c is not None:
+        return c
+
+    if expr.is_variable_type():
+        if expr.fixed:
+            return float(value(expr))
+        return point[index[id(expr)]]
+
+    if expr.is_named_expression_type():
+        return point_value(expr.expr, index, point)
+
+    args = [point_value(arg, index, point) for arg in expr.args]
+
+    if isinstance(expr, SumExpression):
+        return sum(args)
+    if isinstance(expr, NegationExpression):
+        return -args[0]
+    if isinstance(expr, ProductExpression):
+        return args[0] * args[1]
+    if isinstance(expr, DivisionExpression):
+        return args[0] / args[1]
+    if isinstance(expr, PowExpression):
+        if args[0] < 0 and not float(args[1]).is_integer():
+            raise NotImplementedError('real power of a negative base')
+        return args[0] ** args[1]
+    if isinstance(expr, AbsExpression):
+        return abs(args[0])
+    if isinstance(expr, UnaryFunctionExpression):
+        name = expr.getname()
+        if name in ['exp', 'log', 'sqrt', 'sin', 'cos']:
+            return getattr(math, name)(args[0])
+
+    raise NotImplementedError('expression node ' + type(expr).__name__)
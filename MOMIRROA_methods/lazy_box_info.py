@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 28 10:03:52 2026
+
+@author: moritz
+"""
+
+from relaxation_statistics import *
+
+
+"""
+inheritance of the estimators of a bisected box
+
+the affine function of a box shifted by its estimation errors stays a valid
+under-/overestimator on every subbox. With lazy box information the children
+of a bisection keep the weight and the errors of their parent and are marked
+as 'loose'. A loose box is only tightened, i.e., its own least square weight
+and errors are computed, once the relaxation selects it for a constraint or
+objective which is violated too heavily
+
+"""
+
+# entries of a box record which depend on its bounds
+ESTIMATOR_KEYS = ('weight', 'overest_error', 'underest_error', 'loose')
+
+
+def box_variables(box):
+    """
+    routine for returning the names of the variables bounded by 'box'
+
+    """
+
+    return [k for k in box.keys() if k not in ESTIMATOR_KEYS]
+
+
+def child_record(box, lazy):
+    """
+    routine for returning the record a child of 'box' is derived from by
+    changing the bounds of the bisected variable
+
+    Parameters
+    ----------
+    box : BoxRecord
+        containing all information of the box to be bisected.
+    lazy : bool
+        deciding if the children inherit the estimators of the box.
+
+    Returns
+    -------
+    record : BoxRecord
+        representing the box with inherited estimators marked as loose or
+        without estimators.
+
+    """
+
+    if lazy and 'weight' in box.keys():
+        count_statistic('inherited box estimators', 2)
+        return box.updated({'loose': True})
+
+    return box.without(*ESTIMATOR_KEYS)
+
+
+def tighten_record(box):
+    """
+    routine for dropping the inherited estimators of a loose box, such that
+    its own estimators are computed when the relaxation is set up again
+
+    """
+
+    count_statistic('tightened loose boxes')
+
+    return box.without(*ESTIMATOR_KEYS)
+
+
+def find_active_box(info, c, solution, vars, binaries=None):
+    """
+    routine for finding the box of the constraint/objective 'c' which is
+    selected by the optimal solution of the relaxation
+
+    Parameters
+    ----------
+    info : dict
+        containing all information for setting up a piecewise linear
+        relaxation of the problem of interest.
+    c : str
+        representing the name of the constraint/objective.
+    solution : dict
+        having the variable names as keys and the corresponding optimal
+        values as values.
+    vars : list
+        containing the names of the variables appearing in 'c'.
+    binaries : str, optional
+        representing the name of the function whose box binaries select the
+        boxes of 'c'. The default is None, i.e., 'c' itself.
+
+    Returns
+    -------
+    active_box : str
+        representing the name of the active box or None if no box of the
+        partition contains the solution.
+
+    """
+
+    boxes = [b for b in list(info[c].keys()) if 'box' in b]
+
+    if binaries is None:
+        binaries = c
+
+    act_bin = [i for i in list(solution.keys()) if (i.startswith(binaries+'_box_binaries[') and solution[i]>= 0.9)][0]
+    act_ind = act_bin[act_bin.index('[')+1:act_bin.index(']')]
+
+    try:
+        if act_ind in boxes:
+            b = act_ind
+        else:
+            b = boxes[int(act_ind)]
+    except:
+        return None
+
+    # check if chosen box is truely active
+    for v in vars:
+        if not(info[c][b][v][0] - 1e-5 <= solution[v] and solution[v] <= info[c][b][v][1] + 1e-5):
+            return None
+
+    return b
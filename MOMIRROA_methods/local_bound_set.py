@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 09:14:52 2026
+
+@author: moritz
+"""
+
+import numpy as np
+import uuid
+
+
+class LocalBoundSet():
+    """
+    set of local upper or lower bounds together with their defining points
+
+    the bounds are stored as rows of a contiguous (k, m) array, every bound
+    carries a stable integer ID and the defining points of its components are
+    stored in (p, m) arrays linked to the row of the bound. A set of local
+    lower bounds is stored negated, such that both senses share the update
+    routine for local upper bounds
+
+    for reference see Algorithm 5 in
+
+    Klamroth, K. and Lacour, R. and Vanderpooten, D.
+    On the representation of the search region in multi-objective optimization.
+    Eur. J. Oper. Res. 245(3). 2015.
+
+    """
+
+    def __init__(self, bound, defining_points, sense='upper'):
+        """
+        routine for initializing the set with a single bound
+
+        Parameters
+        ----------
+        bound : array
+            representing the initial local bound.
+        defining_points : list
+            containing for every component the list of defining points of the
+            initial local bound.
+        sense : str, optional
+            'upper' for local upper bounds or 'lower' for local lower bounds.
+            The default is 'upper'.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.sense = sense
+        self.sign = 1.0 if sense == 'upper' else -1.0
+
+        # IDs are unique among all sets sharing the lineage, i.e., copies
+        self.lineage = uuid.uuid4().hex
+
+        bound = self.sign * np.asarray(bound, dtype=float)
+        self.m = bound.size
+
+        self._bounds = bound.reshape(1, self.m).copy()
+        self._ids = np.zeros(1, dtype=np.int64)
+        self._parents = -np.ones(1, dtype=np.int64)
+        self._defpois = [[self.sign * np.asarray(p, dtype=float).reshape(-1, self.m)
+                          for p in defining_points]]
+        self._next_id = 1
+
+        self._rows = None
+        self._keys = None
+
+    def __len__(self):
+        return self._bounds.shape[0]
+
+    def __iter__(self):
+        return iter(self.bounds)
+
+    @property
+    def bounds(self):
+        """
+        (k, m) array of all local bounds in the order of the set
+        """
+        return self.sign * self._bounds
+
+    @property
+    def ids(self):
+        """
+        IDs of all local bounds in the order of the set
+        """
+        return self._ids.copy()
+
+    def items(self):
+        """
+        routine for iterating over the pairs of IDs and local bounds
+
+        """
+
+        return zip(self._ids.tolist(), self.bounds)
+
+    def row(self, bound_id):
+        """
+        routine for returning the row of the local bound with ID 'bound_id'
+
+        """
+
+        if self._rows is None:
+            self._rows = {i: r for r, i in enumerate(self._ids.tolist())}
+
+        return self._rows[bound_id]
+
+    def bound(self, bound_id):
+        """
+        routine for returning the local bound with ID 'bound_id'
+
+        """
+
+        return self.sign * self._bounds[self.row(bound_id)]
+
+    def id_of(self, bound):
+        """
+        routine for returning the ID of the local bound which equals 'bound'
+        exactly or None if there is no such local bound
+
+        """
+
+        if self._keys is None:
+            self._keys = {(row + 0.0).tobytes(): i
+                          for row, i in zip(self._bounds, self._ids.tolist())}
+
+        key = (self.sign * np.asarray(bound, dtype=float) + 0.0).tobytes()
+
+        return self._keys.get(key)
+
+    def defining_points(self, bound_id):
+        """
+        routine for returning the defining points of the local bound with ID
+        'bound_id'
+
+        Returns
+        -------
+        defining_points : list
+            containing for every component a (p, m) array of defining points
+            in the order they were found.
+
+        """
+
+        return [self.sign * p for p in self._defpois[self.row(bound_id)]]
+
+    def parent(self, bound_id):
+        """
+        routine for returning the ID of the local bound which was split when
+        the local bound with ID 'bound_id' was introduced, -1 for the initial
+        local bound. For a batch update this is the local bound present before
+        the batch
+
+        """
+
+        return int(self._parents[self.row(bound_id)])
+
+    def copy(self):
+        """
+        routine for copying the set, the arrays of defining points are never
+        changed in place and hence shared
+
+        """
+
+        new = LocalBoundSet.__new__(LocalBoundSet)
+        new.sense = self.sense
+        new.sign = self.sign
+        new.lineage = self.lineage
+        new.m = self.m
+        new._bounds = self._bounds.copy()
+        new._ids = self._ids.copy()
+        new._parents = self._parents.copy()
+        new._defpois = [list(d) for d in self._defpois]
+        new._next_id = self._next_id
+        new._rows = None
+        new._keys = None
+
+        return new
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def to_arrays(self):
+        """
+        routine for returning the set as a dict of arrays, e.g., for writing
+        it to an npz file. The defining points of all bounds are stacked into
+        a single array together with their number per bound and component
+
+        Returns
+        -------
+        arrays : dict
+            having the names of the arrays as keys and the arrays as values.
+
+        """
+
+        counts = np.array([[len(p) for p in d] for d in self._defpois],
+                          dtype=np.int64).reshape(-1, self.m)
+        points = [p for d in self._defpois for p in d]
+
+        return {'sense': np.array(self.sense),
+                'lineage': np.array(self.lineage),
+                'bounds': self._bounds.copy(),
+                'ids': self._ids.copy(),
+                'parents': self._parents.copy(),
+                'next_id': np.array(self._next_id, dtype=np.int64),
+                'defining_point_counts': counts,
+                'defining_points': np.concatenate(points, axis=0).reshape(-1, self.m)}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        routine for restoring a set from the arrays returned by 'to_arrays',
+        the restored set keeps the IDs and the lineage of the original one
+
+        Parameters
+        ----------
+        arrays : dict
+            having the names of the arrays as keys and the arrays as values.
+
+        Returns
+        -------
+        local_bound_set : LocalBoundSet
+            representing the restored set.
+
+        """
+
+        new = cls.__new__(cls)
+        new.sense = str(arrays['sense'])
+        new.sign = 1.0 if new.sense == 'upper' else -1.0
+        new.lineage = str(arrays['lineage'])
+        new._bounds = np.array(arrays['bounds'], dtype=float)
+        new.m = new._bounds.shape[1]
+        new._ids = np.array(arrays['ids'], dtype=np.int64)
+        new._parents = np.array(arrays['parents'], dtype=np.int64)
+        new._next_id = int(arrays['next_id'])
+
+        counts = np.asarray(arrays['defining_point_counts']).reshape(-1)
+        points = np.split(np.array(arrays['defining_points'], dtype=float),
+                          np.cumsum(counts)[:-1])
+        new._defpois = [points[r*new.m:(r+1)*new.m] for r in range(len(new._ids))]
+
+        new._rows = None
+        new._keys = None
+
+        return new
+
+    def update(self, z):
+        """
+        routine for updating the set w.r.t. a new point z, i.e., all local
+        upper bounds strictly dominated by z are split (for local lower bounds
+        all local lower bounds strictly dominating z)
+
+        Parameters
+        ----------
+        z : array
+            representing the update point.
+
+        Raises
+        ------
+        ValueError
+            if shapes of new update point and local bounds do not align.
+
+        Returns
+        -------
+        new_ids : list
+            containing the IDs of the introduced local bounds.
+
+        """
+
+        z = self.sign * np.asarray(z, dtype=float)
+        m = self.m
+        if z.size != m:
+            raise ValueError('Shapes of local bounds and z do not align')
+
+        B = self._bounds
+
+        # find affected bounds where z < bound in every dimension
+        less_mask = (z[None, :] < B)
+        A_mask = less_mask.all(axis=1)
+
+        # face-touch updates: for any bound i and dim j where z[j] equals
+        # bound[i,j] and z < bound in all other dims, z becomes a defining
+        # point of component j
+        eq_mask = (B == z[None, :])
+        for j in range(m):
+            others_lt = np.delete(less_mask, j, axis=1).all(axis=1)
+            for i in np.nonzero(eq_mask[:, j] & others_lt)[0]:
+                self._defpois[i][j] = np.vstack([self._defpois[i][j], z])
+
+        # build the new candidates by splitting each affected bound along
+        # every j
+        new_bounds = []
+        new_defpois = []
+        new_parents = []
+        for i in np.nonzero(A_mask)[0]:
+            old_defs = self._defpois[i]
+            for j in range(m):
+                # maximum over k!=j of the minimal j-th component of the
+                # defining points of component k
+                zmax = max(old_defs[k][:, j].min() for k in range(m) if k != j)
+
+                if zmax < z[j]:
+                    uj = B[i].copy()
+                    uj[j] = z[j]
+
+                    # only keep old defining points p with p[j] < z[j]
+                    defs = [old_defs[k][old_defs[k][:, j] < z[j]]
+                            if k != j else z.reshape(1, m).copy()
+                            for k in range(m)]
+
+                    new_bounds.append(uj)
+                    new_defpois.append(defs)
+                    new_parents.append(self._ids[i])
+
+        # new bounds first, survivors afterwards in their former order
+        keep = ~A_mask
+        new_ids = np.arange(self._next_id,
+                            self._next_id + len(new_bounds),
+                            dtype=np.int64)
+        self._next_id += len(new_bounds)
+
+        self._bounds = np.vstack([np.asarray(new_bounds).reshape(-1, m), B[keep]])
+        self._ids = np.concatenate([new_ids, self._ids[keep]])
+        self._parents = np.concatenate([np.asarray(new_parents, dtype=np.int64),
+                                        self._parents[keep]])
+        self._defpois = new_defpois + [d for d, k in zip(self._defpois, keep) if k]
+
+        self._rows = None
+        self._keys = None
+
+        return new_ids.tolist()
+
+    def update_batch(self, points):
+        """
+        routine for updating the set w.r.t. several points at once, the
+        result is identical to updating the set with the points one after
+        another
+
+        points which are not weakly dominated by any local bound (for local
+        lower bounds which do not weakly dominate any local bound) and points
+        which are strictly dominated by an earlier point of the batch cannot
+        change the set and are filtered beforehand. The remaining points are
+        processed on a growing working copy of the set, which is compacted
+        only once at the end
+
+        Parameters
+        ----------
+        points : list
+            containing the update points in the order they would be passed
+            to 'update'.
+
+        Raises
+        ------
+        ValueError
+            if shapes of update points and local bounds do not align.
+
+        Returns
+        -------
+        new_ids : list
+            containing the IDs of the introduced local bounds which are still
+            part of the set. Their parents are the local bounds present before
+            the batch from which they descend.
+
+        """
+
+        m = self.m
+        Z = self.sign * np.asarray(points, dtype=float)
+        if Z.size == 0:
+            return []
+        if Z.shape[-1] != m:
+            raise ValueError('Shapes of local bounds and points do not align')
+        Z = Z.reshape(-1, m)
+
+        # bounds only ever decrease, hence points which lie above all
+        # current bounds or strictly above an earlier point stay inactive
+        keep = np.zeros(len(Z), dtype=bool)
+        for p, z in enumerate(Z):
+            keep[p] = (z[None, :] <= self._bounds).all(axis=1).any()\
+                and not (Z[:p] < z[None, :]).all(axis=1).any()
+        Z = Z[keep]
+        if len(Z) == 0:
+            return []
+
+        # working copy with spare capacity for the introduced bounds
+        k = len(self)
+        capacity = max(2*k, 16)
+        W = np.empty((capacity, m))
+        W[:k] = self._bounds
+        ids = np.empty(capacity, dtype=np.int64)
+        ids[:k] = self._ids
+        parents = np.empty(capacity, dtype=np.int64)
+        parents[:k] = self._parents
+        generation = np.empty(capacity, dtype=np.int64)
+        generation[:k] = -1
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:k] = True
+        defpois = list(self._defpois)
+        roots = {}
+        n = k
+
+        for g, z in enumerate(Z):
+            act = np.nonzero(alive[:n])[0]
+            B = W[act]
+
+            less_mask = (z[None, :] < B)
+            A_mask = less_mask.all(axis=1)
+
+            # face-touch updates as in 'update'
+            eq_mask = (B == z[None, :])
+            for j in range(m):
+                others_lt = np.delete(less_mask, j, axis=1).all(axis=1)
+                for i in act[eq_mask[:, j] & others_lt]:
+                    defpois[i] = list(defpois[i])
+                    defpois[i][j] = np.vstack([defpois[i][j], z])
+
+            # split the affected bounds in the order of the set and append
+            # the new ones
+            split = act[A_mask]
+            split = split[np.lexsort((split, -generation[split]))]
+            for i in split:
+                old_defs = defpois[i]
+                for j in range(m):
+                    zmax = max(old_defs[l][:, j].min() for l in range(m) if l != j)
+
+                    if zmax < z[j]:
+                        if n == capacity:
+                            capacity *= 2
+                            W = np.resize(W, (capacity, m))
+                            ids = np.resize(ids, capacity)
+                            parents = np.resize(parents, capacity)
+                            generation = np.resize(generation, capacity)
+                            alive = np.concatenate([alive[:n],
+                                                    np.zeros(capacity - n, dtype=bool)])
+
+                        W[n] = W[i]
+                        W[n, j] = z[j]
+                        ids[n] = self._next_id
+                        self._next_id += 1
+
+                        # parent is the ancestor present before the batch
+                        parents[n] = roots.get(i, ids[i])
+                        roots[n] = parents[n]
+
+                        generation[n] = g
+                        alive[n] = True
+                        defpois.append([old_defs[l][old_defs[l][:, j] < z[j]]
+                                        if l != j else z.reshape(1, m).copy()
+                                        for l in range(m)])
+                        n += 1
+
+                alive[i] = False
+
+        # order of sequential updates: newest bounds first, within one
+        # update in the order they were introduced
+        rows = np.nonzero(alive[:n])[0]
+        rows = rows[np.lexsort((rows, -generation[rows]))]
+
+        self._bounds = W[rows].copy()
+        self._ids = ids[rows].copy()
+        self._parents = parents[rows].copy()
+        self._defpois = [defpois[r] for r in rows.tolist()]
+
+        self._rows = None
+        self._keys = None
+
+        return ids[rows[rows >= k]].tolist()
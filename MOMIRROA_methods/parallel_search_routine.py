@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:41:27 2026
+
+@author: moritz
+"""
+
+import copy as cp
+import multiprocessing as mp
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+
+from bound_store import *
+from compute_weight_hyperplane import *
+from rebuild_utopian_llbs import *
+from relaxation_statistics import *
+from twostage_search_routine import *
+from update_lub_rel_info import *
+from update_nondom import *
+from update_utopian import *
+
+
+def start_search_zone_pool(workers):
+    """
+    routine for starting the process pool used for processing the search
+    zones of one iteration in parallel
+
+    Parameters
+    ----------
+    workers : int
+        representing the number of worker processes.
+
+    Returns
+    -------
+    executor : ProcessPoolExecutor
+        representing the pool of worker processes.
+
+    """
+
+    # fork the workers such that the problem module and the search paths of
+    # the main script are available without re-importing the main script
+    try:
+        context = mp.get_context('fork')
+    except ValueError:
+        context = None
+
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def search_zone_worker(call_model, u, snapshot, alpha, info, options, it):
+    """
+    routine for processing a single search zone on a private copy of the
+    enclosure inside a worker process
+
+    Parameters
+    ----------
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    u : ndarray
+        representing the local upper bound determining the search zone.
+    snapshot : dict
+        containing the enclosure information at the beginning of the
+        iteration.
+    alpha : ndarray
+        contains specific weight for each of the objective functions.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the search zone.
+    options : structure
+        containing all optional settings for the algorithm.
+    it : int
+        representing the current iteration.
+
+    Returns
+    -------
+    events : list
+        containing the recorded updates of the enclosure in the order in
+        which they occured.
+    analysis : dict
+        containing the counters collected while processing the search zone.
+
+    """
+
+    snapshot['zone_events'] = []
+    counters = statistics_snapshot()
+
+    snapshot = twostage_search(call_model,
+                               u,
+                               snapshot,
+                               alpha,
+                               info,
+                               options,
+                               it)
+
+    # collect the counters of the relaxation set up of the worker
+    add_statistics_difference(snapshot['analysis'][str(it)], counters)
+
+    return snapshot['zone_events'], snapshot['analysis'][str(it)]
+
+
+def merge_zone_events(encl_dict, events, options):
+    """
+    routine for replaying the updates recorded by a worker on the
+    coordinating enclosure
+
+    Parameters
+    ----------
+    encl_dict : dict
+        containing all information collected by the algorithm.
+    events : list
+        containing the recorded updates of a single search zone.
+    options : structure
+        containing all optional settings for the algorithm.
+
+    Returns
+    -------
+    encl_dict : dict
+        containing all updated information collected by the algorithm.
+
+    """
+
+    # consecutive updates of the llbs are collected and applied as one batch
+    llb_points = []
+
+    for event in events:
+        kind = event[0]
+
+        if kind == 'llb':
+            # search zone is empty or relaxed point serves as lower bound
+            llb_points.append(event[1])
+
+        elif kind == 'utopian':
+            # relaxed point did not improve the utopians
+            encl_dict['U'], check = update_utopian(encl_dict['U'],
+                                                   event[1],
+                                                   options)
+
+        elif kind == 'utopian_llb':
+            # relaxed point improved the utopians
+            encl_dict['U'], check = update_utopian(encl_dict['U'],
+                                                   event[1],
+                                                   options)
+            llb_points.append(event[1])
+
+        elif kind == 'feasible':
+            # relaxed point is considered as feasible
+            y, info, u = event[1], event[2], event[3]
+
+            encl_dict['llbs'].update_batch(llb_points)
+            llb_points = []
+
+            encl_dict['U'], check = update_utopian(encl_dict['U'], y, options)
+            if check == 0:
+                encl_dict = rebuild_utopian_llbs(encl_dict, y)
+            else:
+                encl_dict['llbs'].update(y)
+
+            encl_dict = merge_nondominated_point(encl_dict, y, info, u)
+
+        elif kind == 'bounds':
+            # bounds of a search zone were tightened
+            bound_store.put(event[1], event[2])
+
+        elif kind == 'nondom':
+            # potentially nondominated point was found
+            encl_dict = merge_nondominated_point(encl_dict,
+                                                 event[1],
+                                                 event[2],
+                                                 event[3])
+
+    encl_dict['llbs'].update_batch(llb_points)
+
+    return encl_dict
+
+
+def merge_nondominated_point(encl_dict, y, info, u):
+    """
+    routine for inserting a potentially nondominated point found in the search
+    zone determined by 'u' into the coordinating enclosure
+
+    Parameters
+    ----------
+    encl_dict : dict
+        containing all information collected by the algorithm.
+    y : ndarray
+        representing the potentially nondominated point.
+    info : dict
+        containing the relaxation information of the search zone at the time
+        the point was found.
+    u : ndarray
+        representing the local upper bound determining the search zone.
+
+    Returns
+    -------
+    encl_dict : dict
+        containing all updated information collected by the algorithm.
+
+    """
+
+    encl_dict['N'], check = update_nondom(encl_dict['N'], y)
+
+    encl_dict['lubs'].update(y)
+
+    encl_dict['lub_relaxation_information'] = update_lub_rel_info(
+        encl_dict,
+        info,
+        u)
+
+    return encl_dict
+
+
+def parallel_search(call_model, zones, encl_dict, old_lubs, old_lub_rel_info, options, it, executor):
+    """
+    routine for processing all search zones of one iteration in a pool of
+    worker processes. Every worker operates on a snapshot of the enclosure
+    taken at the beginning of the iteration and records its updates, which
+    are afterwards replayed in the order of 'zones' such that the results do
+    not depend on the scheduling of the workers
+
+    Parameters
+    ----------
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    zones : list
+        containing the IDs of the local upper bounds whose search zones are
+        processed.
+    encl_dict : dict
+        containing all information collected by the algorithm.
+    old_lubs : LocalBoundSet
+        containing the local upper bounds and their defining points at the
+        beginning of the iteration.
+    old_lub_rel_info : dict
+        containing the relaxation information of the local upper bounds at the
+        beginning of the iteration.
+    options : structure
+        containing all optional settings for the algorithm.
+    it : int
+        representing the current iteration.
+    executor : ProcessPoolExecutor
+        representing the pool of worker processes.
+
+    Returns
+    -------
+    encl_dict : dict
+        containing all updated information collected by the algorithm.
+
+    """
+
+    # only ship the entries needed for processing a search zone
+    static_keys = [
+        'zl', 'zu', 'dir_vec', 'factor_delta', 'N', 'U',
+        'llbs', 'lubs',
+        'start_time', 'timeout'
+    ]
+
+    futures = []
+    for lub_id in zones:
+        lub = old_lubs.bound(lub_id)
+        alpha = compute_weight_hyperplane(lub_id, old_lubs)
+        print('\nsearch zone determined by:', lub)
+
+        snapshot = {k: encl_dict[k] for k in static_keys}
+        snapshot['lub_relaxation_information'] = {
+            lub_id: old_lub_rel_info[lub_id]}
+        snapshot['analysis'] = {
+            str(it): {k: 0 for k in encl_dict['analysis'][str(it)].keys()}}
+
+        futures.append(executor.submit(search_zone_worker,
+                                       call_model,
+                                       lub,
+                                       snapshot,
+                                       alpha,
+                                       old_lub_rel_info[lub_id],
+                                       options,
+                                       it))
+
+    # merge the results in the fixed order of the search zones
+    for future in futures:
+        events, analysis = future.result()
+
+        encl_dict = merge_zone_events(encl_dict, events, options)
+
+        for k in analysis.keys():
+            if k == 'maxpreimageboxes':
+                encl_dict['analysis'][str(it)][k] = max(
+                    encl_dict['analysis'][str(it)][k], analysis[k])
+            else:
+                encl_dict['analysis'][str(it)][k] = encl_dict['analysis'][str(it)].get(k, 0) + analysis[k]
+
+    return encl_dict
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:40:16 2026
+
+@author: moritz
+"""
+
+from collections import OrderedDict
+from pyomo.environ import *
+from pyomo.repn import generate_standard_repn
+
+import hashlib
+import numpy as np
+import time
+
+from box_encoding import *
+from compute_relaxation_errors import *
+from relax_model import *
+from relax_model_linear import *
+from relax_model_McCormick import *
+from rounding_routines import *
+from shared_partitions import *
+
+# persistent relaxations kept alive between the calls, ordered by last use
+relaxation_cache = OrderedDict()
+
+
+class PersistentRelaxationSolver():
+    """
+    in-process SCIP model of a piecewise linear relaxation which is built once
+    and afterwards only receives new objective weights and cut-offs
+
+    every objective component is represented by an auxiliary variable which
+    equals the (relaxed) objective function, such that the weighted sum
+    objective is linear in these variables and the cut-offs 'u' are simple
+    upper bounds on them
+
+    """
+
+    def __init__(self, model, m, box_counter=0):
+        """
+        routine for translating a pyomo model of a piecewise linear relaxation
+        into a PySCIPOpt model
+
+        Parameters
+        ----------
+        model : pyomo model
+            representing a piecewise linear relaxation of the problem to be
+            solved.
+        m : int
+            representing the number of objective functions.
+        box_counter : int, optional
+            representing the number of preimage set boxes appearing in the
+            relaxation. The default is 0.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        import pyscipopt
+
+        self.model = model
+        self.m = m
+        self.box_counter = box_counter
+
+        self.scip = pyscipopt.Model()
+        self.scip.hideOutput()
+
+        # introduce all variables of the relaxation
+        self.var_map = {}
+        for v in model.component_data_objects(Var, descend_into=True):
+            if v.is_binary():
+                vtype = 'B'
+            elif v.is_integer():
+                vtype = 'I'
+            else:
+                vtype = 'C'
+
+            if v.fixed:
+                lb, ub = value(v), value(v)
+            else:
+                lb, ub = v.lb, v.ub
+
+            self.var_map[id(v)] = (v, self.scip.addVar(name=v.name,
+                                                       vtype=vtype,
+                                                       lb=lb,
+                                                       ub=ub))
+
+        # introduce active constraints
+        for c in model.component_data_objects(Constraint,
+                                              active=True,
+                                              descend_into=True):
+            expr = self.translate(c.body)
+
+            if c.equality:
+                self.scip.addCons(expr == value(c.upper), name=c.name)
+            else:
+                if c.has_lb():
+                    self.scip.addCons(expr >= value(c.lower), name=c.name+'_lb')
+                if c.has_ub():
+                    self.scip.addCons(expr <= value(c.upper), name=c.name+'_ub')
+
+        # introduce SOS1 constraints
+        for s in model.component_data_objects(SOSConstraint,
+                                              active=True,
+                                              descend_into=True):
+            self.scip.addConsSOS1([self.var_map[id(v)][1] for v in s.get_variables()],
+                                  name=s.name)
+
+        # introduce auxiliary variables for the objective functions
+        self.objectives = []
+        self.obj_vars = []
+        for i in np.arange(0,m):
+            for o in model.component_objects(Objective):
+                if 'objective'+str(i) in o.name:
+                    o.deactivate()
+
+                    obj_var = self.scip.addVar(name='objective_value_'+str(i),
+                                               vtype='C',
+                                               lb=None,
+                                               ub=None)
+                    self.scip.addCons(obj_var - self.translate(o.expr) == 0,
+                                      name='objective_link_'+str(i))
+
+                    self.objectives.append(o)
+                    self.obj_vars.append(obj_var)
+                    break
+
+    def translate(self, expr):
+        """
+        routine for translating a pyomo expression of degree at most two into
+        a PySCIPOpt expression
+
+        Parameters
+        ----------
+        expr : pyomo expression
+            representing a linear or quadratic function.
+
+        Raises
+        ------
+        ValueError
+            if the expression is neither linear nor quadratic.
+
+        Returns
+        -------
+        scip_expr : PySCIPOpt expression
+            representing the same function.
+
+        """
+
+        repn = generate_standard_repn(expr, quadratic=True)
+
+        if repn.nonlinear_expr is not None:
+            raise ValueError('persistent relaxation only supports linear and quadratic expressions')
+
+        scip_expr = value(repn.constant)
+        for coef, v in zip(repn.linear_coefs, repn.linear_vars):
+            scip_expr = scip_expr + value(coef) * self.var_map[id(v)][1]
+        for coef, (v1, v2) in zip(repn.quadratic_coefs, repn.quadratic_vars):
+            scip_expr = scip_expr + value(coef) * self.var_map[id(v1)][1] \
+                * self.var_map[id(v2)][1]
+
+        return scip_expr
+
+    def solve(self, alpha, u, options, timelimit):
+        """
+        routine for solving the piecewise linear relaxation of the weighted sum
+        problem determined by the weight vector 'alpha' restricted by objective
+        cut-offs determined by the local upper bound 'u'
+
+        Parameters
+        ----------
+        alpha : ndarray
+            contains specific weight for each of the objective functions.
+        u : ndarray
+            representing the restrictions on the objective function components.
+        options : structure
+            containing all optional settings of the algorithm.
+        timelimit : float
+            representing the time limit of the solver.
+
+        Returns
+        -------
+        objective_vector : ndarray
+            representing the optimal values of the objective function
+            components.
+        solution : dict
+            with variable names as keys and respective optimal values as values.
+        relaxation_errors : dict
+            having the constraint/objective names as keys and the corresponding
+            constraint/objective satisfaction errors as values.
+        sol_time : float
+            representing the solution time of the problem.
+
+        """
+
+        try:
+            relative_constraint_errors = options.relative_constraint_errors
+        except:
+            relative_constraint_errors = False
+
+        # only exchange weights and cut-offs of the existing model
+        self.scip.freeTransform()
+        for i, obj_var in enumerate(self.obj_vars):
+            self.scip.chgVarUb(obj_var, u[i])
+
+        self.scip.setObjective(sum(alpha[i] * obj_var
+                                   for i, obj_var in enumerate(self.obj_vars)),
+                               'minimize')
+        self.scip.setParam('limits/time', timelimit)
+
+        self.scip.optimize()
+
+        status = self.scip.getStatus()
+        sol_time = self.scip.getSolvingTime()
+
+        if status == 'timelimit':
+            raise TimeoutError(f'Solver did not finish within timelimit of {timelimit}s')
+
+        # check for optimality
+        if status in ['infeasible', 'inforunbd']:
+            return None, None, None, sol_time
+
+        # load solution into the pyomo model
+        for v, scip_var in self.var_map.values():
+            v.set_value(self.scip.getVal(scip_var), skip_validation=True)
+
+        # retrieve objective values
+        objective_vector = np.zeros(self.m)
+        for i, o in enumerate(self.objectives):
+            objective_vector[i] = rounding_lower(value(o),6)
+
+        # retrieve solution
+        solution = {}
+        for v in self.model.component_objects(Var):
+            if v.is_indexed():
+                for i in v.index_set():
+                    solution[v[i].name] = value(v[i])
+            else:
+                solution[v.name] = value(v)
+
+        # determine relaxation_errors
+        relaxation_errors = compute_relaxation_errors(self.model,
+                                                      relative_constraint_errors)
+
+        return objective_vector, solution, relaxation_errors, sol_time
+
+
+def relaxation_fingerprint(call_model, m, info, options):
+    """
+    routine for computing a key identifying a piecewise linear relaxation,
+    i.e., the problem, the variable bounds together with all boxes and their
+    estimators and the settings deciding how the relaxation is built
+
+    Parameters
+    ----------
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    m : int
+        representing the number of objective functions.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    options : structure
+        containing all optional settings of the algorithm.
+
+    Returns
+    -------
+    key : str
+        representing the relaxation.
+
+    """
+
+    settings = (repr(call_model),
+                m,
+                options.McCormick,
+                relaxation_formulation.formulation,
+                box_encoding.threshold,
+                partition_sharing.shared)
+    content = repr((settings, {k: info[k] for k in info.keys() if k != 'BT counter'}))
+
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def complete_box_info(info):
+    """
+    routine for checking if all boxes of 'info' carry their estimators, i.e.,
+    setting up the relaxation does not change 'info'
+
+    """
+
+    return all('weight' in info[name][b].keys()
+               for name in function_names(info) for b in info[name].keys())
+
+
+def load_persistent_relaxation(call_model, m, info, options, timelimit):
+    """
+    routine for loading the persistent model of a piecewise linear relaxation
+    from the cache or building it if it has not been built before
+
+    Parameters
+    ----------
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    m : int
+        representing the number of objective functions.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    options : structure
+        containing all optional settings of the algorithm.
+    timelimit : float
+        representing the time limit for computing missing box information.
+
+    Returns
+    -------
+    relaxation : PersistentRelaxationSolver
+        representing the persistent model of the relaxation.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    build_time : float
+        representing the time needed for building the model.
+
+    """
+
+    # catch number of relaxations kept alive
+    try:
+        cache_size = options.persistent_relaxation_cache
+    except:
+        cache_size = 32
+
+    start_time = time.time()
+
+    key = relaxation_fingerprint(call_model, m, info, options)
+    if key in relaxation_cache:
+        relaxation_cache.move_to_end(key)
+        return relaxation_cache[key], info, time.time() - start_time
+
+    # the key changes if the missing box information is computed
+    complete = complete_box_info(info)
+
+    # build relaxed problem
+    model = call_model(0)
+    if options.McCormick:
+        model, info, box_counter = relax_model_McCormick(model,
+                                                         call_model,
+                                                         info)
+    else:
+        model, info, box_counter = relax_model(model,
+                                               call_model,
+                                               info,
+                                               timelimit)
+
+    relaxation = PersistentRelaxationSolver(model, m, box_counter)
+
+    # store relaxation w.r.t. the completed box information
+    if not complete:
+        key = relaxation_fingerprint(call_model, m, info, options)
+    relaxation_cache[key] = relaxation
+    while len(relaxation_cache) > cache_size:
+        relaxation_cache.popitem(last=False)
+
+    return relaxation, info, time.time() - start_time
@@ -10,7 +10,6 @@ import copy as cp
 import numpy as np
 
 from initialize_local_bound_sets import *
-from update_llbs import *
 
 
 def rebuild_utopian_llbs(encl_dict, y):
@@ -40,13 +39,16 @@ def rebuild_utopian_llbs(encl_dict, y):
     static_keys = [
         'zl', 'zu', 'dir_vec', 'factor_delta', 'N',
         'analysis', 'start_time', 'timeout',
-        'lubs', 'Udefpois', 'lub_relaxation_information'
+        'lubs', 'lub_relaxation_information'
     ]
     new = {k: cp.deepcopy(old[k]) for k in static_keys}
     
-    # reinitialize llbs/Ldefpois (drops in-place any old ones)
-    llbs, Ldefpois, _, _ = init_locbounds_defpois(new)
-    new['llbs'], new['Ldefpois'] = llbs, Ldefpois
+    # keep recording search zone events inside parallel workers
+    if 'zone_events' in encl_dict:
+        new['zone_events'] = encl_dict['zone_events']
+    
+    # reinitialize llbs (drops in-place any old ones)
+    new['llbs'], _ = init_local_bound_sets(new)
     
     # rebuild U by masking out any x with y <= x
     old_U = old.get('U', [])
@@ -64,10 +66,7 @@ def rebuild_utopian_llbs(encl_dict, y):
     # convert back to list of 1-d arrays
     new['U'] = [row.copy() for row in U_arr]
     
-    # sequentially update llbs & LDefpois for each utopian point
-    for x in new['U']:
-        new['llbs'], new['Ldefpois'] = update_llbs(
-            new['llbs'], new['Ldefpois'], x
-        )
+    # update llbs w.r.t. all utopian points at once
+    new['llbs'].update_batch(new['U'])
     
     return new
\ No newline at end of file
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:14:02 2026
+
+@author: moritz
+"""
+
+
+def record_zone_event(encl_dict, *event):
+    """
+    routine for recording an update of the enclosure caused by processing a
+    single search zone. The events are only recorded if 'encl_dict' carries
+    an event log, which is the case inside the workers of the parallel search
+    zone processing
+
+    Parameters
+    ----------
+    encl_dict : dict
+        containing all information collected by the algorithm.
+    *event : tuple
+        consisting of the event type followed by the data needed for replaying
+        the update on the coordinating enclosure.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    if 'zone_events' in encl_dict:
+        encl_dict['zone_events'].append(event)
@@ -9,7 +9,9 @@ Created on Mon Jul  1 09:53:49 2024
 import copy as cp
 
 from adaptive_refinement import *
+from FBBT import *
 from OBBT import *
+from shared_partitions import *
 from uniform_refinement import *
 
 def refinement_routine(call_model, solution, rel_errors, info, u, options, timelimit):
@@ -55,17 +57,35 @@ def refinement_routine(call_model, solution, rel_errors, info, u, options, timel
     except:
         adaptive_refinement = False
     
+    # if bisected boxes inherit the estimators of their parent
+    try:
+        lazy_box_info = options.lazy_box_info
+    except:
+        lazy_box_info = False
+    
     # if and when bound tightening should be applied
     try:
         bound_tightening = options.bound_tightening
     except:
         bound_tightening = 1e20
+    
+    # if feasibility-based bound tightening precedes every refinement
+    try:
+        feasibility_bound_tightening = options.FBBT
+    except:
+        feasibility_bound_tightening = False
         
     # save old relaxation information
     old_info = cp.deepcopy(info)
     tighten_time = 0
     tighten_counter = 0
     
+    # tighten the bounds by interval propagation first, OBBT is only applied
+    # to the bounds which are not tightened by FBBT
+    tightened = []
+    if feasibility_bound_tightening:
+        info, tightened = FBBT(call_model, u, info)
+    
     # check if it is time for bound tightening
     if info['BT counter'] >= bound_tightening:
         print('apply bound tightening')
@@ -76,7 +96,8 @@ def refinement_routine(call_model, solution, rel_errors, info, u, options, timel
             u,
             info,
             options,
-            timelimit)
+            timelimit,
+            tightened)
         
         # reset bound tightening counter
         info['BT counter'] = 0
@@ -93,6 +114,9 @@ def refinement_routine(call_model, solution, rel_errors, info, u, options, timel
                 options)
             
         else:
-            info = uniform_refinement_procedure(info, rel_errors, options)
+            info = uniform_refinement_procedure(info, rel_errors, options, solution)
+    
+    # pass the refinements on to all functions sharing a partition
+    info = synchronize_partitions(info, lazy_box_info)
     
     return info, tighten_time, tighten_counter
\ No newline at end of file
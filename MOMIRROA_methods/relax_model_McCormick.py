@@ -14,6 +14,8 @@ import copy as cp
 import numpy as np
 import sys
 
+from relax_model_indexed import *
+
 # from calculate_box_info import *
 # from calculate_box_info_objective import *
 
@@ -63,152 +65,73 @@ def relax_model_McCormick(model, call_model, info):
         
         vars = McCor_vars
         
-        # catch boxes for constraint and introduce binaries
-        boxes = [b for b in info[c.name].keys() if 'box' in b]
+        # catch reasonable boxes for constraint and introduce binaries
+        boxes = reasonable_boxes(info, c.name, vars)
         
         number_of_boxes = len(boxes)
         box_counter += number_of_boxes
         
-        if number_of_boxes > 0:
-            model.add_component(c.name+'_box_set', RangeSet(0,number_of_boxes-1))
-        else:
+        if number_of_boxes == 0:
             print('no boxes for constraint', c.name)
             print('info:', info[c.name])
             sys.exit(1)
         
-        for s in model.component_objects(RangeSet):
-            if s.name == c.name+'_box_set':
-                model.add_component(c.name+'_box_binaries',
-                                    Var(s, within=Binary))
+        bina = add_box_binaries(model, c.name, number_of_boxes)
         
+        # determine active partition and set variable bounds
+        records = [info[c.name][b] for b in boxes]
         
-        # define SOS1 constraint
-        var_list = list(model.component_objects(Var))
-        var_list.reverse()
-        for bina in var_list:
-            if bina.name == c.name+'_box_binaries':
-                model.add_component(c.name+'_sos_cons',
-                                    SOSConstraint(var=bina, sos=1))
-                model.add_component(c.name+'_only_one_active',
-                                    Constraint(expr=quicksum(bina[i] for i in
-                                                     bina.index_set()) == 1))
-                break
-            
-        # introduce relaxation for each box
-        i = 0
-        for b in boxes:
-            
-            # check if box is reasonable
-            delete_box = False
-            for v in vars:
-                if 'discrete' in info['bounds'][v.name]:
-                    if np.ceil(info[c.name][b][v.name][0]) > np.floor(info[c.name][b][v.name][1]):
-                        delete_box = True
-                        break
-            if delete_box:
-                del info[c.name][b]
-                continue
-            
-            # determine active partition and set variable bounds
-            for v in vars:
-                model.add_component(
-                    'active_upper_of_'+v.name+'_for_'+b+'_wrt_'+c.name,
-                    Constraint(
-                        expr = bina[i] * (v - info[c.name][b][v.name][1]) <= 0)
-                    )
-                model.add_component(
-                    'active_lower_of_'+v.name+'_for_'+b+'_wrt_'+c.name,
-                    Constraint(
-                        expr = bina[i] * (info[c.name][b][v.name][0] - v) <= 0)
-                    )
-                v.lb = min([l for l in info['bounds'][v.name] if type(l)!=str])
-                v.ub = max([u for u in info['bounds'][v.name] if type(u)!=str])
+        for v in vars:
+            v.lb = min([l for l in info['bounds'][v.name] if type(l)!=str])
+            v.ub = max([u for u in info['bounds'][v.name] if type(u)!=str])
+        
+        if len(vars) not in [1, 2]:
+            print('something strange happened with McCormicks')
+            sys.exit(1)
+        
+        def box_rule(box, i):
+            add_box_bounds(box, bina[i], vars, records[i])
             
             # add McCormick for bilinear terms
             if len(vars) == 2:
+                l1, u1 = records[i][vars[0].name]
+                l2, u2 = records[i][vars[1].name]
                 v1 = vars[0]
                 v2 = vars[1]
-            
+                
                 # add first underestimator
-                model.add_component(
-                    '1stMcCormick_underestimation_of_'+c.name+'_on_'+b,
-                    Constraint(
-                        expr = 0 <= bina[i] * help_var - bina[i] * \
-                            (v2 * info[c.name][b][v1.name][0] + \
-                             v1 * info[c.name][b][v2.name][0] - \
-                             info[c.name][b][v1.name][0] * info[c.name][b][v2.name][0]))
-                    )
-                    
+                box.underestimation_1st = Constraint(
+                    expr = 0 <= bina[i] * help_var - bina[i] * (v2 * l1 + v1 * l2 - l1 * l2))
+                
                 # add second underestimator
-                model.add_component(
-                    '2ndMcCormick_underestimation_of_'+c.name+'_on_'+b,
-                    Constraint(
-                        expr = 0 <= bina[i] * help_var - bina[i] * \
-                            (v2 * info[c.name][b][v1.name][1] + \
-                             v1 * info[c.name][b][v2.name][1] - \
-                             info[c.name][b][v1.name][1] * info[c.name][b][v2.name][1]))
-                    )
-            
+                box.underestimation_2nd = Constraint(
+                    expr = 0 <= bina[i] * help_var - bina[i] * (v2 * u1 + v1 * u2 - u1 * u2))
+                
                 # add first overestimator
-                model.add_component(
-                    '1stMcCormick_overestimation_of_'+c.name+'_on_'+b,
-                    Constraint(
-                        expr = bina[i] * help_var - bina[i] * \
-                            (v2 * info[c.name][b][v1.name][0] + \
-                             v1 * info[c.name][b][v2.name][1] - \
-                             info[c.name][b][v1.name][0] * info[c.name][b][v2.name][1])\
-                            <= 0)
-                    )
-                    
+                box.overestimation_1st = Constraint(
+                    expr = bina[i] * help_var - bina[i] * (v2 * l1 + v1 * u2 - l1 * u2) <= 0)
+                
                 # add second overestimator
-                model.add_component(
-                    '2ndMcCormick_overestimation_of_'+c.name+'_on_'+b,
-                    Constraint(
-                        expr = bina[i] * help_var - bina[i] * \
-                            (v2 * info[c.name][b][v1.name][1] + \
-                             v1 * info[c.name][b][v2.name][0] - \
-                             info[c.name][b][v1.name][1] * info[c.name][b][v2.name][0])\
-                            <= 0)
-                    )
-                    
-            elif len(vars) == 1:
+                box.overestimation_2nd = Constraint(
+                    expr = bina[i] * help_var - bina[i] * (v2 * u1 + v1 * l2 - u1 * l2) <= 0)
+                
+            else:
+                l, u = records[i][vars[0].name]
                 v = vars[0]
+                
                 # add first McCormick underestimator
-                model.add_component(
-                    '1stMcCormick_underestimation_of_'+c.name+'_on_'+b,
-                    Constraint(
-                        expr = bina[i] * \
-                            (2*info[c.name][b][v.name][0] * v - \
-                             info[c.name][b][v.name][0]**2) \
-                                - bina[i] * help_var <= 0)
-                    )
+                box.underestimation_1st = Constraint(
+                    expr = bina[i] * (2*l * v - l**2) - bina[i] * help_var <= 0)
                 
                 # add second McCormick underestimator
-                model.add_component(
-                    '2nd_McCormick_underestimation_of_'+c.name+'_on_'+b,
-                    Constraint(
-                        expr = bina[i] * \
-                            (2*info[c.name][b][v.name][1] * v - \
-                             info[c.name][b][v.name][1]**2) \
-                                - bina[i] * help_var <= 0)
-                    )
-            
-                # add McCormick overestimator
-                model.add_component(
-                    'McCormick_overestimation_of_'+c.name+'_on_'+b,
-                    Constraint(
-                        expr = bina[i] * help_var - bina[i] * \
-                            (info[c.name][b][v.name][0] * v + \
-                             info[c.name][b][v.name][1] * v - \
-                             info[c.name][b][v.name][0] * info[c.name][b][v.name][1])\
-                            <= 0)
-                    )
-            
-            else:
-                print('something strange happened with McCormicks')
-                sys.exit(1)
+                box.underestimation_2nd = Constraint(
+                    expr = bina[i] * (2*u * v - u**2) - bina[i] * help_var <= 0)
                 
-            i += 1
+                # add McCormick overestimator
+                box.overestimation = Constraint(
+                    expr = bina[i] * help_var - bina[i] * (l * v + u * v - l * u) <= 0)
+        
+        model.add_component(c.name+'_relaxation', Block(range(number_of_boxes), rule=box_rule))
         
         c.deactivate()
         
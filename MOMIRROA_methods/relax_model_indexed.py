@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Nov  2 10:18:45 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr import identify_variables
+
+import numpy as np
+
+from box_encoding import *
+from box_info_pool import *
+from calculate_box_info import *
+from calculate_box_info_objective import *
+from calculate_box_info_objective_max import *
+from shared_partitions import *
+
+
+"""
+piecewise linear relaxations built from indexed blocks
+
+every nonlinear constraint/objective 'name' gets the box binaries
+'name_box_binaries' and the block 'name_relaxation' indexed by the positions
+of its boxes. The block of a box holds the box bounds 'active_bounds',
+indexed by variable and side, and the estimators of the box. All components
+are referenced directly, such that setting up a relaxation is linear in the
+number of boxes
+
+"""
+
+def reasonable_boxes(info, name, vars):
+    """
+    routine for dropping the boxes of the partition of function 'name' which
+    do not contain integral values of the discrete variables
+
+    Returns
+    -------
+    boxes : list
+        containing the names of the remaining boxes.
+
+    """
+
+    for b in [b for b in info[name].keys() if 'box' in b]:
+        for v in vars:
+            if 'discrete' in info['bounds'][v.name]:
+                if np.ceil(info[name][b][v.name][0]) > np.floor(info[name][b][v.name][1]):
+                    del info[name][b]
+                    break
+
+    return [b for b in info[name].keys() if 'box' in b]
+
+
+def add_box_binaries(model, name, number_of_boxes):
+    """
+    routine for adding the binaries selecting exactly one of the
+    'number_of_boxes' boxes of the partition of function 'name'
+
+    Returns
+    -------
+    bina : pyomo variable
+        representing the box binaries indexed by the positions of the boxes.
+
+    """
+
+    box_set = RangeSet(0, number_of_boxes-1)
+    model.add_component(name+'_box_set', box_set)
+
+    bina = Var(box_set, within=Binary)
+    model.add_component(name+'_box_binaries', bina)
+
+    # define SOS1 constraint
+    model.add_component(name+'_sos_cons', SOSConstraint(var=bina, sos=1))
+    model.add_component(name+'_only_one_active',
+                        Constraint(expr=quicksum(bina[i] for i in box_set) == 1))
+    encode_box_selection(model, name, bina)
+
+    return bina
+
+
+def add_box_bounds(box, selected, vars, record):
+    """
+    routine for adding the bounds of the box with the record 'record', which
+    only hold if the box binary 'selected' is one, to the block 'box'
+
+    """
+
+    index = [(v.name, side) for v in vars for side in ['upper', 'lower']]
+    var_map = {v.name: v for v in vars}
+
+    def bound_rule(b, v, side):
+        if side == 'upper':
+            return selected * (var_map[v] - record[v][1]) <= 0
+        return selected * (record[v][0] - var_map[v]) <= 0
+
+    box.active_bounds = Constraint(index, rule=bound_rule)
+
+
+def affine_function(record, vars):
+    # affine function of the least square weight of a box
+    return quicksum(record['weight'][v.name] * v for v in vars) + record['weight']['constant']
+
+
+def relax_model_indexed(model, call_model, info, timelimit, maximization=False):
+    """
+    routine for setting up a piecewise linear relaxation of the original model
+    of interest, where the box binaries are multiplied with the box bounds
+    and the estimators, suitable for minimization or, if 'maximization', for
+    maximization of the objectives
+
+    Parameters
+    ----------
+    model : pyomo model
+        representing the problem instance of interest.
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    timelimit : float
+        representing the time limit of the error subproblems.
+    maximization : bool, optional
+        deciding if overestimators of the objectives are used. The default is
+        False.
+
+    Returns
+    -------
+    model : pyomo model
+        representing the piecewise linear relaxation of the original problem
+        of interest.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    box_counter : int
+        representing the number of preimage set boxes appearing in the current
+        piecewise linear relaxation.
+
+    """
+
+    box_counter = 0
+
+    if maximization:
+        objective_sense, objective_marker = 'objective_max', 'underest_error'
+        objective_routine = calculate_box_info_objective_max
+        estimator_name, error_sign = 'overestimation_of_', 1
+    else:
+        objective_sense, objective_marker = 'objective_min', 'overest_error'
+        objective_routine = calculate_box_info_objective
+        estimator_name, error_sign = 'underestimation_of_', -1
+
+    # catch nonlinear constraints and objectives
+    nonlin_cons = [c for c in model.component_objects(Constraint) if c.body.polynomial_degree() != 1]
+    nonlin_obj = [o for o in model.component_objects(Objective) if o.expr.polynomial_degree() != 1]
+
+    # compute missing information of all boxes at once
+    functions = [(c, list(identify_variables(c.body)), 'constraint') for c in nonlin_cons]
+    functions += [(o, list(identify_variables(o.expr)), objective_sense) for o in nonlin_obj]
+    info = precompute_box_info(functions, call_model, info, timelimit)
+
+    # functions over the same variables may share their partitions
+    leaders = {name: partition_leader(info, name) for name in function_names(info)}
+
+    for component, vars, sense in functions:
+        name = component.name
+
+        boxes = reasonable_boxes(info, name, vars)
+        if len(boxes) == 0:
+            raise ValueError('no boxes for ' + name)
+        box_counter += len(boxes)
+
+        # check if calculations for boxes need to be done
+        for b in boxes:
+            if sense == 'constraint' and 'weight' not in info[name][b].keys():
+                info[name][b] = calculate_box_info(component, vars, info[name][b],
+                                                   call_model, timelimit)
+            elif sense != 'constraint' and objective_marker not in info[name][b].keys():
+                info[name][b] = objective_routine(component, vars, info[name][b],
+                                                  call_model, timelimit)
+
+        records = [info[name][b] for b in boxes]
+
+        for v in vars:
+            v.lb = min([l for l in info['bounds'][v.name] if type(l)!=str])
+            v.ub = max([u for u in info['bounds'][v.name] if type(u)!=str])
+
+        # functions sharing a partition are selected by the binaries of its
+        # leader, which also holds the box bounds
+        leader = leaders[name] == name
+        if leader:
+            bina = add_box_binaries(model, name, len(boxes))
+        else:
+            bina = model.component(leaders[name]+'_box_binaries')
+
+        if sense == 'constraint' or leader:
+            def box_rule(box, i):
+                if leader:
+                    add_box_bounds(box, bina[i], vars, records[i])
+
+                if sense == 'constraint' and component.ub != None:
+                    # add underestimation constraint
+                    box.underestimation = Constraint(
+                        expr = bina[i] * (affine_function(records[i], vars)\
+                                          - records[i]['overest_error']) <= component.ub)
+
+                # check if component is equality constraint
+                if sense == 'constraint' and component.lb != None:
+                    # add overestimation constraint
+                    box.overestimation = Constraint(
+                        expr = -bina[i] * (affine_function(records[i], vars)\
+                                           + records[i]['underest_error']) <= -component.lb)
+
+            model.add_component(name+'_relaxation', Block(range(len(boxes)), rule=box_rule))
+
+        if sense == 'constraint':
+            component.deactivate()
+            continue
+
+        # add estimation objective function
+        estimator = Objective(expr = quicksum(
+            bina[i] * (affine_function(records[i], vars) + error_sign * records[i][objective_marker])
+            for i in range(len(boxes))))
+        model.add_component(estimator_name+name, estimator)
+
+        if not component.active:
+            estimator.deactivate()
+
+        model.del_component(component)
+        constraint = Constraint(expr = component.expr <= 0)
+        model.add_component(name, constraint)
+        constraint.deactivate()
+
+    return model, info, box_counter
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 30 09:27:14 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr import identify_variables
+
+import numpy as np
+
+from box_encoding import *
+from box_info_pool import *
+from calculate_box_info import *
+from calculate_box_info_objective import *
+from calculate_box_info_objective_max import *
+from relax_model_indexed import *
+from shared_partitions import *
+
+
+# formulations of the selection of the active box
+FORMULATIONS = ['product', 'bigm', 'hull']
+
+
+class RelaxationFormulation():
+    """
+    formulation of the piecewise linear relaxations
+
+    'product' multiplies the box binaries with the box bounds and the
+    estimators, i.e., the relaxation is a quadratic model, 'bigm' relaxes the
+    box bounds and the estimators of inactive boxes by constants derived from
+    info['bounds'] and 'hull' uses disaggregated copies of the variables per
+    box. Both linear formulations replace the products of binaries and
+    variables in the estimators of the objectives by exact linearizations
+    and do not need the SOS1 constraints
+
+    """
+
+    def __init__(self, formulation='product'):
+        self.configure(formulation)
+
+    def configure(self, formulation):
+        """
+        routine for setting the formulation, one of 'FORMULATIONS'
+
+        Raises
+        ------
+        ValueError
+            if the formulation is unknown.
+
+        """
+
+        if not formulation in FORMULATIONS:
+            raise ValueError('Unknown relaxation formulation ' + str(formulation))
+
+        self.formulation = formulation
+
+    def linear(self):
+        """
+        routine for checking if a linear formulation is chosen
+
+        """
+
+        return self.formulation != 'product'
+
+
+# formulation shared by all relaxations
+relaxation_formulation = RelaxationFormulation()
+
+
+def global_bounds(info, name):
+    # bounds of a variable w.r.t. the current relaxation
+    bounds = [l for l in info['bounds'][name] if type(l) != str]
+    lower, upper = min(bounds), max(bounds)
+
+    if not (np.isfinite(lower) and np.isfinite(upper)):
+        raise ValueError('Linear relaxations need finite bounds on ' + name)
+
+    return lower, upper
+
+
+def affine_range(weight, vars, bounds):
+    # range of the affine function with weight 'weight' on the box 'bounds'
+    lower = upper = weight['constant']
+    for v in vars:
+        lower += min(weight[v.name] * bounds[v.name][0], weight[v.name] * bounds[v.name][1])
+        upper += max(weight[v.name] * bounds[v.name][0], weight[v.name] * bounds[v.name][1])
+
+    return lower, upper
+
+
+def add_box_selection(model, name, vars, boxes, info, formulation, leader=None):
+    """
+    routine for adding the binaries selecting one box of the partition of the
+    function 'name' and, for the formulation 'hull', the copies of the
+    variables per box
+
+    Parameters
+    ----------
+    model : pyomo model
+        representing the relaxation under construction.
+    name : str
+        representing the name of the nonlinear constraint/objective.
+    vars : list
+        containing pyomo variable objects appearing in the function.
+    boxes : list
+        containing the names of the boxes of the partition.
+    info : dict
+        containing all information for setting up the current piecewise
+        linear relaxation of the problem of interest.
+    formulation : str
+        representing the formulation, i.e., 'bigm' or 'hull'.
+    leader : str, optional
+        representing the name of the function whose partition is shared and
+        whose binaries select the boxes. The default is None, i.e., the
+        partition is not shared.
+
+    Returns
+    -------
+    bina : pyomo variable
+        representing the box binaries.
+    bounds : dict
+        having the variable names as keys and their global bounds as values.
+    copies : pyomo variable
+        representing the copies of the variables indexed by the box index and
+        the variable name, None for the formulation 'bigm'.
+
+    """
+
+    bounds = {v.name: global_bounds(info, v.name) for v in vars}
+    for v in vars:
+        v.setlb(bounds[v.name][0])
+        v.setub(bounds[v.name][1])
+
+    # the box bounds of a shared partition are already part of the model
+    if leader is not None and leader != name:
+        return model.component(leader+'_box_binaries'), bounds, model.component(leader+'_box_copies')
+
+    model.add_component(name+'_box_set', RangeSet(0,len(boxes)-1))
+    bina = Var(model.component(name+'_box_set'), within=Binary)
+    model.add_component(name+'_box_binaries', bina)
+    model.add_component(name+'_only_one_active',
+                        Constraint(expr=quicksum(bina[i] for i in bina.index_set()) == 1))
+    encode_box_selection(model, name, bina)
+
+    if formulation != 'hull':
+        return bina, bounds, None
+
+    # copies of the variables vanish for inactive boxes and sum up to the
+    # variables
+    names = [v.name for v in vars]
+    var_map = {v.name: v for v in vars}
+    copies = Var(model.component(name+'_box_set'), names)
+    model.add_component(name+'_box_copies', copies)
+
+    def copy_rule(m, v):
+        return quicksum(copies[i, v] for i in range(len(boxes))) == var_map[v]
+
+    model.add_component(name+'_active_copies', Constraint(names, rule=copy_rule))
+
+    return bina, bounds, copies
+
+
+def add_linear_box_bounds(box, i, selected, vars, record, bounds, copies=None):
+    """
+    routine for adding the bounds of the box with the record 'record', which
+    only hold if the box binary 'selected' is one, to the block 'box', either
+    relaxed by the global bounds 'bounds' or imposed on the copies 'copies' of
+    the variables for the box index 'i'
+
+    """
+
+    index = [(v.name, side) for v in vars for side in ['upper', 'lower']]
+    var_map = {v.name: v for v in vars}
+
+    def bound_rule(b, v, side):
+        lower, upper = record[v]
+        if copies is not None and side == 'upper':
+            return copies[i, v] - upper * selected <= 0
+        if copies is not None:
+            return lower * selected - copies[i, v] <= 0
+        if side == 'upper':
+            return var_map[v] - upper <= (bounds[v][1] - upper) * (1 - selected)
+        return lower - var_map[v] <= (lower - bounds[v][0]) * (1 - selected)
+
+    box.active_bounds = Constraint(index, rule=bound_rule)
+
+
+def add_binary_products(box, i, selected, vars, bounds, products):
+    """
+    routine for adding the exact linearization of the products 'products' of
+    the box binary 'selected' and the variables by their global bounds
+    'bounds' to the block 'box' of the box index 'i'
+
+    """
+
+    index = [(v.name, side) for v in vars
+             for side in ['upper', 'lower', 'upper_complement', 'lower_complement']]
+    var_map = {v.name: v for v in vars}
+
+    def product_rule(b, v, side):
+        lower, upper = bounds[v]
+        z = products[i, v]
+        if side == 'upper':
+            return z - upper * selected <= 0
+        if side == 'lower':
+            return lower * selected - z <= 0
+        if side == 'upper_complement':
+            return z - var_map[v] + lower * (1 - selected) <= 0
+        return var_map[v] - upper * (1 - selected) - z <= 0
+
+    box.active_products = Constraint(index, rule=product_rule)
+
+
+def relax_model_linear(model, call_model, info, timelimit, maximization=False, formulation=None):
+    """
+    routine for setting up a piecewise linear relaxation of the original model
+    of interest as a MILP w.r.t. the formulation of 'relaxation_formulation',
+    suitable for minimization or, if 'maximization', for maximization of the
+    objectives
+
+    Parameters
+    ----------
+    model : pyomo model
+        representing the problem instance of interest.
+    call_model : function
+        returning a pyomo model of the problem to be solved.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    timelimit : float
+        representing the time limit of the error subproblems.
+    maximization : bool, optional
+        deciding if overestimators of the objectives are used. The default is
+        False.
+    formulation : str, optional
+        representing the linear formulation 'bigm' or 'hull' overriding the
+        one of 'relaxation_formulation'. The default is None.
+
+    Returns
+    -------
+    model : pyomo model
+        representing the piecewise linear relaxation of the original problem
+        of interest.
+    info : dict
+        containing all information for setting up the current piecewise linear
+        relaxation of the problem of interest.
+    box_counter : int
+        representing the number of preimage set boxes appearing in the current
+        piecewise linear relaxation.
+
+    """
+
+    if formulation is None:
+        formulation = relaxation_formulation.formulation
+    box_counter = 0
+
+    if maximization:
+        objective_sense, objective_marker = 'objective_max', 'underest_error'
+        objective_routine = calculate_box_info_objective_max
+        estimator_name, error_sign = 'overestimation_of_', 1
+    else:
+        objective_sense, objective_marker = 'objective_min', 'overest_error'
+        objective_routine = calculate_box_info_objective
+        estimator_name, error_sign = 'underestimation_of_', -1
+
+    # catch nonlinear constraints and objectives
+    nonlin_cons = [c for c in model.component_objects(Constraint) if c.body.polynomial_degree() != 1]
+    nonlin_obj = [o for o in model.component_objects(Objective) if o.expr.polynomial_degree() != 1]
+
+    # compute missing information of all boxes at once
+    functions = [(c, list(identify_variables(c.body)), 'constraint') for c in nonlin_cons]
+    functions += [(o, list(identify_variables(o.expr)), objective_sense) for o in nonlin_obj]
+    info = precompute_box_info(functions, call_model, info, timelimit)
+
+    # functions over the same variables may share their partitions
+    leaders = {name: partition_leader(info, name) for name in function_names(info)}
+
+    for component, vars, sense in functions:
+        name = component.name
+
+        # drop boxes which are not reasonable for discrete variables
+        boxes = reasonable_boxes(info, name, vars)
+        if len(boxes) == 0:
+            raise ValueError('no boxes for ' + name)
+        box_counter += len(boxes)
+
+        # check if calculations for boxes need to be done
+        for b in boxes:
+            if sense == 'constraint' and 'weight' not in info[name][b].keys():
+                info[name][b] = calculate_box_info(component, vars, info[name][b],
+                                                   call_model, timelimit)
+            elif sense != 'constraint' and objective_marker not in info[name][b].keys():
+                info[name][b] = objective_routine(component, vars, info[name][b],
+                                                  call_model, timelimit)
+
+        records = [info[name][b] for b in boxes]
+
+        # functions sharing a partition are selected by the binaries of its
+        # leader, which also holds the box bounds
+        leader = leaders[name] is None or leaders[name] == name
+        bina, bounds, copies = add_box_selection(model, name, vars, boxes, info, formulation,
+                                                 leaders[name])
+
+        # the estimator of an objective is linear in the products of the
+        # binaries and the variables, which are the copies for 'hull'
+        products = copies
+        if sense != 'constraint' and products is None:
+            products = Var(bina.index_set(), [v.name for v in vars])
+            model.add_component(name+'_box_products', products)
+
+        if sense == 'constraint' or leader or products is not copies:
+            def box_rule(box, i):
+                weight = records[i]['weight']
+
+                if leader:
+                    add_linear_box_bounds(box, i, bina[i], vars, records[i], bounds, copies)
+
+                if products is not copies:
+                    add_binary_products(box, i, bina[i], vars, bounds, products)
+
+                if sense == 'constraint' and component.ub != None:
+                    # add underestimation constraint
+                    shift = weight['constant'] - records[i]['overest_error'] - component.ub
+                    if formulation == 'hull':
+                        expr = quicksum(weight[v.name] * copies[i, v.name] for v in vars) + shift * bina[i] <= 0
+                    else:
+                        big_m = max(affine_range(weight, vars, bounds)[1] - weight['constant'] + shift, 0)
+                        expr = quicksum(weight[v.name] * v for v in vars) + shift <= big_m * (1 - bina[i])
+                    box.underestimation = Constraint(expr = expr)
+
+                if sense == 'constraint' and component.lb != None:
+                    # add overestimation constraint
+                    shift = weight['constant'] + records[i]['underest_error'] - component.lb
+                    if formulation == 'hull':
+                        expr = -quicksum(weight[v.name] * copies[i, v.name] for v in vars) - shift * bina[i] <= 0
+                    else:
+                        big_m = max(-(affine_range(weight, vars, bounds)[0] - weight['constant'] + shift), 0)
+                        expr = -quicksum(weight[v.name] * v for v in vars) - shift <= big_m * (1 - bina[i])
+                    box.overestimation = Constraint(expr = expr)
+
+            model.add_component(name+'_relaxation', Block(range(len(boxes)), rule=box_rule))
+
+        if sense == 'constraint':
+            component.deactivate()
+            continue
+
+        estimator = 0
+        for i, b in enumerate(boxes):
+            weight = records[i]['weight']
+            estimator += quicksum(weight[v.name] * products[i, v.name] for v in vars)\
+                + (weight['constant'] + error_sign * records[i][objective_marker]) * bina[i]
+
+        model.add_component(estimator_name+name, Objective(expr = estimator))
+
+        if not component.active:
+            model.component(estimator_name+name).deactivate()
+
+        model.del_component(component)
+        model.add_component(name, Constraint(expr = component.expr <= 0))
+        model.component(name).deactivate()
+
+    return model, info, box_counter
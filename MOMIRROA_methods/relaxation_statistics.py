@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:05:44 2026
+
+@author: moritz
+"""
+
+from collections import defaultdict
+
+# counters collected by the routines setting up the relaxations
+statistics = defaultdict(float)
+
+
+def count_statistic(key, amount=1):
+    """
+    routine for increasing the counter 'key' collected while setting up the
+    piecewise linear relaxations
+
+    Parameters
+    ----------
+    key : str
+        representing the name of the counter.
+    amount : float, optional
+        representing the increment. The default is 1.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    statistics[key] += amount
+
+
+def statistics_snapshot():
+    """
+    routine for taking a snapshot of all counters
+
+    Returns
+    -------
+    snapshot : dict
+        having the counter names as keys and their current values as values.
+
+    """
+
+    return dict(statistics)
+
+
+def add_statistics_difference(analysis, snapshot):
+    """
+    routine for adding the increase of all counters since 'snapshot' to the
+    analysis dict of an iteration
+
+    Parameters
+    ----------
+    analysis : dict
+        containing the information collected in the current iteration.
+    snapshot : dict
+        having the counter names as keys and their values at the beginning of
+        the iteration as values.
+
+    Returns
+    -------
+    analysis : dict
+        containing the updated information of the current iteration.
+
+    """
+
+    for key, amount in statistics.items():
+        difference = amount - snapshot.get(key, 0)
+        if difference != 0:
+            analysis[key] = analysis.get(key, 0) + difference
+
+    return analysis
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:12:25 2026
+
+@author: moritz
+"""
+
+from collections.abc import Mapping, MutableMapping
+
+import weakref
+
+# marker for boxes removed in an overlay
+DELETED = object()
+
+# number of frozen overlays a partition may stack before it is compacted
+MAX_LAYERS = 8
+
+
+class BoxRecord(Mapping):
+    """
+    immutable information of a single box, i.e., the variable bounds as
+    (lower, upper) tuples and, if computed, the least square weight and the
+    estimation errors. Records with equal content are interned in 'box_store',
+    such that all local upper bounds refer to the same object and a box is
+    stored only once
+
+    """
+
+    __slots__ = ('_data', '_hash', '__weakref__')
+
+    def __init__(self, data):
+        self._data = data
+        self._hash = None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self._data.items()))
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return Mapping.__eq__(self, other)
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (make_box_record, (dict(self._data),))
+
+    def updated(self, changes):
+        """
+        routine for returning the record with the entries of 'changes'
+        replaced
+
+        Parameters
+        ----------
+        changes : dict
+            having the keys to be replaced as keys and the new values as
+            values.
+
+        Returns
+        -------
+        record : BoxRecord
+            representing the changed box.
+
+        """
+
+        data = dict(self._data)
+        data.update(changes)
+
+        return make_box_record(data)
+
+    def without(self, *keys):
+        """
+        routine for returning the record without the entries 'keys', e.g.,
+        after the box bounds changed and the estimators became invalid
+
+        Parameters
+        ----------
+        *keys : str
+            representing the entries to be removed.
+
+        Returns
+        -------
+        record : BoxRecord
+            representing the box without the removed entries.
+
+        """
+
+        if not any(k in self._data for k in keys):
+            return self
+
+        return make_box_record({k: v for k, v in self._data.items() if k not in keys})
+
+
+# all box records which are currently referenced by some partition
+box_store = weakref.WeakValueDictionary()
+
+
+def freeze_value(value):
+    """
+    routine for converting a value of a box into its immutable counterpart
+
+    """
+
+    if isinstance(value, BoxRecord):
+        return value
+    if isinstance(value, Mapping):
+        return make_box_record(value)
+    if isinstance(value, list):
+        return tuple(value)
+
+    return value
+
+
+def make_box_record(data):
+    """
+    routine for returning the interned box record with content 'data'
+
+    Parameters
+    ----------
+    data : dict
+        containing all information of a box, i.e., variable bounds and,
+        optionally, least square weight and estimation errors.
+
+    Returns
+    -------
+    record : BoxRecord
+        representing the box.
+
+    """
+
+    if isinstance(data, BoxRecord):
+        return data
+
+    data = {k: freeze_value(v) for k, v in data.items()}
+    key = tuple(data.items())
+
+    try:
+        record = box_store.get(key)
+    except TypeError:
+        # unhashable content is not interned
+        return BoxRecord(data)
+
+    if record is None:
+        record = BoxRecord(data)
+        box_store[key] = record
+
+    return record
+
+
+class BoxPartition(MutableMapping):
+    """
+    copy-on-write partition of the domain of a nonlinear constraint/objective
+    mapping box keys to box records
+
+    a partition consists of a stack of frozen layers, which may be shared with
+    other partitions, and a private overlay holding its own changes. Copying
+    a partition freezes the overlay and shares the resulting stack, such that
+    the copy costs O(1) and memory only grows with the changed boxes
+
+    """
+
+    __slots__ = ('_layers', '_overlay')
+
+    def __init__(self, boxes=None, layers=()):
+        self._layers = layers
+        self._overlay = {}
+
+        if boxes is not None:
+            for b, box in boxes.items():
+                self[b] = box
+
+    def __getitem__(self, b):
+        box = self._overlay.get(b)
+        if box is None:
+            for layer in reversed(self._layers):
+                box = layer.get(b)
+                if box is not None:
+                    break
+
+        if box is None or box is DELETED:
+            raise KeyError(b)
+
+        return box
+
+    def __contains__(self, b):
+        try:
+            self[b]
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, b, box):
+        # a box which is added again after its removal has to appear at the
+        # end of the partition, as it would for a plain dict
+        if self._overlay.get(b) is DELETED and len(self._layers) > 0:
+            self.compact()
+
+        self._overlay[b] = make_box_record(box)
+
+    def __delitem__(self, b):
+        if b not in self:
+            raise KeyError(b)
+
+        if any(b in layer for layer in self._layers):
+            self._overlay[b] = DELETED
+        else:
+            del self._overlay[b]
+
+    def merged(self):
+        """
+        routine for returning the boxes of the partition in the order they
+        were introduced
+
+        Returns
+        -------
+        boxes : dict
+            having the box keys as keys and the box records as values.
+
+        """
+
+        boxes = {}
+        for layer in self._layers + (self._overlay,):
+            for b, box in layer.items():
+                if box is DELETED:
+                    boxes.pop(b, None)
+                else:
+                    boxes[b] = box
+
+        return boxes
+
+    def __iter__(self):
+        if len(self._layers) == 0:
+            return iter(list(self._overlay))
+        return iter(list(self.merged()))
+
+    def __len__(self):
+        if len(self._layers) == 0:
+            return len(self._overlay)
+        return len(self.merged())
+
+    def __repr__(self):
+        return repr(self.merged())
+
+    def compact(self):
+        """
+        routine for replacing the stack of layers by a single private overlay
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self._overlay = self.merged()
+        self._layers = ()
+
+    def copy(self):
+        """
+        routine for copying the partition in O(1) by freezing the private
+        overlay and sharing the stack of layers
+
+        Returns
+        -------
+        partition : BoxPartition
+            representing the copied partition.
+
+        """
+
+        if len(self._overlay) > 0:
+            self._layers = self._layers + (self._overlay,)
+            self._overlay = {}
+
+        if len(self._layers) > MAX_LAYERS:
+            self._layers = (self.merged(),)
+
+        return BoxPartition(layers=self._layers)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __reduce__(self):
+        return (BoxPartition, (self.merged(),))
@@ -9,6 +9,7 @@ Created on Fri Jun 28 14:27:42 2024
 from pyomo.environ import *
 import numpy as np
 
+from compute_relaxation_errors import *
 from rounding_routines import *
 
 import logging
@@ -58,6 +59,11 @@ def restricted_relaxed_weighted_sum(model, m, alpha, u, options, timelimit):
     except:
         relative_constraint_errors = False
 
+    # remove weighted objective and upper bounds of a previous solve
+    model.del_component('weighted_objective')
+    for i in np.arange(0,m):
+        model.del_component('upper_bound_for_'+str(i)+'-th_objective')
+
     # establish weighted objective function and upper bound constraints
     wobj = {}
     for i in np.arange(0,m):
@@ -119,58 +125,7 @@ def restricted_relaxed_weighted_sum(model, m, alpha, u, options, timelimit):
             solution[v.name] = value(v)
 
     # determine relaxation_errors
-    relaxation_errors = {}
-    max_error = 0
-    if relative_constraint_errors:
-        for c in model.component_objects(Constraint):
-            if c.body.polynomial_degree() != 1:
-                if not 'objective' in c.name:
-                    if not 'estimation' in c.name and not 'active' in c.name:
-                        if c.lb == c.ub:
-                            cons_rel_error = np.abs(c.ub - value(c))/max(np.abs(c.ub),1)
-                            relaxation_errors[c.name] = cons_rel_error
-                            max_error = max(max_error, cons_rel_error)
-                        elif c.lb != None:
-                            cons_rel_error = max(c.lb - value(c),0)/max(np.abs(c.lb),1)
-                            relaxation_errors[c.name] = cons_rel_error
-                            max_error = max(max_error, cons_rel_error)
-                        elif c.ub != None:
-                            cons_rel_error = max(value(c) - c.ub,0)/max(np.abs(c.ub),1)
-                            relaxation_errors[c.name] = cons_rel_error
-                            max_error = max(max_error, cons_rel_error)
-                else:
-                    if not 'estimation' in c.name and not 'active' in c.name:
-                        for obj in model.component_objects(Objective):
-                            if c.name in obj.name and 'estimation' in obj.name:
-                                obj_rel_error = np.abs(value(c) - value(obj))/max(np.abs(value(c)),1)
-                                relaxation_errors[c.name] = obj_rel_error
-                                max_error = max(max_error, obj_rel_error)
-
-    else:
-        for c in model.component_objects(Constraint):
-            if c.body.polynomial_degree() != 1:
-                if not 'objective' in c.name:
-                    if not 'estimation' in c.name and not 'active' in c.name:
-                        if c.lb == c.ub:
-                            cons_error = np.abs(c.ub - value(c))
-                            relaxation_errors[c.name] = cons_error
-                            max_error = max(max_error, cons_error)
-                        elif c.lb != None:
-                            cons_error = max(c.lb - value(c),0)
-                            relaxation_errors[c.name] = cons_error
-                            max_error = max(max_error, cons_error)
-                        elif c.ub != None:
-                            cons_error = max(value(c) - c.ub,0)
-                            relaxation_errors[c.name] = cons_error
-                            max_error = max(max_error, cons_error)
-                else:
-                    if not 'estimation' in c.name and not 'active' in c.name:
-                        for obj in model.component_objects(Objective):
-                            if c.name in obj.name and 'estimation' in obj.name:
-                                obj_error = np.abs(value(c) - value(obj))
-                                relaxation_errors[c.name] = obj_error
-                                max_error = max(max_error, obj_error)
-
+    relaxation_errors = compute_relaxation_errors(model,
+                                                  relative_constraint_errors)
 
-    relaxation_errors['max_error'] = max_error
     return objective_vector, solution, relaxation_errors, sol_time
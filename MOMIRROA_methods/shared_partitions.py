@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Nov  1 09:41:26 2026
+
+@author: moritz
+"""
+
+from lazy_box_info import *
+from relaxation_statistics import *
+from relaxation_store import *
+
+
+"""
+shared box partitions of nonlinear functions over the same variables
+
+nonlinear constraints and objectives whose boxes bound the same variables
+form a group. With shared partitions all functions of a group keep the same
+boxes: whenever the partition of one of them is refined, the refinement is
+passed on to the others. Every function keeps its own estimators on each
+box, but the relaxations select the active box of a group by a single set
+of binaries, those of its leader, i.e., the first function of the group in
+the relaxation information
+
+the refinement schemes bisect a box of a shared partition along the first
+longest edge w.r.t. the sorted variable names, such that all functions of a
+group split the same box alike. Partitions are only shared if their boxes
+coincide in their bounds and not only in their names
+
+"""
+
+class PartitionSharing():
+    """
+    switch deciding if functions over the same variables share their box
+    partitions
+
+    """
+
+    def __init__(self, shared=False):
+        self.configure(shared)
+
+    def configure(self, shared=False):
+        self.shared = shared
+
+
+# switch shared by all relaxations
+partition_sharing = PartitionSharing()
+
+
+def function_names(info):
+    """
+    routine for returning the names of all functions with a box partition
+
+    """
+
+    return [k for k in info.keys() if isinstance(info[k], BoxPartition)]
+
+
+def partition_signature(info, name):
+    """
+    routine for returning the set of variables bounded by the boxes of the
+    function 'name'
+
+    """
+
+    for b in info[name].keys():
+        return frozenset(box_variables(info[name][b]))
+
+    return frozenset()
+
+
+def same_box(box, other):
+    """
+    routine for checking if the boxes 'box' and 'other' have the same bounds
+
+    """
+
+    return all(tuple(box[v]) == tuple(other[v]) for v in box_variables(box))
+
+
+def contains_box(box, other):
+    """
+    routine for checking if the box 'box' contains the box 'other'
+
+    """
+
+    return all(box[v][0] <= other[v][0] and other[v][1] <= box[v][1]
+               for v in box_variables(box))
+
+
+def partition_groups(info):
+    """
+    routine for grouping the functions of 'info' by their variables
+
+    Returns
+    -------
+    groups : list
+        containing lists of the function names of each group with at least
+        two functions, the leader of a group comes first.
+
+    """
+
+    groups = {}
+    for name in function_names(info):
+        groups.setdefault(partition_signature(info, name), []).append(name)
+
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def partition_leader(info, name):
+    """
+    routine for returning the function whose box binaries select the active
+    box of the function 'name', that is 'name' itself if its partition is not
+    shared
+
+    """
+
+    if not partition_sharing.shared:
+        return name
+
+    signature = partition_signature(info, name)
+    boxes = list(info[name].keys())
+    for other in function_names(info):
+        if other == name:
+            break
+        if partition_signature(info, other) == signature and list(info[other].keys()) == boxes \
+                and all(same_box(info[other][b], info[name][b]) for b in boxes):
+            return other
+
+    return name
+
+
+def synchronize_partitions(info, lazy=False):
+    """
+    routine for passing on the refinements of a function of a group to all
+    other functions of the group, such that the partitions of the group
+    coincide
+
+    the boxes of all partitions are leaves of the same bisection tree, i.e.,
+    the children of box 'b' are 'b0' and 'b1'. The common refinement of the
+    group consists of all boxes which are not bisected in any partition, and
+    a function without such a box derives it from its ancestor. A group whose
+    partitions do not fit into one bisection tree, i.e., boxes of the same
+    name differ or a derived box does not lie in its ancestor, is left
+    unchanged and its functions keep their own binaries
+
+    Parameters
+    ----------
+    info : dict
+        containing all information for setting up the current piecewise
+        linear relaxation of the problem of interest.
+    lazy : bool, optional
+        deciding if derived boxes inherit the estimators of their ancestor.
+        The default is False.
+
+    Returns
+    -------
+    info : dict
+        containing the synchronized relaxation information.
+
+    """
+
+    if not partition_sharing.shared:
+        return info
+
+    for group in partition_groups(info):
+        # boxes of the common refinement in the order of the leader
+        names = []
+        for name in group:
+            names += [b for b in info[name].keys() if b not in names]
+        leaves = [b for b in names if not any(a != b and a.startswith(b) for a in names)]
+
+        # the boxes of the same name have to coincide and the derived boxes
+        # have to lie in their ancestors
+        boxes = {}
+        consistent = True
+        for name in group:
+            for b in info[name].keys():
+                if b in boxes and not same_box(boxes[b], info[name][b]):
+                    consistent = False
+                boxes.setdefault(b, info[name][b])
+
+        for name in group:
+            for b in leaves:
+                ancestors = [a for a in info[name].keys() if b.startswith(a)]
+                if len(ancestors) > 0 and not contains_box(info[name][max(ancestors, key=len)], boxes[b]):
+                    consistent = False
+
+        if not consistent:
+            count_statistic('inconsistent shared partitions')
+            continue
+
+        partitions = {}
+        for name in group:
+            if list(info[name].keys()) == leaves:
+                continue
+
+            partition = {}
+            for b in leaves:
+                if b in info[name]:
+                    partition[b] = info[name][b]
+                    continue
+
+                # derive the box from the function which has it
+                source = [info[other][b] for other in group if b in info[other]][0]
+                ancestors = [a for a in info[name].keys() if b.startswith(a)]
+                record = source
+                if len(ancestors) > 0:
+                    record = info[name][max(ancestors, key=len)]
+                if lazy and len(ancestors) > 0 and 'weight' in record.keys():
+                    record = record.updated({'loose': True})
+                else:
+                    record = record.without(*ESTIMATOR_KEYS)
+                partition[b] = record.updated({v: source[v] for v in box_variables(source)})
+                count_statistic('shared box refinements')
+
+            partitions[name] = BoxPartition(partition)
+
+        info.update(partitions)
+
+    return info
@@ -8,16 +8,257 @@ Created on Tue Jul  2 11:00:34 2024
 
 from pyomo.environ import *
 
+import numpy as np
+
 from relax_model import *
+from relax_model_linear import *
 from relax_model_McCormick import *
+from relaxation_statistics import *
 from rounding_routines import *
 
 
+class OBBTModel():
+    """
+    piecewise linear relaxation restricted by the objective cut-offs of an
+    OBBT sweep
+
+    the relaxation is identical for all bounds of a sweep, hence it is built
+    once and only the objective is swapped between minimizing and maximizing
+    the variable whose bound is tightened. The variable values of the model
+    serve as warm start, starting with the optimal values of 'solution' and
+    afterwards the solution of the previous bound
+
+    the relaxation is either the MILP or its LP relaxation, which is set up
+    with the hull formulation since the LP relaxation of the products of the
+    box binaries and the variables is not linear. Every point of the
+    relaxation attaining a variable bound proves that this bound cannot be
+    tightened, hence bounds attained by 'solution' or the optimum of a
+    previous bound are skipped
+
+    """
+
+    def __init__(self, call_model, u, info, solution, options, timelimit, relaxation='MILP'):
+        """
+        routine for setting up the relaxed model of an OBBT sweep
+
+        Parameters
+        ----------
+        call_model : function
+            returning a pyomo model of the problem to be solved.
+        u : ndarray
+            representing the current objective cut-offs.
+        info : dict
+            containing all information for setting up the current piecewise
+            linear relaxation of the model of interest.
+        solution : dict
+            with variable names as keys and corresponding optimal values as
+            values.
+        options : structure
+            containing all optional settings for the algorithm.
+        timelimit : float
+            representing the time limit for computing missing box information.
+        relaxation : str, optional
+            representing the relaxation the bounds are tightened on, 'MILP'
+            or 'LP'. The McCormick relaxations are not linear, hence they are
+            always solved as MILP. The default is 'MILP'.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        # catch options
+        try:
+            milp_solver = options.milp_solver
+        except:
+            milp_solver = 'gurobi'
+
+        try:
+            self.OBBT_timelimit = options.OBBT_timelimit
+        except:
+            self.OBBT_timelimit = timelimit
+
+        try:
+            OBBT_gap = options.OBBT_gap
+        except:
+            OBBT_gap = False
+
+        try:
+            options.McCormick
+        except:
+            options.McCormick = False
+
+        # set up relaxed model
+        model = call_model(0)
+
+        if options.McCormick:
+            relaxation = 'MILP'
+            model, info, box_counter = relax_model_McCormick(model, call_model, info)
+        elif relaxation == 'LP':
+            model, info, box_counter = relax_model_linear(model, call_model, info, timelimit,
+                                                          formulation='hull')
+        else:
+            model, info, box_counter = relax_model(model, call_model, info, timelimit)
+
+        count_statistic('OBBT model builds')
+        self.relaxation = relaxation
+
+        # introduce upper bounds on objectives
+        for i in np.arange(0,len(u)):
+            for o in model.component_objects(Objective):
+                if 'objective'+str(i) in o.name:
+                    model.add_component('upper_bound_on_'+str(i)+'-th_objective',
+                                        Constraint(expr = o.expr - u[i] <= 0))
+                    o.deactivate()
+
+        # catch variables and set warm starts
+        self.vars = {}
+        for v in model.component_objects(Var):
+            for i in v.index_set():
+                self.vars[v[i].name] = v[i]
+                if v[i].name in solution:
+                    v[i] = solution[v[i].name]
+
+        # objective which is swapped for every bound
+        model.new_bound = Objective(expr = 0)
+        self.model = model
+
+        if relaxation == 'LP':
+            TransformationFactory('core.relax_integer_vars').apply_to(model)
+
+        # bounds attained by a point of the relaxation, starting with 'solution'
+        self.bounds = {v: list(b[:2]) for v, b in info['bounds'].items()}
+        self.discrete = [v for v, b in info['bounds'].items() if 'discrete' in b]
+        self.attained = set()
+        self.filter_bounds()
+
+        # set up solver
+        self.opt = SolverFactory(milp_solver)
+
+        if milp_solver == 'gurobi':
+            if self.OBBT_timelimit:
+                self.opt.options['TimeLimit'] = self.OBBT_timelimit
+            if OBBT_gap:
+                self.opt.options['MIPGap'] = OBBT_gap
+        elif milp_solver == 'scip':
+            if self.OBBT_timelimit:
+                self.opt.options['limits/time'] = self.OBBT_timelimit
+            if OBBT_gap:
+                self.opt.options['limits/gap'] = OBBT_gap
+
+        # solvers reading the model from a file take the variable values as
+        # initial point anyway
+        self.solve_options = {}
+        if self.opt.warm_start_capable():
+            self.solve_options['warmstart'] = True
+
+    def filter_bounds(self, tol=1e-6):
+        """
+        routine for marking all bounds attained by the current variable values
+        of the model, which are the optimal values of 'solution' or the last
+        loaded solution
+
+        """
+
+        for name, (lower, upper) in self.bounds.items():
+            if not name in self.vars or self.vars[name].value is None:
+                continue
+
+            value = self.vars[name].value
+            if np.abs(value - lower) <= tol:
+                self.attained.add(name+'_lower')
+            if np.abs(value - upper) <= tol:
+                self.attained.add(name+'_upper')
+
+    def tighten_bound(self, var, ind):
+        """
+        routine for tightening the lower/upper -- indicated by 'ind' --
+        variable bound of 'var'
+
+        Parameters
+        ----------
+        var : str
+            representing the variable name which is to be tightened.
+        ind : str
+            determining if the lower or the upper bound of the variable should
+            be tightened.
+
+        Returns
+        -------
+        result : tuple or None
+            containing the possibly tightened bound and the solution time of
+            the problem, None if the bound is attained by a known point of the
+            relaxation.
+
+        """
+
+        if var+'_'+ind in self.attained:
+            count_statistic('OBBT filtered bounds')
+            return None
+
+        v = self.vars[var]
+
+        # determine new objective function
+        self.model.new_bound.set_value(v)
+        if ind == 'lower':
+            self.model.new_bound.sense = minimize
+            old_bound = v.lb
+        else:
+            self.model.new_bound.sense = maximize
+            old_bound = v.ub
+
+        # solve model
+        results = self.opt.solve(self.model,
+                                 tee=False,
+                                 load_solutions=False,
+                                 options={'threads': 1},
+                                 **self.solve_options)
+
+        count_statistic('OBBT '+self.relaxation+' solves')
+
+        try:
+            sol_time = results.solver.time
+        except:
+            sol_time = self.OBBT_timelimit
+
+        # keep the solution as warm start for the next bound and skip all
+        # bounds it attains
+        if len(results.solution) > 0:
+            self.model.solutions.load_from(results)
+            self.filter_bounds()
+
+        # catch new bound
+        if ind == 'lower':
+            new_bound = results.problem.lower_bound
+        else:
+            new_bound = results.problem.upper_bound
+
+        if type(new_bound) == str:
+            return old_bound, sol_time
+
+        # the LP bound of an integer variable is rounded to the next integer
+        if self.relaxation == 'LP' and var in self.discrete:
+            if ind == 'lower':
+                new_bound = np.ceil(new_bound - 1e-6)
+            else:
+                new_bound = np.floor(new_bound + 1e-6)
+
+        # round bound
+        if ind == 'lower':
+            new_bound = rounding_lower(new_bound, 4)
+        else:
+            new_bound = rounding_upper(new_bound, 4)
+
+        return new_bound, sol_time
+
+
 def tighten_bound(call_model, var, ind, u, info, solution, options, timelimit):
     """
     routine for tightening the lower/upper -- indicated by 'ind' -- variable
     bound of 'var' using the objective cut-offs of the local upper bound 'u'
-    and the optimal values of 'solution' as warm start
+    and the optimal values of 'solution' as warm start, where the relaxed
+    model is set up for this bound only
 
 
     Parameters
@@ -48,107 +289,10 @@ def tighten_bound(call_model, var, ind, u, info, solution, options, timelimit):
 
     """
 
-    # catch options
-    try:
-        milp_solver = options.milp_solver
-    except:
-        milp_solver = 'gurobi'
-
-    try:
-        OBBT_timelimit = options.OBBT_timelimit
-    except:
-        OBBT_timelimit = timelimit
-
-    try:
-        OBBT_gap = options.OBBT_gap
-    except:
-        OBBT_gap = False
-        
-    try:
-        options.McCormick
-    except:
-        options.McCormick = False
-
-    # set up relaxed model
-    model = call_model(0)
-    
-    if options.McCormick:
-        model, info, box_counter = relax_model_McCormick(model, call_model, info)
-    else:
-        model, info, box_counter = relax_model(model, call_model, info, timelimit)
-
-    # introduce upper bounds on objectives
-    for i in np.arange(0,len(u)):
-        for o in model.component_objects(Objective):
-            if 'objective'+str(i) in o.name:
-                model.add_component('upper_bound_on_'+str(i)+'-th_objective',
-                                    Constraint(expr = o.expr - u[i] <= 0))
-                o.deactivate()
-
-    # determine new objective function and set warm starts
-    for v in model.component_objects(Var):
-        if v.is_indexed():
-            for i in v.index_set():
-                if v[i].name == var:
-                    if ind == 'lower':
-                        model.new_bound = Objective(expr = v[i])
-                        old_bound = v[i].lb
-                    elif ind == 'upper':
-                        model.new_bound = Objective(expr = v[i],
-                                                      sense=maximize)
-                        old_bound = v[i].ub
-                # set warm starts
-                v[i] = solution[v[i].name]
-        else:
-            if v.name == var:
-                if ind == 'lower':
-                    model.new_bound = Objective(expr = v)
-                    old_bound = v.lb
-                elif ind == 'upper':
-                    model.new_bound = Objective(expr = v,
-                                                  sense=maximize)
-                    old_bound = v.ub
-            # set warm starts
-            v = solution[v.name]
-
-    # solve model
-    opt = SolverFactory(milp_solver)
-
-    if milp_solver == 'gurobi':
-        if OBBT_timelimit:
-            opt.options['TimeLimit'] = OBBT_timelimit
-        if OBBT_gap:
-            opt.options['MIPGap'] = OBBT_gap
-    elif milp_solver == 'scip':
-        if OBBT_timelimit:
-            opt.options['limits/time'] = OBBT_timelimit
-        if OBBT_gap:
-            opt.options['limits/gap'] = OBBT_gap
-
-    results = opt.solve(model,
-                        tee=False,
-                        warmstart=True,
-                        load_solutions=False,
-                        options={'threads': 1})
-
-    try:
-        sol_time = results.solver.time
-    except:
-        sol_time = OBBT_timelimit
-
-    # catch new bound
-    if ind == 'lower':
-        new_bound = results.problem.lower_bound
-    else:
-        new_bound = results.problem.upper_bound
-
-    if type(new_bound) == str:
-        return old_bound, sol_time
-
-    # round bound
-    if ind == 'lower':
-        new_bound = rounding_lower(new_bound, 4)
-    else:
-        new_bound = rounding_upper(new_bound, 4)
-
-    return new_bound, sol_time
+    model = OBBTModel(call_model, u, info, solution, options, timelimit)
+    result = model.tighten_bound(var, ind)
+
+    if result is None:
+        return model.bounds[var][0 if ind == 'lower' else 1], 0
+
+    return result
@@ -11,10 +11,12 @@ import time
 
 from find_feas_point import *
 from find_points import *
+from incremental_relaxation import *
+from persistent_relaxation_solver import *
+from record_zone_event import *
 from relax_model import *
 from relax_model_McCormick import *
 from restricted_relaxed_weighted_sum import *
-from update_llbs import *
 
 def twostage_search(call_model, u, encl_dict, alpha, info, options, it):
     """
@@ -53,6 +55,18 @@ def twostage_search(call_model, u, encl_dict, alpha, info, options, it):
     except:
         milp_solver = 'gurobi'
 
+    # catch backend for solving the relaxed problems
+    try:
+        milp_backend = options.milp_backend
+    except:
+        milp_backend = 'pyomo'
+
+    # check if the relaxation should be kept alive across refinement steps
+    try:
+        incremental_relaxation = options.incremental_relaxation
+    except:
+        incremental_relaxation = False
+
     # catch upper bound on refinement steps before looking for feasible point
     try:
         refine_until_feasible_search = options.refine_until_feasible_search
@@ -73,31 +87,61 @@ def twostage_search(call_model, u, encl_dict, alpha, info, options, it):
     # intialize counter for refinement steps
     count = 0
     
+    # initialize relaxation kept alive across refinement steps
+    live_relaxation = None
+    
     while not improved:
-        # build relaxed problem
-        model = call_model(0)
-        if options.McCormick:
-            model, info, box_counter = relax_model_McCormick(model,
-                                                             call_model,
-                                                             info,
-                                                             sub_timelimit)
+        if milp_backend == 'pyscipopt':
+            # load persistent relaxed problem
+            relaxation, info, build_time = load_persistent_relaxation(
+                call_model,
+                m,
+                info,
+                options,
+                sub_timelimit)
+            box_counter = relaxation.box_counter
+
+            # solve relaxed weighted sum problem
+            solvec, solution, relaxation_errors, sol_time = relaxation.solve(
+                alpha,
+                u - encl_dict['factor_delta'] * encl_dict['dir_vec'],
+                options,
+                encl_dict['timeout'])
+
         else:
-            model, info, box_counter = relax_model(model,
-                                                   call_model,
-                                                   info,
-                                                   sub_timelimit)
-
-        # solve relaxed weighted sum problem
-        solvec, solution, relaxation_errors, sol_time = restricted_relaxed_weighted_sum(
-            model,
-            m,
-            alpha,
-            u - encl_dict['factor_delta'] * encl_dict['dir_vec'],
-            options,
-            encl_dict['timeout'])
+            # build relaxed problem
+            build_start = time.time()
+            if incremental_relaxation and not options.McCormick:
+                if live_relaxation is None:
+                    live_relaxation = IncrementalRelaxation(call_model,
+                                                            sub_timelimit)
+                model, info, box_counter = live_relaxation.update(info)
+            elif options.McCormick:
+                model = call_model(0)
+                model, info, box_counter = relax_model_McCormick(model,
+                                                                 call_model,
+                                                                 info,
+                                                                 sub_timelimit)
+            else:
+                model = call_model(0)
+                model, info, box_counter = relax_model(model,
+                                                       call_model,
+                                                       info,
+                                                       sub_timelimit)
+            build_time = time.time() - build_start
+
+            # solve relaxed weighted sum problem
+            solvec, solution, relaxation_errors, sol_time = restricted_relaxed_weighted_sum(
+                model,
+                m,
+                alpha,
+                u - encl_dict['factor_delta'] * encl_dict['dir_vec'],
+                options,
+                encl_dict['timeout'])
 
         encl_dict['analysis'][str(it)]['relaxedproblemcounter'] += 1
         encl_dict['analysis'][str(it)]['relaxed_solution_time'] += sol_time
+        encl_dict['analysis'][str(it)]['relaxed_build_time'] += build_time
         encl_dict['analysis'][str(it)]['preimageboxcounter'] += box_counter
         encl_dict['analysis'][str(it)]['maxpreimageboxes'] = max(box_counter,
                          encl_dict['analysis'][str(it)]['maxpreimageboxes'])
@@ -119,11 +163,13 @@ def twostage_search(call_model, u, encl_dict, alpha, info, options, it):
 
         else:
             print('search zone is empty')
-            encl_dict['llbs'], encl_dict['Ldefpois'] = update_llbs(
-                encl_dict['llbs'],
-                encl_dict['Ldefpois'],
+            encl_dict['llbs'].update(
                 u - encl_dict['factor_delta'] * encl_dict['dir_vec'])
 
+            record_zone_event(encl_dict,
+                              'llb',
+                              u - encl_dict['factor_delta'] * encl_dict['dir_vec'])
+
             encl_dict['analysis'][str(it)]['# of search zones closed'] += 1
             improved = True
 
@@ -10,7 +10,10 @@ import copy as cp
 import numpy as np
 import sys
 
-def uniform_refinement_procedure(info, rel_errors, options):
+from lazy_box_info import *
+from shared_partitions import *
+
+def uniform_refinement_procedure(info, rel_errors, options, solution=None):
     """
     routine for uniform refinement of current relaxation, that is performing
     a longest edge bisection of each box belonging to a partition of a variable
@@ -26,6 +29,10 @@ def uniform_refinement_procedure(info, rel_errors, options):
         constraint/objective violation errors as values.
     options : structure
         containing all optional settings for the algorithm.
+    solution : dict, optional
+        having the variable names as keys and the corresponding optimal
+        values as values, needed for tightening loose boxes. The default is
+        None.
 
     Returns
     -------
@@ -40,11 +47,20 @@ def uniform_refinement_procedure(info, rel_errors, options):
         cons_vio_tol = options.constraint_tolerance
     except:
         cons_vio_tol = 1e-3
+    
+    # catch if bisected boxes inherit the estimators of their parent
+    try:
+        lazy_box_info = options.lazy_box_info
+    except:
+        lazy_box_info = False
         
     # determine constraints and objectives which are violated too heavily
     bad_cons = [c for c in list(rel_errors.keys()) if rel_errors[c] > cons_vio_tol]
     bad_cons.remove('max_error')
     
+    # functions sharing their partitions are selected by the same binaries
+    leaders = {c: partition_leader(info, c) for c in bad_cons}
+
     for c in bad_cons:
         # catch boxes belonging to partition for that constraint
         try:
@@ -52,21 +68,26 @@ def uniform_refinement_procedure(info, rel_errors, options):
         except:
             print('something wrong')
         
+        # loose boxes are only tightened if they are selected by the
+        # relaxation, or all of them if no box is selected
+        active_box = None
+        if solution is not None and any('loose' in info[c][b].keys() for b in boxes):
+            active_box = find_active_box(info, c, solution, box_variables(info[c][boxes[0]]),
+                                         leaders[c])
+        
         for b in boxes:
+            if 'loose' in info[c][b].keys():
+                if active_box is None or b == active_box:
+                    info[c][b] = tighten_record(info[c][b])
+                continue
+            
             # catch variable names relevant for that constraint
-            vars = list(info[c][b].keys())
-            try:
-                vars.remove('weight')
-            except:
-                None
-            try:
-                vars.remove('underest_error')
-            except:
-                None
-            try:
-                vars.remove('overest_error')
-            except:
-                None
+            vars = box_variables(info[c][b])
+            
+            # functions sharing their partitions bisect a box along the same
+            # variable
+            if partition_sharing.shared:
+                vars = sorted(vars)
             
             # check for discrete variables that should not be bisected anymore
             delete_box = False
@@ -93,34 +114,26 @@ def uniform_refinement_procedure(info, rel_errors, options):
             
             # make sure we have max_var
             if type(max_var) == str:
-                # delete old weights and stuff
-                try:
-                    del info[c][b]['weight']
-                except:
-                    None
-                try:
-                    del info[c][b]['underest_error']
-                except:
-                    None
-                try:
-                    del info[c][b]['overest_error']
-                except:
-                    None
+                # delete old weights and stuff or pass them on to the children
+                info[c][b] = child_record(info[c][b], lazy_box_info)
                 
                 # build new boxes
-                info[c][b+'0'] = cp.deepcopy(info[c][b])
+                lower, upper = info[c][b][max_var]
                 if 'discrete' in info['bounds'][max_var]:
-                    info[c][b+'0'][max_var][1] = np.floor(info[c][b][max_var][0] + max_len/2)
+                    info[c][b+'0'] = info[c][b].updated(
+                        {max_var: (lower, np.floor(lower + max_len/2))})
                     
                 else:
-                    info[c][b+'0'][max_var][1] = info[c][b][max_var][0] + max_len/2
+                    info[c][b+'0'] = info[c][b].updated(
+                        {max_var: (lower, lower + max_len/2)})
                 
-                info[c][b+'1'] = cp.deepcopy(info[c][b])
                 if 'discrete' in info['bounds'][max_var]:
-                    info[c][b+'1'][max_var][0] = np.ceil(info[c][b][max_var][0] + max_len/2)
+                    info[c][b+'1'] = info[c][b].updated(
+                        {max_var: (np.ceil(lower + max_len/2), upper)})
                 
                 else:
-                    info[c][b+'1'][max_var][0] = info[c][b][max_var][0] + max_len/2
+                    info[c][b+'1'] = info[c][b].updated(
+                        {max_var: (lower + max_len/2, upper)})
                 
                 del info[c][b]
             
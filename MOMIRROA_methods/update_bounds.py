@@ -73,21 +73,14 @@ def update_bounds(new_bound, v, ind, info):
                                     continue
                                 
                                 else:
-                                    info[c][b][v][0] = new_bound
-                                    
-                                    # delete former box information
-                                    try:
-                                        del info[c][b]['weight']
-                                    except:
-                                        None
-                                    try:
-                                        del info[c][b]['overest_error']
-                                    except:
-                                        None
-                                    try:
-                                        del info[c][b]['underest_error']
-                                    except:
-                                        None
+                                    # shrink box and delete former box
+                                    # information
+                                    info[c][b] = info[c][b].without(
+                                        'weight',
+                                        'overest_error',
+                                        'underest_error',
+                                        'loose').updated(
+                                            {v: (new_bound, info[c][b][v][1])})
 
                                     # check if box is doubled
                                     current_boxes = [b for b in info[c].keys() if 'box' in b]
@@ -115,21 +108,14 @@ def update_bounds(new_bound, v, ind, info):
                                     continue
                                 
                                 else:
-                                    info[c][b][v][1] = new_bound
-                                    
-                                    # delete former box information
-                                    try:
-                                        del info[c][b]['weight']
-                                    except:
-                                        None
-                                    try:
-                                        del info[c][b]['overest_error']
-                                    except:
-                                        None
-                                    try:
-                                        del info[c][b]['underest_error']
-                                    except:
-                                        None
+                                    # shrink box and delete former box
+                                    # information
+                                    info[c][b] = info[c][b].without(
+                                        'weight',
+                                        'overest_error',
+                                        'underest_error',
+                                        'loose').updated(
+                                            {v: (info[c][b][v][0], new_bound)})
                                         
                                     # check if box is doubled
                                     current_boxes = [b for b in info[c].keys() if 'box' in b]
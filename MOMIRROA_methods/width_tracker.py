@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 10:37:18 2026
+
+@author: moritz
+"""
+
+from collections import Counter
+
+import heapq
+import numpy as np
+
+
+class WidthTracker():
+    """
+    incremental computation of the relative width of the enclosure determined
+    by lubs and llbs w.r.t. the vector dir_vec
+
+    the tracker is told which llbs and lubs were added or removed and keeps a
+    max-heap of the widths of all boxes, i.e., pairs with llb < lub in every
+    dimension. Adding a bound only computes the widths of its own boxes,
+    removed bounds are dropped lazily from the top of the heap. Ties are
+    broken in favour of the bounds added first, which reproduces the choice
+    of 'compute_width' for lists to which new bounds are appended
+
+    the bounds of one kind are either passed by 'add_llbs'/'remove_llbs'
+    ('add_lubs'/'remove_lubs') with own keys or by the 'sync' routines, but
+    not both
+
+    """
+
+    def __init__(self, dir_vec):
+        """
+        routine for initializing an empty tracker
+
+        Parameters
+        ----------
+        dir_vec : array
+            representing the direction of the width measure.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.dir_vec = np.asarray(dir_vec, dtype=float)
+
+        # internal keys are handed out in increasing order
+        self._next_key = 0
+
+        # bounds and external keys per internal key and the number of boxes
+        # pushed per internal key
+        self._bounds = {'llb': {}, 'lub': {}}
+        self._keys = {'llb': {}, 'lub': {}}
+        self._counts = np.zeros(64, dtype=np.int64)
+
+        # number of new bounds whose boxes are computed at once
+        self.chunk_size = 256
+
+        # stacked bounds of either kind for the computation of new boxes
+        self._stacked = {'llb': None, 'lub': None}
+
+        # origin of the bounds given to 'sync'
+        self._lineage = {'llb': None, 'lub': None}
+
+        # entries (-width, llb key * 2^32 + lub key), such that ties are
+        # broken lexicographically, and an upper bound on the number of stale
+        # ones
+        self._heap = []
+        self._stale = 0
+
+    def _stack(self, kind):
+        # stacked bounds of one kind together with their internal keys
+        if self._stacked[kind] is None:
+            keys = np.fromiter(self._bounds[kind].keys(), dtype=np.int64)
+            if len(keys) > 0:
+                rows = np.stack(list(self._bounds[kind].values()), axis=0)
+            else:
+                rows = np.empty((0, self.dir_vec.size))
+            self._stacked[kind] = (keys, rows)
+
+        return self._stacked[kind]
+
+    def _count(self, internal, amount=1):
+        # count pushed boxes per internal key
+        if self._next_key > len(self._counts):
+            self._counts = np.concatenate([self._counts,
+                                           np.zeros(max(self._next_key, 2*len(self._counts)),
+                                                    dtype=np.int64)])
+        np.add.at(self._counts, internal, amount)
+
+    def _add(self, kind, keys, bounds):
+        # add bounds of one kind and push the widths of their boxes
+        other = 'lub' if kind == 'llb' else 'llb'
+        other_keys, other_rows = self._stack(other)
+
+        keys = list(keys)
+        if len(keys) == 0:
+            return
+
+        X = np.array([np.asarray(b, dtype=float) for b in bounds]).reshape(len(keys), -1)
+        internal = np.arange(self._next_key, self._next_key + len(keys), dtype=np.int64)
+        self._next_key += len(keys)
+
+        for key, i, bound in zip(keys, internal.tolist(), X):
+            self._keys[kind][key] = i
+            self._bounds[kind][i] = bound
+        self._stacked[kind] = None
+
+        if len(other_keys) == 0:
+            return
+
+        entries = []
+        for c in range(0, len(keys), self.chunk_size):
+            # same operations as in 'compute_width' for identical widths
+            if kind == 'llb':
+                diff = other_rows[None, :, :] - X[c:c+self.chunk_size, None, :]
+            else:
+                diff = X[c:c+self.chunk_size, None, :] - other_rows[None, :, :]
+            valid = (diff > 0).all(axis=2)
+            s_vals = (diff / self.dir_vec[None, None, :]).min(axis=2)
+
+            rows, cols = np.nonzero(valid)
+            new_keys = internal[c:c+self.chunk_size][rows]
+            box_keys = other_keys[cols]
+            if kind == 'llb':
+                pairs = (new_keys << 32) | box_keys
+            else:
+                pairs = (box_keys << 32) | new_keys
+            entries += zip((-s_vals[rows, cols]).tolist(), pairs.tolist())
+
+            self._count(new_keys)
+            self._count(box_keys)
+
+        # push few entries one by one, otherwise rebuild the heap
+        if 4 * len(entries) < len(self._heap):
+            for e in entries:
+                heapq.heappush(self._heap, e)
+        else:
+            self._heap += entries
+            heapq.heapify(self._heap)
+
+    def _remove(self, kind, keys):
+        # remove bounds of one kind, their boxes become stale
+        for key in keys:
+            i = self._keys[kind].pop(key)
+            del self._bounds[kind][i]
+            self._stale += int(self._counts[i])
+            self._counts[i] = 0
+
+        self._stacked[kind] = None
+
+        # compact the heap if most of its entries are stale
+        if self._stale > 64 and 2 * self._stale > len(self._heap):
+            pairs = np.fromiter((e[1] for e in self._heap),
+                                dtype=np.int64,
+                                count=len(self._heap))
+            llb_keys, lub_keys = pairs >> 32, pairs & 0xFFFFFFFF
+            alive = np.isin(llb_keys, self._stack('llb')[0])\
+                & np.isin(lub_keys, self._stack('lub')[0])
+
+            self._heap = [self._heap[i] for i in np.nonzero(alive)[0].tolist()]
+            heapq.heapify(self._heap)
+
+            self._counts[:] = 0
+            self._count(llb_keys[alive])
+            self._count(lub_keys[alive])
+            self._stale = 0
+
+    def add_llbs(self, keys, bounds):
+        """
+        routine for adding local lower bounds
+
+        Parameters
+        ----------
+        keys : list
+            containing hashable keys identifying the new local lower bounds.
+        bounds : list
+            containing the new local lower bounds.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self._add('llb', keys, bounds)
+
+    def add_lubs(self, keys, bounds):
+        """
+        routine for adding local upper bounds
+
+        Parameters
+        ----------
+        keys : list
+            containing hashable keys identifying the new local upper bounds.
+        bounds : list
+            containing the new local upper bounds.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self._add('lub', keys, bounds)
+
+    def remove_llbs(self, keys):
+        """
+        routine for removing the local lower bounds with keys 'keys'
+
+        """
+
+        self._remove('llb', keys)
+
+    def remove_lubs(self, keys):
+        """
+        routine for removing the local upper bounds with keys 'keys'
+
+        """
+
+        self._remove('lub', keys)
+
+    def _sync(self, kind, bounds):
+        # bring the bounds of one kind in line with 'bounds'
+        current = self._keys[kind]
+
+        if hasattr(bounds, 'lineage'):
+            # local bound set: IDs are unique within a lineage, a rebuilt set
+            # is synchronized from scratch
+            if self._lineage[kind] != bounds.lineage:
+                self._remove(kind, list(current))
+                self._lineage[kind] = bounds.lineage
+
+            ids = bounds.ids.tolist()
+            alive = set(ids)
+            self._remove(kind, [k for k in current if k not in alive])
+
+            new = [(i, row) for i, row in zip(ids, bounds.bounds) if i not in current]
+            self._add(kind, [i for i, row in new], [row for i, row in new])
+
+        else:
+            # list of arrays: bounds are identified by their exact values,
+            # i.e., a bound removed and added again in between is unchanged,
+            # and of equal bounds the ones added last are kept
+            if self._lineage[kind] is not None:
+                self._remove(kind, list(current))
+                self._lineage[kind] = None
+
+            old = {}
+            for key in current:
+                old.setdefault(key[0], []).append(key)
+
+            removed, new_keys, new_bounds = [], [], []
+            occurrences = Counter()
+            for row in bounds:
+                value = (np.asarray(row, dtype=float) + 0.0).tobytes()
+                occurrences[value] += 1
+                if occurrences[value] > len(old.get(value, [])):
+                    new_keys.append((value, self._next_key + len(new_keys)))
+                    new_bounds.append(row)
+
+            for value, keys in old.items():
+                removed += keys[:max(len(keys) - occurrences[value], 0)]
+
+            self._remove(kind, removed)
+            self._add(kind, new_keys, new_bounds)
+
+    def sync_llbs(self, llbs):
+        """
+        routine for bringing the local lower bounds of the tracker in line
+        with 'llbs' by only adding and removing the changed ones
+
+        Parameters
+        ----------
+        llbs : LocalBoundSet or list
+            representing the current local lower bounds.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self._sync('llb', llbs)
+
+    def sync_lubs(self, lubs):
+        """
+        routine for bringing the local upper bounds of the tracker in line
+        with 'lubs' by only adding and removing the changed ones
+
+        Parameters
+        ----------
+        lubs : LocalBoundSet or list
+            representing the current local upper bounds.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self._sync('lub', lubs)
+
+    def sync(self, llbs, lubs):
+        """
+        routine for bringing the tracker in line with the given bounds
+
+        Parameters
+        ----------
+        llbs : LocalBoundSet or list
+            representing the current local lower bounds.
+        lubs : LocalBoundSet or list
+            representing the current local upper bounds.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self._sync('llb', llbs)
+        self._sync('lub', lubs)
+
+    def width(self):
+        """
+        routine for returning the current width together with the box
+        attaining it
+
+        Returns
+        -------
+        width : float
+            representing the maximal width of all boxes, -inf if there is no
+            box.
+        worst_llb : array
+            representing the local lower bound of the widest box.
+        worst_lub : array
+            representing the local upper bound of the widest box.
+
+        """
+
+        llbs, lubs = self._bounds['llb'], self._bounds['lub']
+
+        # drop stale boxes from the top
+        while len(self._heap) > 0 and (self._heap[0][1] >> 32 not in llbs
+                                       or self._heap[0][1] & 0xFFFFFFFF not in lubs):
+            heapq.heappop(self._heap)
+            self._stale = max(self._stale - 1, 0)
+
+        if len(self._heap) == 0:
+            # as 'compute_width' return the first pair if there is no box
+            if len(llbs) == 0 or len(lubs) == 0:
+                return -np.inf, None, None
+            return -np.inf, llbs[min(llbs)].copy(), lubs[min(lubs)].copy()
+
+        s, pair = self._heap[0]
+
+        return -s, llbs[pair >> 32].copy(), lubs[pair & 0xFFFFFFFF].copy()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Nov  8 10:14:26 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+
+import contextlib
+import csv
+import io
+import numpy as np
+import sys
+import time
+
+sys.path.append('../MOMIRROA_methods')
+
+from MOMIRROA import *
+
+
+"""
+benchmark of the OBBT modes 'MILP', 'LP' and 'mixed' on the configuration
+AD-BT of the paper, i.e., adaptive refinements and bound tightening after
+every third upper bound update, with tol=0.1, delta=0.95*tol, constraint
+tolerance 1e-4 and NLPs solved to optimality. The instances are the problem
+(P3) with k=2,4 and l=2 from
+Eichfelder, G., Stein, O., and Warnow, L. A Solver For Multiobjective
+Mixed-Integer Convex and Nonconvex Optimization. 2023
+the number of OBBT MILPs, the time spent for bound tightening and the width
+are compared with the AD-BT numbers of
+'../Numerical_Results_Paper_Jul25/results.csv', which were computed with
+Gurobi, whereas the relaxations are solved with SCIP here
+
+"""
+
+class structure():
+    pass
+
+
+def build_TI20(k, l):
+    # problem (P3) with k continuous and l integer variables
+    def build_model(m):
+
+        model = ConcreteModel()
+
+        # define variables, named as in the main files
+        for i in range(1,k+l+1):
+            model.add_component('x'+str(i), Var(within=Reals if i <= k else Integers,
+                                                bounds=(0,1) if i <= k else (-3,3)))
+        x = [model.component('x'+str(i)) for i in range(1,k+1)]
+        z = [model.component('x'+str(i)) for i in range(k+1,k+l+1)]
+
+        # define constraints
+        model.cons0 = Constraint(expr = -sum(v**2 for v in x) + 1 <= 0)
+        model.cons1 = Constraint(expr = sum(v**2 for v in z) - 9 <= 0)
+
+        # define objectives
+        model.objective0 = Objective(expr = sum(x[:k//2]) + sum(z[:l//2]))
+        model.objective1 = Objective(expr = sum(x[k//2:]) + sum(z[l//2:]))
+
+        for o in model.component_objects(Objective):
+            if not 'objective'+str(m) in o.name:
+                o.deactivate()
+
+        return model
+
+    return build_model
+
+
+def paper_results(name):
+    # AD-BT row of the configuration above
+    with open('../Numerical_Results_Paper_Jul25/results.csv') as f:
+        for row in csv.DictReader(f):
+            if row['problem_name'] == name and row['MOMIRROA_config'] == 'AD-BT' \
+                    and float(row['tol']) == 0.1 and float(row['delta_factor']) == 0.95 \
+                    and float(row['cons_tol']) == 1e-4 and row['NLP_feasibility'] == 'False':
+                return [float(row[key]) for key in ['# of OBBT MILPs',
+                                                    'time spent for bound tightening',
+                                                    'width',
+                                                    'total_time']]
+
+    return [np.nan] * 4
+
+
+def run(build_model, OBBT_mode):
+    parameter = structure()
+    parameter.m = 2
+    parameter.tol = 0.1
+    parameter.maxiter = 20000
+    parameter.timeout = 3600
+    parameter.factor_delta = 0.95 * parameter.tol
+
+    options = structure()
+    options.solve_direct = False
+    options.gap_tolerance = 1e-4
+    options.show_plots = False
+    options.nlp_feasibility_only = False
+    options.constraint_tolerance = 1e-4
+    options.adaptive_refinement = True
+    options.bound_tightening = 3
+    options.soft_utopian_check = True
+    options.milp_solver = 'scip'
+    options.OBBT_mode = OBBT_mode
+
+    start_time = time.time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        encl_dict, it = MOMIRROA(build_model, parameter, options)
+    total_time = time.time() - start_time
+
+    analysis = [encl_dict['analysis'][str(i)] for i in range(it)]
+
+    return [sum(a['# of OBBT MILPs'] for a in analysis),
+            sum(a.get('OBBT LP solves', 0) for a in analysis),
+            sum(a.get('OBBT filtered bounds', 0) for a in analysis),
+            sum(a['time bound tightening'] for a in analysis),
+            encl_dict['width'],
+            total_time]
+
+
+modes = ['MILP', 'LP', 'mixed']
+
+print('mode'.rjust(10), 'OBBT MILPs'.rjust(12), 'OBBT LPs'.rjust(10), 'filtered'.rjust(10),
+      'BT time [s]'.rjust(12), 'width'.rjust(8), 'total [s]'.rjust(10))
+
+for k, l in [(2, 2), (4, 2)]:
+    name = 'TI20_k'+str(k)+'_l'+str(l)
+    print('\nproblem:', name)
+
+    OBBT_MILPs, BT_time, width, total_time = paper_results(name)
+    print('results.csv'.rjust(10), ('%d' % OBBT_MILPs).rjust(12), '-'.rjust(10), '-'.rjust(10),
+          ('%.2f' % BT_time).rjust(12), ('%.4f' % width).rjust(8), ('%.1f' % total_time).rjust(10))
+
+    for OBBT_mode in modes:
+        OBBT_MILPs, OBBT_LPs, filtered, BT_time, width, total_time = run(build_TI20(k, l), OBBT_mode)
+        print(OBBT_mode.rjust(10), ('%d' % OBBT_MILPs).rjust(12), ('%d' % OBBT_LPs).rjust(10),
+              ('%d' % filtered).rjust(10), ('%.2f' % BT_time).rjust(12), ('%.4f' % width).rjust(8),
+              ('%.1f' % total_time).rjust(10))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Nov  9 09:21:47 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr.numeric_expr import MaxExpression, MinExpression
+
+import numpy as np
+import sys
+import time
+
+sys.path.append('../MOMIRROA_methods')
+
+from compiled_expressions import *
+
+
+"""
+synthetic benchmark of the compiled numpy functions
+
+the functions are evaluated at random points by the compiled functions and
+one point after another by pyomo, the evaluation times and the maximal
+deviation of the values are reported. The functions include maxima and
+minima with constant arguments, which are broadcast against the points.
+Finally, functions are evaluated outside their domain, where the compiled
+functions raise the same errors as pyomo
+
+"""
+
+def build_model(n):
+
+    model = ConcreteModel()
+
+    # define variables
+    model.x = Var(range(n), within=Reals, bounds=(-1,1))
+
+    # define functions
+    model.quadratic = Objective(expr = sum((i+1) * model.x[i]**2 for i in range(n))
+                                + sum(model.x[i] * model.x[i+1] for i in range(n-1)))
+    model.transcendental = Objective(expr = sum(exp(model.x[i]) * sin(model.x[i]) for i in range(n)))
+    model.max_constant = Objective(expr = MaxExpression((model.x[0], 0.0))
+                                   + MinExpression((0.5, model.x[1], 2 * model.x[0])))
+
+    return model
+
+
+def pyomo_evaluation(component, vars, points):
+    # reference values by pyomo
+    values = np.empty(len(points))
+    for i in range(len(points)):
+        for j, v in enumerate(vars):
+            v.fix(float(points[i, j]))
+        values[i] = value(component)
+    for v in vars:
+        v.unfix()
+
+    return values
+
+
+rng = np.random.default_rng(0)
+
+print('function'.rjust(16), 'points'.rjust(8), 'pyomo [s]'.rjust(12), 'compiled [s]'.rjust(14),
+      'max. deviation'.rjust(16))
+
+for n in [2, 8]:
+    model = build_model(n)
+    vars = [model.x[i] for i in range(n)]
+
+    for component in model.component_objects(Objective):
+        for number_of_points in [2**n, 1000]:
+            points = rng.uniform(-1, 1, (number_of_points, n))
+
+            start_time = time.time()
+            reference = pyomo_evaluation(component, vars, points)
+            pyomo_time = time.time() - start_time
+
+            start_time = time.time()
+            values = expression_compiler.evaluate(component, vars, points)
+            compiled_time = time.time() - start_time
+
+            print(component.name.rjust(16), str(number_of_points).rjust(8),
+                  ('%.4f' % pyomo_time).rjust(12), ('%.4f' % compiled_time).rjust(14),
+                  ('%.1e' % np.max(np.abs(values - reference))).rjust(16))
+
+# points outside the domain of a function raise the same errors as in pyomo
+model = ConcreteModel()
+model.x = Var(within=Reals, bounds=(-1,1))
+model.logarithm = Objective(expr = log(model.x))
+model.reciprocal = Objective(expr = 1 / model.x)
+
+print('\n' + 'function'.rjust(16), 'point'.rjust(8), 'pyomo'.rjust(20), 'compiled'.rjust(20))
+for component, point in [(model.logarithm, -0.5), (model.reciprocal, 0.0)]:
+    errors = []
+    for evaluation in [pyomo_evaluation, expression_compiler.evaluate]:
+        try:
+            evaluation(component, [model.x], np.array([[point]]))
+            errors.append('no error')
+        except Exception as error:
+            errors.append(type(error).__name__)
+
+    print(component.name.rjust(16), str(point).rjust(8), errors[0].rjust(20), errors[1].rjust(20))
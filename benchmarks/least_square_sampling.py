@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 29 11:20:34 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+from pyomo.core.expr import identify_variables
+
+import numpy as np
+import sys
+import time
+
+sys.path.append('../MOMIRROA_methods')
+
+from compute_least_square_weight import *
+from error_bound_tiers import *
+
+
+"""
+synthetic benchmark of the sampling strategies of the least square weights
+
+for separable and bilinear functions of n variables, among them the concave
+constraint of the problem instances (P3) from
+Eichfelder, G., Stein, O., and Warnow, L. A Solver For Multiobjective
+Mixed-Integer Convex and Nonconvex Optimization. 2023
+the weight is fitted on the unit box by every strategy. The fitting time and
+the sum of the exact over- and underestimation errors of the fitted affine
+function, i.e., the vertical width of the resulting relaxation, are
+reported, the errors are computed by the closed forms and the interval branch and
+bound of 'error_bound_tiers' (n.a. if these are not tight enough)
+
+"""
+
+def build_function(name, n):
+    model = ConcreteModel()
+    model.x = Var(range(n), bounds=(0,1))
+
+    if name == 'concave':
+        expr = -sum(model.x[i]**2 for i in range(n)) + 1
+    elif name == 'exp':
+        expr = sum(exp((i % 3 + 1) * model.x[i]) for i in range(n))
+    elif name == 'log':
+        expr = sum(log(1 + (i % 3 + 1) * model.x[i]) for i in range(n))
+    else:
+        expr = sum(model.x[i] * model.x[(i + 1) % n] for i in range(n))
+
+    model.cons = Constraint(expr = expr <= 0)
+
+    return model, list(identify_variables(model.cons.body))
+
+
+error_bound_tiers.configure(True)
+
+strategies = ['corners', 'random', 'orthogonal', 'halton']
+repetitions = 20
+
+for name in ['concave', 'exp', 'log', 'bilinear']:
+    print('\nfunction:', name)
+    print('n'.rjust(3), ''.join(s.rjust(24) for s in strategies))
+    print('', ''.join('time [ms] / width'.rjust(24) for s in strategies))
+
+    for n in [4, 8, 12, 16]:
+        model, vars = build_function(name, n)
+        cons = model.cons
+        box = {v.name: (0.0, 1.0) for v in vars}
+
+        row = str(n).rjust(3)
+        for strategy in strategies:
+            least_square_sampling.configure(strategy)
+
+            start_time = time.time()
+            for r in range(repetitions):
+                weight = compute_least_square_weight(cons, vars, box)
+            fit_time = (time.time() - start_time) / repetitions
+
+            info = {**box, 'weight': weight}
+            errors = [error_bound_tiers.bound(cons, vars, info, sign) for sign in [1, -1]]
+            if None in errors:
+                row += ('%.3f / n.a.' % (1000 * fit_time)).rjust(24)
+            else:
+                row += ('%.3f / %.4f' % (1000 * fit_time, sum(errors))).rjust(24)
+
+        print(row)
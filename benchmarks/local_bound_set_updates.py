@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 11:02:37 2026
+
+@author: moritz
+"""
+
+import copy as cp
+import numpy as np
+import sys
+import time
+
+sys.path.append('../MOMIRROA_methods')
+
+from initialize_local_bound_sets import *
+from local_bound_set import *
+
+
+"""
+synthetic throughput benchmark of the update of the local upper bounds with
+m=3 objectives
+
+the update points are sampled on a nondominated front, such that every point
+splits the search region and the number of local upper bounds grows up to
+about 10^4. The array based local bound sets are compared to the former
+layout of lists of arrays with defining points stored in dicts keyed by the
+string of the local upper bound
+
+"""
+
+def legacy_update_lubs(lubs, defpois, z):
+    # former routine based on str-keyed dicts of defining points
+    z = np.asarray(z)
+    n = z.size
+
+    defpois_old = cp.deepcopy(defpois)
+
+    lub_arr = np.stack(lubs, axis=0)
+    A_mask = np.all(z[None, :] < lub_arr, axis=1)
+
+    eq_mask = (lub_arr == z[None, :])
+    less_mask = (z[None, :] < lub_arr)
+    for j in range(n):
+        others_lt = less_mask[:, [k for k in range(n) if k!=j]].all(axis=1)
+        for i in np.nonzero(eq_mask[:, j] & others_lt)[0]:
+            defpois[str(lubs[i])][j].append(z.copy())
+
+    P = []
+    for i in np.nonzero(A_mask)[0]:
+        lub = lubs[i]
+        old_defs = defpois_old[str(lub)]
+        for j in range(n):
+            zmax = max(min(p[j] for p in old_defs[k]) for k in range(n) if k!=j)
+            if zmax < z[j]:
+                uj = lub.copy()
+                uj[j] = z[j]
+                P.append(uj)
+
+                new_defs = {j: [z.copy()]}
+                for k in range(n):
+                    if k == j:
+                        continue
+                    new_defs[k] = [p.copy() for p in old_defs[k] if p[j] < z[j]]
+
+                defpois[str(uj)] = cp.deepcopy(new_defs)
+
+    new_lubs = [u.copy() for u in P] + [row.copy() for row in lub_arr[~A_mask]]
+    new_defpois = {str(lub): cp.deepcopy(defpois[str(lub)]) for lub in new_lubs}
+
+    return new_lubs, new_defpois
+
+
+def front_points(number_of_points, m, seed=0):
+    # points on the unit sphere within the negative orthant are nondominated
+    rng = np.random.default_rng(seed)
+    d = np.abs(rng.standard_normal((number_of_points, m)))
+
+    return np.round(-d / np.linalg.norm(d, axis=1)[:, None], 6)
+
+
+m = 3
+number_of_points = 5000
+legacy_points = 300
+checkpoints = [100, 300, 1000, 2000, 5000]
+
+points = front_points(number_of_points, m)
+encl_dict = {'zl': -np.ones(m), 'zu': np.zeros(m)}
+
+# array based local bound sets
+_, lubs = init_local_bound_sets(encl_dict)
+start_time = time.time()
+last_time, last_point = start_time, 0
+print('\nLocalBoundSet with m='+str(m))
+for p, z in enumerate(points):
+    lubs.update(z)
+    if p+1 in checkpoints:
+        now = time.time()
+        print('points:', p+1, '| lubs:', len(lubs),
+              '| time per update [ms]:', round(1e3*(now - last_time)/(p+1 - last_point), 3))
+        last_time, last_point = now, p+1
+print('total time [s]:', round(time.time() - start_time, 3))
+
+# all points as one batch
+_, batch_lubs = init_local_bound_sets(encl_dict)
+start_time = time.time()
+batch_lubs.update_batch(points)
+print('\nLocalBoundSet batch update with m='+str(m))
+print('points:', number_of_points, '| lubs:', len(batch_lubs),
+      '| total time [s]:', round(time.time() - start_time, 3))
+print('identical to sequential updates:',
+      np.array_equal(batch_lubs.bounds, lubs.bounds)
+      and np.array_equal(batch_lubs.ids, lubs.ids))
+
+# former layout, only for the first points since each update copies all
+# defining points
+legacy_lubs = [cp.deepcopy(encl_dict['zu'])]
+legacy_defpois = {str(encl_dict['zu']): {}}
+for i in range(m):
+    d = cp.deepcopy(encl_dict['zl'])
+    d[i] = encl_dict['zu'][i]
+    legacy_defpois[str(encl_dict['zu'])][i] = [d]
+
+start_time = time.time()
+last_time, last_point = start_time, 0
+print('\nstr-keyed dicts with m='+str(m))
+for p, z in enumerate(points[:legacy_points]):
+    legacy_lubs, legacy_defpois = legacy_update_lubs(legacy_lubs, legacy_defpois, z)
+    if p+1 in checkpoints:
+        now = time.time()
+        print('points:', p+1, '| lubs:', len(legacy_lubs),
+              '| time per update [ms]:', round(1e3*(now - last_time)/(p+1 - last_point), 3))
+        last_time, last_point = now, p+1
+print('total time [s]:', round(time.time() - start_time, 3))
+
+# both layouts yield the same local upper bounds
+_, check = init_local_bound_sets(encl_dict)
+for z in points[:legacy_points]:
+    check.update(z)
+print('\nidentical local upper bounds:',
+      sorted(map(tuple, check.bounds)) == sorted(map(tuple, legacy_lubs)))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Nov  2 14:06:51 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+
+import sys
+import time
+
+sys.path.append('../MOMIRROA_methods')
+
+from initialize_relaxation_info import *
+from relax_model import *
+from relax_model_maximization import *
+from uniform_refinement import *
+
+
+"""
+synthetic benchmark of setting up the piecewise linear relaxations
+
+the partitions of all nonlinear functions are refined uniformly and the
+relaxations for minimization and maximization of every objective are set up.
+The least square weights and estimation errors of the boxes are computed
+once beforehand, such that only setting up the relaxations is measured. Since
+all components are referenced directly, the time per box should stay
+constant as the number of boxes grows. The instance is the problem (P3) with
+k=4 and l=2 from
+Eichfelder, G., Stein, O., and Warnow, L. A Solver For Multiobjective
+Mixed-Integer Convex and Nonconvex Optimization. 2023
+with nonlinear constraints and an additional nonlinear objective
+
+"""
+
+class structure():
+    pass
+
+
+def build_model(m):
+
+    model = ConcreteModel()
+
+    # define variables
+    model.x = Var(range(1,5), within=Reals, bounds=(0,1))
+    model.z = Var(range(1,3), within=Integers, bounds=(-3,3))
+
+    # define constraints
+    model.cons0 = Constraint(expr = -sum(model.x[i]**2 for i in range(1,5)) + 1 <= 0)
+    model.cons1 = Constraint(expr = sum(model.z[i]**2 for i in range(1,3)) - 9 <= 0)
+
+    # define objectives
+    model.objective0 = Objective(expr = model.x[1] * model.x[2] + model.z[1])
+    model.objective1 = Objective(expr = model.x[3] + model.x[4] + model.z[2])
+
+    for o in model.component_objects(Objective):
+        if not 'objective'+str(m) in o.name:
+            o.deactivate()
+
+    return model
+
+
+timelimit = 300
+
+info = initialize_relaxation_info(build_model(0))
+rel_errors = {k: 1 for k in info.keys() if k not in ['bounds', 'BT counter']}
+rel_errors['max_error'] = 1
+
+print('boxes'.rjust(6), 'build min [s]'.rjust(14), 'build max [s]'.rjust(14), 'per box [ms]'.rjust(13))
+
+for refinements in range(1, 8):
+    info = uniform_refinement_procedure(info, rel_errors, structure())
+
+    # compute the box information once
+    for m in range(2):
+        model, info, box_counter = relax_model(build_model(m), build_model, info, timelimit)
+        model, info, box_counter = relax_model_maximization(build_model(m), build_model, info, timelimit)
+
+    times = []
+    for relax in [relax_model, relax_model_maximization]:
+        start_time = time.time()
+        for m in range(2):
+            model, info, box_counter = relax(build_model(m), build_model, info, timelimit)
+        times.append(time.time() - start_time)
+
+    print(str(box_counter).rjust(6),
+          ('%.3f' % times[0]).rjust(14),
+          ('%.3f' % times[1]).rjust(14),
+          ('%.3f' % (1000 * sum(times) / (4 * box_counter))).rjust(13))
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 30 15:42:08 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+
+import numpy as np
+import sys
+import time
+
+sys.path.append('../MOMIRROA_methods')
+
+from error_bound_tiers import *
+from initialize_relaxation_info import *
+from relax_model import *
+from relax_model_linear import *
+from uniform_refinement import *
+
+
+"""
+synthetic benchmark of the formulations of the piecewise linear relaxations
+
+the partitions of all nonlinear functions are refined uniformly, then the
+relaxation of every objective is set up and solved with SCIP by the
+quadratic 'product' formulation and the MILP formulations 'bigm' and 'hull'.
+The least square weights and estimation errors of the boxes are computed
+once beforehand, such that only setting up and solving the relaxations is
+measured. The instances are the problem (P3) with k=4 and l=2 from
+Eichfelder, G., Stein, O., and Warnow, L. A Solver For Multiobjective
+Mixed-Integer Convex and Nonconvex Optimization. 2023
+with nonlinear constraints and a problem with a sine and a bilinear
+objective
+
+"""
+
+class structure():
+    pass
+
+
+def build_TI20_k4_l2(m):
+
+    model = ConcreteModel()
+
+    # define variables
+    model.x = Var(range(1,5), within=Reals, bounds=(0,1))
+    model.z = Var(range(1,3), within=Integers, bounds=(-3,3))
+
+    # define constraints
+    model.cons0 = Constraint(expr = -sum(model.x[i]**2 for i in range(1,5)) + 1 <= 0)
+    model.cons1 = Constraint(expr = sum(model.z[i]**2 for i in range(1,3)) - 9 <= 0)
+
+    # define objectives
+    model.objective0 = Objective(expr = model.x[1] + model.x[2] + model.z[1])
+    model.objective1 = Objective(expr = model.x[3] + model.x[4] + model.z[2])
+
+    for o in model.component_objects(Objective):
+        if not 'objective'+str(m) in o.name:
+            o.deactivate()
+
+    return model
+
+
+def build_sine(m):
+
+    model = ConcreteModel()
+
+    # define variables
+    model.x = Var(range(1,3), within=Reals, bounds=(0,6))
+
+    # define constraints
+    model.cons0 = Constraint(expr = model.x[1]**2 + model.x[2]**2 - 20 <= 0)
+
+    # define objectives
+    model.objective0 = Objective(expr = sin(model.x[1]) - model.x[1] + model.x[2]**2)
+    model.objective1 = Objective(expr = model.x[1] * model.x[2])
+
+    for o in model.component_objects(Objective):
+        if not 'objective'+str(m) in o.name:
+            o.deactivate()
+
+    return model
+
+
+def refined_info(build_model, refinements):
+    # bisect every box of every partition 'refinements' times
+    info = initialize_relaxation_info(build_model(0))
+    rel_errors = {k: 1 for k in info.keys() if k not in ['bounds', 'BT counter']}
+    rel_errors['max_error'] = 1
+    for r in range(refinements):
+        info = uniform_refinement_procedure(info, rel_errors, structure())
+
+    return info
+
+
+def solve_relaxation(build_model, m, info, timelimit):
+    start_time = time.time()
+    model, info, box_counter = relax_model(build_model(m), build_model, info, timelimit)
+    build_time = time.time() - start_time
+
+    opt = SolverFactory('scip')
+    opt.options['limits/time'] = timelimit
+
+    start_time = time.time()
+    results = opt.solve(model, tee=False)
+    solve_time = time.time() - start_time
+
+    if results.solver.termination_condition != TerminationCondition.optimal:
+        return build_time, solve_time, np.nan
+
+    value_ = [value(o) for o in model.component_objects(Objective) if o.active][0]
+
+    return build_time, solve_time, value_
+
+
+error_bound_tiers.configure(True)
+
+timelimit = 300
+formulations = ['product', 'bigm', 'hull']
+
+for name, build_model in [('TI20 k=4 l=2', build_TI20_k4_l2), ('sine', build_sine)]:
+    print('\nproblem:', name)
+    print('boxes'.rjust(6), ''.join(f.rjust(20) for f in formulations), 'max. deviation'.rjust(16))
+    print('', ''.join('build / solve [s]'.rjust(20) for f in formulations))
+
+    for refinements in [2, 4, 6]:
+        info = refined_info(build_model, refinements)
+
+        # compute the box information once
+        relaxation_formulation.configure('product')
+        for m in range(2):
+            model, info, box_counter = relax_model(build_model(m), build_model, info, timelimit)
+
+        row = str(box_counter).rjust(6)
+        values = []
+        for formulation in formulations:
+            relaxation_formulation.configure(formulation)
+            times = np.zeros(2)
+            for m in range(2):
+                build_time, solve_time, value_ = solve_relaxation(build_model, m, info, timelimit)
+                times += [build_time, solve_time]
+                values.append(value_)
+            row += ('%.3f / %.3f' % tuple(times)).rjust(20)
+
+        # the optimal values of the formulations coincide
+        values = np.reshape(values, (len(formulations), 2))
+        row += ('%.1e' % np.max(np.abs(values - values[0]))).rjust(16)
+
+        print(row)
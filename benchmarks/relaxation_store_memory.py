@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:40:03 2026
+
+@author: moritz
+"""
+
+from pyomo.environ import *
+
+import copy as cp
+import numpy as np
+import sys
+import time
+import tracemalloc
+
+sys.path.append('../MOMIRROA_methods')
+
+from adaptive_refinement import *
+from initialize_relaxation_info import *
+from relaxation_store import *
+
+
+"""
+synthetic memory benchmark of the relaxation information assigned to the
+local upper bounds on the problem instances (P3) with k=8 and l=2,4,6,8 from
+Eichfelder, G., Stein, O., and Warnow, L. A Solver For Multiobjective
+Mixed-Integer Convex and Nonconvex Optimization. 2023
+
+every new local upper bound inherits the relaxation information of a random
+existing one and adaptively refines it a few times, as happens along
+divergent search zones. The copy-on-write box partitions are compared to the
+former layout of plain nested dicts, where every local upper bound holds a
+deep copy
+
+"""
+
+class structure():
+    pass
+
+
+def build_TI20_k8(l):
+
+    def build_model(m):
+
+        model = ConcreteModel()
+
+        # define variables
+        model.x = Var(range(1,9), within=Reals, bounds=(0,1))
+        model.z = Var(range(1,l+1), within=Integers, bounds=(-3,3))
+
+        # define constraints
+        model.cons0 = Constraint(expr = -sum(model.x[i]**2 for i in range(1,9)) + 1 <= 0)
+        model.cons1 = Constraint(expr = sum(model.z[i]**2 for i in range(1,l+1)) - 9 <= 0)
+
+        # define objectives
+        model.objective0 = Objective(expr = sum(model.x[i] for i in range(1,5))\
+                                          + sum(model.z[i] for i in range(1,l//2+1)))
+        model.objective1 = Objective(expr = sum(model.x[i] for i in range(5,9))\
+                                          + sum(model.z[i] for i in range(l//2+1,l+1)))
+
+        for o in model.component_objects(Objective):
+            if not 'objective'+str(m) in o.name:
+                o.deactivate()
+
+        return model
+
+    return build_model
+
+
+def to_plain(info):
+    # former layout: nested dicts with lists as box bounds
+    plain = {}
+    for k in info.keys():
+        if isinstance(info[k], BoxPartition):
+            plain[k] = {b: {key: (list(val) if type(val) == tuple else val)
+                            for key, val in box.items()}
+                        for b, box in info[k].items()}
+        else:
+            plain[k] = cp.deepcopy(info[k])
+
+    return plain
+
+
+def simulate_lubs(build_model, number_of_lubs, refinements, seed=0):
+    # let every new lub inherit and refine the information of an existing one
+    rng = np.random.default_rng(seed)
+    options = structure()
+
+    infos = [initialize_relaxation_info(build_model(0))]
+    for j in range(number_of_lubs-1):
+        info = cp.deepcopy(infos[rng.integers(len(infos))])
+        for r in range(refinements):
+            # bisect the box of a random relaxed solution
+            c = ['cons0', 'cons1'][rng.integers(2)]
+            boxes = [b for b in info[c].keys()
+                     if max(info[c][b][v][1] - info[c][b][v][0] for v in info[c][b].keys()) > 0]
+            if len(boxes) == 0:
+                continue
+            b = boxes[rng.integers(len(boxes))]
+            solution = {v: rng.uniform(info[c][b][v][0], info[c][b][v][1])
+                        for v in info[c][b].keys()}
+            solution[c+'_box_binaries['+b+']'] = 1
+            info = adaptive_refinement_procedure(info,
+                                                 solution,
+                                                 {c: 1, 'max_error': 1},
+                                                 options)
+        infos.append(info)
+
+    return infos
+
+
+number_of_lubs = 300
+refinements = 2
+
+for l in [2, 4, 6, 8]:
+    build_model = build_TI20_k8(l)
+
+    # warm up such that one-time allocations are not measured
+    simulate_lubs(build_model, 2, refinements)
+
+    # copy-on-write partitions
+    tracemalloc.start()
+    infos = simulate_lubs(build_model, number_of_lubs, refinements)
+    store_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # former layout
+    tracemalloc.start()
+    plain_infos = [to_plain(info) for info in infos]
+    plain_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # copying the information of all lubs at the top of an iteration
+    start_time = time.time()
+    cp.deepcopy(infos)
+    store_copy_time = time.time() - start_time
+
+    start_time = time.time()
+    cp.deepcopy(plain_infos)
+    plain_copy_time = time.time() - start_time
+
+    box_references = sum(len(info[c]) for info in infos for c in ['cons0', 'cons1'])
+
+    print('\nTI20 k=8 l='+str(l)+' with', number_of_lubs, 'lubs')
+    print('box references:', box_references, '| distinct boxes:', len(box_store))
+    print('memory copy-on-write [MB]:', round(store_memory/1e6, 3),
+          '| plain dicts [MB]:', round(plain_memory/1e6, 3))
+    print('copy time copy-on-write [s]:', round(store_copy_time, 4),
+          '| plain dicts [s]:', round(plain_copy_time, 4))
+
+    del infos, plain_infos
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 14:05:51 2026
+
+@author: moritz
+"""
+
+import numpy as np
+import sys
+import time
+
+sys.path.append('../MOMIRROA_methods')
+
+from initialize_local_bound_sets import *
+from width_computation import *
+from width_tracker import *
+
+
+"""
+synthetic scaling benchmark of the width computation with m=3 objectives
+
+upper and lower images are sampled on two parallel nondominated fronts and
+passed to the local upper and lower bounds in iterations of 20 points. After
+every iteration the width is determined by the incremental tracker, at some
+checkpoints also by the full pairwise computation of 'compute_width'
+
+"""
+
+def front_points(number_of_points, m, seed):
+    # points on the unit sphere within the negative orthant are nondominated
+    rng = np.random.default_rng(seed)
+    d = np.abs(rng.standard_normal((number_of_points, m)))
+
+    return np.round(-d / np.linalg.norm(d, axis=1)[:, None], 6)
+
+
+m = 3
+number_of_points = 2000
+points_per_iteration = 20
+checkpoints = [240, 500, 1000, 2000]
+full_limit = 1000
+
+upper_points = front_points(number_of_points, m, 0)
+lower_points = front_points(number_of_points, m, 1) - 0.05
+
+encl_dict = {'zl': -2*np.ones(m), 'zu': np.zeros(m)}
+llbs, lubs = init_local_bound_sets(encl_dict)
+dir_vec = np.ones(m)
+
+width_tracker = WidthTracker(dir_vec)
+width_tracker.sync(llbs, lubs)
+
+tracker_time, iterations = 0, 0
+print('\nwidth computation with m='+str(m))
+for p in range(0, number_of_points, points_per_iteration):
+    lubs.update_batch(upper_points[p:p+points_per_iteration])
+    llbs.update_batch(lower_points[p:p+points_per_iteration])
+
+    start_time = time.time()
+    width_tracker.sync(llbs, lubs)
+    width, worst_llb, worst_lub = width_tracker.width()
+    tracker_time += time.time() - start_time
+    iterations += 1
+
+    if p + points_per_iteration in checkpoints:
+        print('\npoints:', p + points_per_iteration,
+              '| llbs:', len(llbs), '| lubs:', len(lubs))
+        print('tracker: time per iteration [s]:', round(tracker_time/iterations, 3),
+              '| width:', width)
+        tracker_time, iterations = 0, 0
+
+        if p + points_per_iteration <= full_limit:
+            start_time = time.time()
+            full_width, full_llb, full_lub = compute_width(llbs.bounds,
+                                                           lubs.bounds,
+                                                           dir_vec)
+            full_time = time.time() - start_time
+
+            # size of the pairwise difference tensor
+            tensor_size = len(llbs) * len(lubs) * m * 8
+
+            print('compute_width: time per iteration [s]:', round(full_time, 3),
+                  '| difference tensor [MB]:', round(tensor_size/1e6, 1),
+                  '| width:', full_width)
@@ -120,11 +120,13 @@ for k, l, tol, method in iter.product([6],
             f.write('\nAVG # of preimage set boxes: ' + str(sum(encl_dict['analysis'][str(i)]['preimageboxcounter'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it))))
             f.write('\n# of MILPs: ' + str(sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it))))
             f.write('\nAVG time for MILPs: ' + str(sum(encl_dict['analysis'][str(i)]['relaxed_solution_time'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it))))
+            f.write('\nAVG build time for MILPs: ' + str(sum(encl_dict['analysis'][str(i)]['relaxed_build_time'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['relaxedproblemcounter'] for i in np.arange(0,it))))
             f.write('\n# of NLPs: ' + str(sum(encl_dict['analysis'][str(i)]['problemcounter'] for i in np.arange(0,it))))
             f.write('\nAVG time for NLPs: ' + str(sum(encl_dict['analysis'][str(i)]['solution_time'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['problemcounter'] for i in np.arange(0,it))))
             f.write('\ntime spent for bound tightening: ' + str(sum(encl_dict['analysis'][str(i)]['time bound tightening'] for i in np.arange(0,it))))
 
             f.write('\n# of OBBT MILPs: ' + str(sum(encl_dict['analysis'][str(i)]['# of OBBT MILPs'] for i in np.arange(0,it))))
+            f.write('\nbox info cache hits/misses: ' + str(sum(encl_dict['analysis'][str(i)]['box info cache hits'] for i in np.arange(0,it))) + '/' + str(sum(encl_dict['analysis'][str(i)]['box info cache misses'] for i in np.arange(0,it))))
             f.write('\nshare of search zone improvement by feas-dec (total): ' + str(sum(encl_dict['analysis'][str(i)]['# of considered feasible'] for i in np.arange(0,it))/sum(encl_dict['analysis'][str(i)]['# of search zones'] for i in np.arange(0,it))))
 
             f.write('\n\niteration information:')